@@ -0,0 +1,49 @@
+"""Add playoff_odds_snapshots table
+
+Revision ID: f6g7h8i9j0k1
+Revises: caba8e073524
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6g7h8i9j0k1"
+down_revision: Union[str, None] = "caba8e073524"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "playoff_odds_snapshots",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("season_id", sa.Integer(), nullable=False),
+        sa.Column("week", sa.Integer(), nullable=False),
+        sa.Column("roster_id", sa.Integer(), nullable=False),
+        sa.Column("wins", sa.Integer(), server_default="0"),
+        sa.Column("losses", sa.Integer(), server_default="0"),
+        sa.Column("team_rating", sa.Float(), nullable=True),
+        sa.Column("make_playoffs_pct", sa.Float(), nullable=True),
+        sa.Column("win_division_pct", sa.Float(), nullable=True),
+        sa.Column("first_round_bye_pct", sa.Float(), nullable=True),
+        sa.Column("win_finals_pct", sa.Float(), nullable=True),
+        sa.Column("projected_wins", sa.Float(), nullable=True),
+        sa.Column("projected_losses", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["season_id"], ["seasons.id"]),
+        sa.ForeignKeyConstraint(["roster_id"], ["rosters.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("season_id", "week", "roster_id", name="uq_playoff_odds_snapshot"),
+    )
+    op.create_index(
+        "ix_playoff_odds_snapshots_season_id", "playoff_odds_snapshots", ["season_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("playoff_odds_snapshots")
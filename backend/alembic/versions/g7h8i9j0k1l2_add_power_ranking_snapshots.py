@@ -0,0 +1,51 @@
+"""Add power_ranking_snapshots table
+
+Revision ID: g7h8i9j0k1l2
+Revises: f6g7h8i9j0k1
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "g7h8i9j0k1l2"
+down_revision: Union[str, None] = "f6g7h8i9j0k1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "power_ranking_snapshots",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("season_id", sa.Integer(), nullable=False),
+        sa.Column("week", sa.Integer(), nullable=False),
+        sa.Column("roster_id", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("total_score", sa.Float(), nullable=True),
+        sa.Column("current_season_score", sa.Float(), nullable=True),
+        sa.Column("roster_value_score", sa.Float(), nullable=True),
+        sa.Column("historical_score", sa.Float(), nullable=True),
+        sa.Column("wins", sa.Integer(), server_default="0"),
+        sa.Column("losses", sa.Integer(), server_default="0"),
+        sa.Column("ties", sa.Integer(), server_default="0"),
+        sa.Column("points_for", sa.Float(), server_default="0"),
+        sa.Column("avg_roster_age", sa.Float(), nullable=True),
+        sa.Column("source_fingerprint", sa.String(length=40), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["season_id"], ["seasons.id"]),
+        sa.ForeignKeyConstraint(["roster_id"], ["rosters.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("season_id", "week", "roster_id", name="uq_power_ranking_snapshot"),
+    )
+    op.create_index(
+        "ix_power_ranking_snapshots_season_id", "power_ranking_snapshots", ["season_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("power_ranking_snapshots")
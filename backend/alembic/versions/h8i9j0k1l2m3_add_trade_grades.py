@@ -0,0 +1,59 @@
+"""Add trade_grades and trade_grade_owners tables
+
+Revision ID: h8i9j0k1l2m3
+Revises: g7h8i9j0k1l2
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "h8i9j0k1l2m3"
+down_revision: Union[str, None] = "g7h8i9j0k1l2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trade_grades",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("transaction_id", sa.String(length=50), nullable=False),
+        sa.Column("season_id", sa.Integer(), nullable=False),
+        sa.Column("season_year", sa.Integer(), nullable=False),
+        sa.Column("week", sa.Integer(), nullable=True),
+        sa.Column("trade_date", sa.BigInteger(), nullable=True),
+        sa.Column("lopsidedness", sa.Float(), nullable=False),
+        sa.Column("weeks_of_data", sa.Integer(), nullable=True),
+        sa.Column("grade", sa.JSON(), nullable=False),
+        sa.Column("player_ids", sa.JSON(), nullable=True),
+        sa.Column("pick_slots", sa.JSON(), nullable=True),
+        sa.Column("dependency_fingerprint", sa.String(length=40), nullable=True),
+        sa.Column("graded_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["transaction_id"], ["transactions.id"]),
+        sa.ForeignKeyConstraint(["season_id"], ["seasons.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("transaction_id"),
+    )
+    op.create_index("ix_trade_grades_season_year", "trade_grades", ["season_year"])
+
+    op.create_table(
+        "trade_grade_owners",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("trade_grade_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(["trade_grade_id"], ["trade_grades.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_trade_grade_owners_trade_grade_id", "trade_grade_owners", ["trade_grade_id"])
+    op.create_index("ix_trade_grade_owners_user_id", "trade_grade_owners", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("trade_grade_owners")
+    op.drop_table("trade_grades")
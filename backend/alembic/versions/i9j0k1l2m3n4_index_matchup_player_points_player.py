@@ -0,0 +1,31 @@
+"""Index matchup_player_points by player and roster
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "i9j0k1l2m3n4"
+down_revision: Union[str, None] = "h8i9j0k1l2m3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_matchup_player_points_player_roster",
+        "matchup_player_points",
+        ["player_id", "roster_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_matchup_player_points_player_roster", table_name="matchup_player_points"
+    )
@@ -0,0 +1,63 @@
+"""Add draft_grades and draft_grade_picks tables
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "j0k1l2m3n4o5"
+down_revision: Union[str, None] = "i9j0k1l2m3n4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "draft_grades",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("draft_id", sa.String(length=50), nullable=False),
+        sa.Column("season_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("type", sa.String(length=50), nullable=True),
+        sa.Column("rounds", sa.Integer(), nullable=True),
+        sa.Column("total_picks", sa.Integer(), server_default="0"),
+        sa.Column("weeks_of_data", sa.Integer(), server_default="0"),
+        sa.Column("points_through", sa.Integer(), server_default="0"),
+        sa.Column("graded_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["draft_id"], ["drafts.id"]),
+        sa.ForeignKeyConstraint(["season_id"], ["seasons.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("draft_id"),
+    )
+    op.create_index("ix_draft_grades_year", "draft_grades", ["year"])
+    op.create_index("ix_draft_grades_rounds", "draft_grades", ["rounds"])
+
+    op.create_table(
+        "draft_grade_picks",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("draft_grade_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.String(length=50), nullable=False),
+        sa.Column("pick_no", sa.Integer(), nullable=False),
+        sa.Column("round", sa.Integer(), nullable=False),
+        sa.Column("player_id", sa.String(length=50), nullable=False),
+        sa.Column("weighted_points", sa.Float(), server_default="0"),
+        sa.Column("starter_weeks", sa.Integer(), server_default="0"),
+        sa.Column("bench_weeks", sa.Integer(), server_default="0"),
+        sa.ForeignKeyConstraint(["draft_grade_id"], ["draft_grades.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_draft_grade_picks_draft_grade_id", "draft_grade_picks", ["draft_grade_id"])
+    op.create_index("ix_draft_grade_picks_user_id", "draft_grade_picks", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("draft_grade_picks")
+    op.drop_table("draft_grades")
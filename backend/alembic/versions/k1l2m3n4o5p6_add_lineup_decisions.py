@@ -0,0 +1,48 @@
+"""Add lineup_decisions table
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "k1l2m3n4o5p6"
+down_revision: Union[str, None] = "j0k1l2m3n4o5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lineup_decisions",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("matchup_id", sa.Integer(), nullable=False),
+        sa.Column("roster_id", sa.Integer(), nullable=False),
+        sa.Column("season_id", sa.Integer(), nullable=False),
+        sa.Column("week", sa.Integer(), nullable=False),
+        sa.Column("actual_points", sa.Float(), server_default="0"),
+        sa.Column("optimal_points", sa.Float(), server_default="0"),
+        sa.Column("opponent_points", sa.Float(), server_default="0"),
+        sa.Column("result", sa.String(length=1), nullable=True),
+        sa.Column("lost_to_lineup", sa.Boolean(), server_default=sa.false()),
+        sa.Column("actual_lineup", sa.JSON(), nullable=True),
+        sa.Column("optimal_lineup", sa.JSON(), nullable=True),
+        sa.Column("swaps", sa.JSON(), nullable=True),
+        sa.Column("player_points", sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(["matchup_id"], ["matchups.id"]),
+        sa.ForeignKeyConstraint(["roster_id"], ["rosters.id"]),
+        sa.ForeignKeyConstraint(["season_id"], ["seasons.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("matchup_id", "roster_id", name="uq_lineup_decision"),
+    )
+    op.create_index("ix_lineup_decisions_roster_id", "lineup_decisions", ["roster_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("lineup_decisions")
@@ -0,0 +1,67 @@
+"""Add owner_season_stats table
+
+Revision ID: l2m3n4o5p6q7
+Revises: k1l2m3n4o5p6
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "l2m3n4o5p6q7"
+down_revision: Union[str, None] = "k1l2m3n4o5p6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RECORD_COLUMNS = ["wins", "losses", "ties"]
+POINTS_COLUMNS = ["points_for", "points_against"]
+AWARD_COLUMNS = ["champion", "division_winner", "most_points", "consolation", "bench_points"]
+
+
+def upgrade() -> None:
+    columns = []
+    for category in ("regular", "playoff", "consolation"):
+        columns += [
+            sa.Column(f"{category}_{name}", sa.Integer(), server_default="0")
+            for name in RECORD_COLUMNS
+        ]
+        columns += [
+            sa.Column(f"{category}_{name}", sa.Float(), server_default="0")
+            for name in POINTS_COLUMNS
+        ]
+    columns.append(sa.Column("max_potential_points", sa.Float(), server_default="0"))
+    columns += [
+        sa.Column(f"median_{name}", sa.Integer(), server_default="0")
+        for name in RECORD_COLUMNS
+    ]
+    columns += [
+        sa.Column(f"{name}_awards", sa.Integer(), server_default="0")
+        for name in AWARD_COLUMNS
+    ]
+
+    op.create_table(
+        "owner_season_stats",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("roster_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.String(length=50), nullable=False),
+        sa.Column("season_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("team_name", sa.String(length=255), nullable=True),
+        sa.Column("division", sa.Integer(), nullable=True),
+        sa.Column("division_name", sa.String(length=100), nullable=True),
+        *columns,
+        sa.ForeignKeyConstraint(["roster_id"], ["rosters.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["season_id"], ["seasons.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("roster_id"),
+    )
+    op.create_index("ix_owner_season_stats_user_id", "owner_season_stats", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("owner_season_stats")
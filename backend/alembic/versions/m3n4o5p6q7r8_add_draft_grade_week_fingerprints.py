@@ -0,0 +1,26 @@
+"""Add week_fingerprints to draft_grades
+
+Revision ID: m3n4o5p6q7r8
+Revises: l2m3n4o5p6q7
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "m3n4o5p6q7r8"
+down_revision: Union[str, None] = "l2m3n4o5p6q7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("draft_grades", sa.Column("week_fingerprints", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("draft_grades", "week_fingerprints")
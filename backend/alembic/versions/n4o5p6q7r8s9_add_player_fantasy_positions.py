@@ -0,0 +1,26 @@
+"""Add fantasy_positions to players
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "n4o5p6q7r8s9"
+down_revision: Union[str, None] = "m3n4o5p6q7r8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("players", sa.Column("fantasy_positions", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("players", "fantasy_positions")
@@ -0,0 +1,177 @@
+"""Response cache for read-only API routes.
+
+League data only changes when a sync commits, so GET responses for the
+read routes are cached in-process keyed by (path, query params, data
+version).  Bumping the data version makes every older entry unreachable;
+they age out of the LRU, which is bounded by total body size.
+
+Every cached route also gets an ETag derived from the same key, so a
+client revalidating with If-None-Match gets a 304 without the route
+running at all.  The data version is a per-process counter that starts
+over on restart, so ETags also carry a random boot id; otherwise a tag
+issued before a restart could match different data after it.
+"""
+
+import hashlib
+import secrets
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from app.services.data_version import current_version
+
+# Route prefixes whose GET responses depend only on synced data
+CACHED_PREFIXES = (
+    "/api/standings",
+    "/api/owners",
+    "/api/league-history",
+    "/api/matchups",
+    "/api/player-records",
+    "/api/power-rankings",
+    "/api/playoffs",
+    "/api/trade-grades",
+    "/api/draft-grades",
+)
+
+# Distinguishes this process's data versions from those of earlier runs
+_BOOT_ID = secrets.token_hex(4)
+
+
+class CachedResponse:
+    """A buffered 200 response."""
+
+    __slots__ = ("headers", "body")
+
+    def __init__(self, headers: List[Tuple[bytes, bytes]], body: bytes):
+        self.headers = headers
+        self.body = body
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+
+class ResponseCache:
+    """LRU of responses bounded by total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Tuple, entry: CachedResponse) -> None:
+        if entry.size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old.size
+        self._entries[key] = entry
+        self.total_bytes += entry.size
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _request_key(scope: Dict) -> Tuple[str, str]:
+    """(path, query string with params sorted) for a request."""
+    query = scope.get("query_string", b"").decode("latin-1")
+    params = sorted(parse_qsl(query, keep_blank_values=True))
+    return scope["path"], urlencode(params)
+
+
+def _etag(key: Tuple[str, str], version: int) -> bytes:
+    digest = hashlib.sha1(f"{key[0]}?{key[1]}".encode()).hexdigest()[:16]
+    return f'"{_BOOT_ID}-v{version}-{digest}"'.encode()
+
+
+def _header(scope: Dict, name: bytes) -> Optional[bytes]:
+    for k, v in scope.get("headers", []):
+        if k == name:
+            return v
+    return None
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving cached GET responses and ETag 304s.
+
+    Register it inside CORSMiddleware so CORS headers are added per request
+    rather than stored in the cache.
+    """
+
+    def __init__(self, app, max_bytes: int = 32 * 1024 * 1024):
+        self.app = app
+        self.cache = ResponseCache(max_bytes)
+        self.enabled = max_bytes > 0
+
+    async def __call__(self, scope, receive, send):
+        if (
+            not self.enabled
+            or scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(CACHED_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        version = current_version()
+        key = _request_key(scope)
+        etag = _etag(key, version)
+
+        if_none_match = _header(scope, b"if-none-match")
+        if if_none_match and etag in [t.strip() for t in if_none_match.split(b",")]:
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [(b"etag", etag)],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        entry = self.cache.get((key, version))
+        if entry is not None:
+            await self._send(send, entry.headers, entry.body, etag, b"HIT")
+            return
+
+        start = {}
+        chunks = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    body = b"".join(chunks)
+                    headers = list(start.get("headers", []))
+                    if start.get("status") == 200:
+                        self.cache.put((key, version), CachedResponse(headers, body))
+                        await self._send(send, headers, body, etag, b"MISS")
+                    else:
+                        await send(start)
+                        await send({"type": "http.response.body", "body": body})
+            else:
+                await send(message)
+
+        await self.app(scope, receive, capture)
+
+    @staticmethod
+    async def _send(send, headers, body: bytes, etag: bytes, status: bytes):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": headers + [(b"etag", etag), (b"x-cache", status)],
+        })
+        await send({"type": "http.response.body", "body": body})
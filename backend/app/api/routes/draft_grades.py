@@ -38,13 +38,36 @@ async def get_draft_grades(
             detail='draft_type must be "startup" or "rookie"',
         )
 
-    grades = await service.grade_all_drafts(
+    grades = await service.get_draft_grades(
         draft_type=draft_type,
         owner_id=owner_id,
     )
     return {"total": len(grades), "drafts": grades}
 
 
+@router.get("/draft-grades/value-curve")
+async def get_draft_value_curve(
+    draft_type: Optional[str] = Query(
+        None,
+        description='Limit to one draft type: "startup" or "rookie"',
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the league-wide draft pick value curve.
+
+    Expected weighted points per week by overall pick number, fitted from
+    every completed league draft and smoothed, with per-round averages.
+    """
+    if draft_type and draft_type not in ("startup", "rookie"):
+        raise HTTPException(
+            status_code=400,
+            detail='draft_type must be "startup" or "rookie"',
+        )
+
+    service = DraftGradingService(db)
+    return {"curves": await service.get_value_curve(draft_type)}
+
+
 @router.get("/draft-grades/{draft_id}")
 async def get_draft_grade(
     draft_id: str,
@@ -52,7 +75,7 @@ async def get_draft_grade(
 ):
     """Get grade for a specific draft by ID."""
     service = DraftGradingService(db)
-    grade = await service.grade_single_draft(draft_id)
+    grade = await service.get_draft_grade(draft_id)
     if not grade:
         raise HTTPException(
             status_code=404,
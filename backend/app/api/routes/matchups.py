@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_, and_
-from statistics import median as calc_median
 from collections import defaultdict
 from app.database import get_db
 from app.models import User, Roster, Matchup, Season
+from app.services.weekly_scores import load_weekly_scores
 from typing import List, Dict, Any, Optional
 
 router = APIRouter()
@@ -62,31 +62,20 @@ async def get_head_to_head_matrix(
             matrix[home_user][away_user]["ties"] += 1
             matrix[away_user][home_user]["ties"] += 1
 
-    # 5. Build median records
-    week_scores: Dict[tuple, list] = defaultdict(list)
-    for m in matchups:
-        home_user = roster_to_user.get(m.home_roster_id)
-        away_user = roster_to_user.get(m.away_roster_id)
-        if home_user and home_user in active_user_ids:
-            week_scores[(m.season_id, m.week)].append((home_user, m.home_points or 0))
-        if away_user and away_user in active_user_ids:
-            week_scores[(m.season_id, m.week)].append((away_user, m.away_points or 0))
-
+    # 5. Build median records from the weekly score index, against the
+    #    median of active owners' scores only
+    active_roster_ids = frozenset(
+        rid for rid, user_id in roster_to_user.items() if user_id in active_user_ids
+    )
     median_records: Dict[str, Dict[str, int]] = defaultdict(
         lambda: {"wins": 0, "losses": 0, "ties": 0}
     )
-    for scores in week_scores.values():
-        if len(scores) < 2:
-            continue
-        all_points = [s[1] for s in scores]
-        week_median = calc_median(all_points)
-        for user_id, pts in scores:
-            if pts > week_median:
-                median_records[user_id]["wins"] += 1
-            elif pts < week_median:
-                median_records[user_id]["losses"] += 1
-            else:
-                median_records[user_id]["ties"] += 1
+    for season_scores in (await load_weekly_scores(db)).values():
+        records = season_scores.median_records(match_type, roster_ids=active_roster_ids)
+        for roster_id, record in records.items():
+            user_id = roster_to_user[roster_id]
+            for key, count in record.items():
+                median_records[user_id][key] += count
 
     # 6. Build response
     owners_list = [
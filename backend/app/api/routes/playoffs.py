@@ -1,16 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 
 from app.database import get_db
 from app.models import Season
-from app.services.playoff_odds import calculate_playoff_odds
+from app.schemas.playoffs import PlayoffScenarioRequest
+from app.services.data_version import bump_version
+from app.services.playoff_odds import calculate_playoff_odds, calculate_playoff_scenario
+from app.services.playoff_timeline import backfill_playoff_timeline, get_playoff_timeline
 
 router = APIRouter()
 
 
+SCORE_MODEL_QUERY = Query(
+    "normal",
+    pattern="^(normal|empirical)$",
+    description="Simulation score model: normal or empirical",
+)
+
+
 @router.get("/playoffs")
-async def get_current_playoff_odds(db: AsyncSession = Depends(get_db)):
+async def get_current_playoff_odds(
+    score_model: str = SCORE_MODEL_QUERY, db: AsyncSession = Depends(get_db)
+):
     """Get playoff odds for the current (most recent) season."""
     result = await db.execute(
         select(Season).order_by(desc(Season.year)).limit(1)
@@ -20,7 +32,7 @@ async def get_current_playoff_odds(db: AsyncSession = Depends(get_db)):
     if not season:
         raise HTTPException(status_code=404, detail="No season data found")
 
-    data = await calculate_playoff_odds(db, season.year)
+    data = await calculate_playoff_odds(db, season.year, score_model)
     if data is None:
         raise HTTPException(status_code=404, detail="No season data found")
 
@@ -29,11 +41,72 @@ async def get_current_playoff_odds(db: AsyncSession = Depends(get_db)):
 
 @router.get("/playoffs/{season_year}")
 async def get_historical_playoff_odds(
-    season_year: int, db: AsyncSession = Depends(get_db)
+    season_year: int,
+    score_model: str = SCORE_MODEL_QUERY,
+    db: AsyncSession = Depends(get_db),
 ):
     """Get playoff odds for a specific season."""
-    data = await calculate_playoff_odds(db, season_year)
+    data = await calculate_playoff_odds(db, season_year, score_model)
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
+
+    return data
+
+
+@router.post("/playoffs/{season_year}/scenarios")
+async def run_playoff_scenario(
+    season_year: int,
+    scenario: PlayoffScenarioRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-run playoff odds with locked matchup results and rating overrides.
+
+    Returns each team's baseline odds, scenario odds and the delta between them.
+    """
+    forced_results = {}
+    for forced in scenario.forced_results:
+        if forced.matchup_id in forced_results:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Matchup {forced.matchup_id} is locked more than once",
+            )
+        forced_results[forced.matchup_id] = forced.winner_roster_id
+
+    try:
+        data = await calculate_playoff_scenario(
+            db, season_year, forced_results, scenario.rating_overrides
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
+
+    return data
+
+
+@router.get("/playoffs/{season_year}/timeline")
+async def get_playoff_odds_timeline(
+    season_year: int, db: AsyncSession = Depends(get_db)
+):
+    """Get each team's playoff odds as they stood after every completed week."""
+    data = await get_playoff_timeline(db, season_year)
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
+
+    return data
+
+
+@router.post("/playoffs/{season_year}/timeline/backfill")
+async def backfill_playoff_odds_timeline(
+    season_year: int,
+    force: bool = Query(False, description="Recompute weeks that already have snapshots"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Simulate and persist playoff odds for weeks missing from the timeline."""
+    data = await backfill_playoff_timeline(db, season_year, force=force)
     if data is None:
         raise HTTPException(status_code=404, detail=f"Season {season_year} not found")
+    bump_version()
 
     return data
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
-from statistics import median as calc_median
 from collections import defaultdict
 from app.database import get_db
 from app.models import Season, Roster, User, League, Matchup
+from app.services.weekly_scores import load_weekly_scores
 from typing import List, Dict, Any
 
 router = APIRouter()
@@ -64,7 +64,8 @@ async def _get_season_standings(db: AsyncSession, year: int) -> Dict[str, Any]:
     rosters_with_users = result.all()
 
     # Calculate median records from regular season matchups
-    median_records = await _calculate_median_records(db, season.id)
+    scores = await load_weekly_scores(db, [season.id])
+    median_records = scores[season.id].median_records()
 
     # Calculate max potential points for regular season
     max_potential_stats = await _calculate_max_potential_stats(db, season.id)
@@ -107,45 +108,6 @@ async def _get_season_standings(db: AsyncSession, year: int) -> Dict[str, Any]:
     }
 
 
-async def _calculate_median_records(db: AsyncSession, season_id: int) -> Dict[int, Dict[str, int]]:
-    """Calculate each roster's record against the weekly median for regular season."""
-    result = await db.execute(
-        select(Matchup).where(
-            Matchup.season_id == season_id,
-            Matchup.match_type == "regular"
-        )
-    )
-    matchups = result.scalars().all()
-
-    if not matchups:
-        return {}
-
-    # Group scores by week
-    week_scores: Dict[int, list] = defaultdict(list)
-    for m in matchups:
-        week_scores[m.week].append((m.home_roster_id, m.home_points or 0))
-        week_scores[m.week].append((m.away_roster_id, m.away_points or 0))
-
-    # Calculate median record per roster
-    median_records: Dict[int, Dict[str, int]] = defaultdict(
-        lambda: {"wins": 0, "losses": 0, "ties": 0}
-    )
-    for scores in week_scores.values():
-        if len(scores) < 2:
-            continue
-        all_points = [s[1] for s in scores]
-        week_median = calc_median(all_points)
-        for roster_id, pts in scores:
-            if pts > week_median:
-                median_records[roster_id]["wins"] += 1
-            elif pts < week_median:
-                median_records[roster_id]["losses"] += 1
-            else:
-                median_records[roster_id]["ties"] += 1
-
-    return dict(median_records)
-
-
 async def _calculate_max_potential_stats(db: AsyncSession, season_id: int) -> Dict[int, Dict[str, float]]:
     """Calculate max potential points and points left on bench for regular season only."""
     result = await db.execute(
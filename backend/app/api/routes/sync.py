@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Header
+import json
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
+from app.services.max_potential import MaxPotentialService
 from app.services.sync_service import SyncService
 from app.config import get_settings
 
@@ -44,6 +48,38 @@ async def sync_all_history(db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"History sync failed: {str(e)}")
 
 
+@router.post("/sync/max-potential")
+async def recompute_max_potential(
+    season: Optional[int] = Query(None, description="Only recompute this season year"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Admin endpoint to recompute max potential points from stored data.
+
+    Re-runs the lineup optimizer for every matchup in every season (or one
+    season) without calling Sleeper, e.g. after the optimizer changes or
+    player positions are corrected.  Streams one JSON line per season as it
+    is committed, then a final line with the totals.
+    """
+    service = MaxPotentialService(db)
+    seasons = await service.load_seasons(season)
+    if season is not None and not seasons:
+        raise HTTPException(status_code=404, detail=f"Season {season} not found")
+
+    async def progress():
+        updated = 0
+        try:
+            async for summary in service.recompute_seasons(seasons):
+                updated += summary["updated"]
+                yield json.dumps(summary) + "\n"
+        except Exception as e:
+            await db.rollback()
+            yield json.dumps({"status": "error", "detail": f"Recompute failed: {str(e)}"}) + "\n"
+            return
+        yield json.dumps({"status": "success", "updated": updated, "seasons": len(seasons)}) + "\n"
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+
 @router.post("/cron/sync")
 async def cron_sync_league(
     authorization: str = Header(None),
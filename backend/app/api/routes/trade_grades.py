@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
 from app.database import get_db
+from app.schemas.trade_grades import TradeEvaluationRequest
 from app.services.trade_grading import TradeGradingService
 
 router = APIRouter()
@@ -17,16 +18,25 @@ async def get_trade_grades(
 ):
     """Grade all completed trades based on post-trade asset performance."""
     service = TradeGradingService(db)
-    trades = await service.grade_all_trades(season=season, owner_id=owner_id)
+    trades = await service.get_trade_grades(
+        season=season, owner_id=owner_id, sort=sort
+    )
+    return {"trades": trades}
 
-    if sort == "lopsided":
-        trades.sort(key=lambda t: t["lopsidedness"], reverse=True)
-    elif sort == "recent":
-        trades.sort(key=lambda t: t["date"] or 0, reverse=True)
-    elif sort == "even":
-        trades.sort(key=lambda t: t["lopsidedness"])
 
-    return {"trades": trades}
+@router.post("/trade-grades/evaluate")
+async def evaluate_trade(
+    proposal: TradeEvaluationRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """Project value shares and grades for a proposed trade."""
+    service = TradeGradingService(db)
+    try:
+        return await service.evaluate_trade(
+            [side.model_dump() for side in proposal.sides]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/trade-grades/{trade_id}")
@@ -26,6 +26,12 @@ class Settings(BaseSettings):
     # API Rate Limiting
     SLEEPER_RATE_LIMIT: int = 900  # Stay under 1000/min
 
+    # Playoff odds timeline backfill (0 = one worker process per CPU core)
+    PLAYOFF_TIMELINE_WORKERS: int = 0
+
+    # In-process API response cache size in bytes (0 disables it)
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
     # Security
     CRON_SECRET: str = "change-me-in-production"  # For securing scheduled sync endpoints
 
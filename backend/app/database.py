@@ -32,3 +32,20 @@ async def get_db() -> AsyncSession:
             yield session
         finally:
             await session.close()
+
+
+def supports_window_functions(db: AsyncSession) -> bool:
+    """Whether the connected database supports ROW_NUMBER() OVER (...).
+
+    SQLite gained window functions in 3.25, MySQL in 8.0 and MariaDB in
+    10.2.  Callers fall back to ordering in SQL and slicing in Python.
+    """
+    dialect = db.get_bind().dialect
+    version = dialect.server_version_info or ()
+    if dialect.name == "sqlite":
+        return version >= (3, 25)
+    if dialect.name in ("mysql", "mariadb"):
+        if getattr(dialect, "is_mariadb", False):
+            return version >= (10, 2)
+        return version >= (8, 0)
+    return True
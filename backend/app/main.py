@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import get_settings
+from app.api.response_cache import ResponseCacheMiddleware
 from app.api.routes import standings, players, owners, matchups, drafts, league_history, sync, player_records, rookie_records, taxi_squads, seasons, transactions, trade_grades, draft_grades, playoffs, power_rankings
 
 settings = get_settings()
@@ -11,6 +12,13 @@ app = FastAPI(
     description="Fantasy Football Dynasty League API integrating with Sleeper",
 )
 
+# Cache read-only responses per data version (registered first so CORS
+# wraps it and CORS headers are never cached)
+app.add_middleware(
+    ResponseCacheMiddleware,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -9,6 +9,12 @@ from app.models.transaction import Transaction
 from app.models.draft import Draft, DraftPick
 from app.models.season_award import SeasonAward
 from app.models.matchup_player_point import MatchupPlayerPoint
+from app.models.playoff_odds_snapshot import PlayoffOddsSnapshot
+from app.models.power_ranking_snapshot import PowerRankingSnapshot
+from app.models.trade_grade import TradeGrade, TradeGradeOwner
+from app.models.draft_grade import DraftGrade, DraftGradePick
+from app.models.lineup_decision import LineupDecision
+from app.models.owner_season_stats import OwnerSeasonStats
 
 __all__ = [
     "League",
@@ -22,4 +28,12 @@ __all__ = [
     "DraftPick",
     "SeasonAward",
     "MatchupPlayerPoint",
+    "PlayoffOddsSnapshot",
+    "PowerRankingSnapshot",
+    "TradeGrade",
+    "TradeGradeOwner",
+    "DraftGrade",
+    "DraftGradePick",
+    "LineupDecision",
+    "OwnerSeasonStats",
 ]
@@ -0,0 +1,50 @@
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, JSON
+from datetime import datetime
+from app.database import Base
+
+
+class DraftGrade(Base):
+    """Stored grade for a completed draft; per-pick values live in
+    DraftGradePick."""
+
+    __tablename__ = "draft_grades"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    draft_id = Column(String(50), ForeignKey("drafts.id"), nullable=False, unique=True)
+    season_id = Column(Integer, ForeignKey("seasons.id"), nullable=False)
+    year = Column(Integer, nullable=False, index=True)
+    type = Column(String(50))  # snake, linear, auction
+    rounds = Column(Integer, index=True)  # 20+ = startup, fewer = rookie
+    total_picks = Column(Integer, default=0)
+    weeks_of_data = Column(Integer, default=0)
+
+    # season_year * 100 + week of the latest points included in the picks
+    points_through = Column(Integer, default=0)
+    # "season*100+week" -> [player rows, points] of each week included, so
+    # re-synced weeks (final or corrected scores) are noticed
+    week_fingerprints = Column(JSON)
+
+    graded_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<DraftGrade {self.draft_id} ({self.year})>"
+
+
+class DraftGradePick(Base):
+    """Value a drafted player has produced for the owner who drafted them."""
+
+    __tablename__ = "draft_grade_picks"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    draft_grade_id = Column(Integer, ForeignKey("draft_grades.id"), nullable=False, index=True)
+    user_id = Column(String(50), ForeignKey("users.id"), nullable=False, index=True)
+    pick_no = Column(Integer, nullable=False)
+    round = Column(Integer, nullable=False)
+    player_id = Column(String(50), nullable=False)
+
+    weighted_points = Column(Float, default=0.0)
+    starter_weeks = Column(Integer, default=0)
+    bench_weeks = Column(Integer, default=0)
+
+    def __repr__(self):
+        return f"<DraftGradePick {self.draft_grade_id} #{self.pick_no}>"
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, Float, String, Boolean, ForeignKey, JSON, UniqueConstraint
+from app.database import Base
+
+
+class LineupDecision(Base):
+    """Start/sit analysis for one roster in one matchup, computed at sync.
+
+    Lineups are lists of player ids aligned with the league's starting
+    slots (roster_positions without BN/IR/TAXI); None marks an empty slot.
+    """
+
+    __tablename__ = "lineup_decisions"
+    __table_args__ = (
+        UniqueConstraint("matchup_id", "roster_id", name="uq_lineup_decision"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    matchup_id = Column(Integer, ForeignKey("matchups.id"), nullable=False)
+    roster_id = Column(Integer, ForeignKey("rosters.id"), nullable=False, index=True)  # DB PK of roster
+    season_id = Column(Integer, ForeignKey("seasons.id"), nullable=False)
+    week = Column(Integer, nullable=False)
+
+    actual_points = Column(Float, default=0.0)
+    optimal_points = Column(Float, default=0.0)
+    opponent_points = Column(Float, default=0.0)
+    result = Column(String(1))  # W, L or T as played
+    lost_to_lineup = Column(Boolean, default=False)  # the optimal lineup would have won
+
+    actual_lineup = Column(JSON)
+    optimal_lineup = Column(JSON)
+    # Single bench-for-starter swaps that would have won: [[slot index, bench id, starter id, gain]]
+    swaps = Column(JSON)
+    # Points of every player referenced above
+    player_points = Column(JSON)
+
+    def __repr__(self):
+        return f"<LineupDecision matchup={self.matchup_id} roster={self.roster_id}>"
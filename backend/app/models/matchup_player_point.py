@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, Boolean, ForeignKey, String
+from sqlalchemy import Column, Integer, Float, Boolean, ForeignKey, String, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -7,6 +7,10 @@ class MatchupPlayerPoint(Base):
     """Individual player scoring per matchup."""
 
     __tablename__ = "matchup_player_points"
+    __table_args__ = (
+        # Per-player lookups (trade and draft grading) scoped to rosters
+        Index("ix_matchup_player_points_player_roster", "player_id", "roster_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     matchup_id = Column(Integer, ForeignKey("matchups.id"), nullable=False)
@@ -0,0 +1,54 @@
+from sqlalchemy import Column, Integer, Float, String, ForeignKey
+from app.database import Base
+
+
+class OwnerSeasonStats(Base):
+    """One owner's record for one season, maintained by sync.
+
+    Points are stored unrounded so career totals can be summed over rows;
+    trophy counts come from season_awards for the same season and owner.
+    """
+
+    __tablename__ = "owner_season_stats"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    roster_id = Column(Integer, ForeignKey("rosters.id"), nullable=False, unique=True)  # DB PK of roster
+    user_id = Column(String(50), ForeignKey("users.id"), nullable=False, index=True)
+    season_id = Column(Integer, ForeignKey("seasons.id"), nullable=False)
+    year = Column(Integer, nullable=False)
+    team_name = Column(String(255))
+    division = Column(Integer)
+    division_name = Column(String(100))
+
+    regular_wins = Column(Integer, default=0)
+    regular_losses = Column(Integer, default=0)
+    regular_ties = Column(Integer, default=0)
+    regular_points_for = Column(Float, default=0.0)
+    regular_points_against = Column(Float, default=0.0)
+    max_potential_points = Column(Float, default=0.0)  # regular season only
+
+    playoff_wins = Column(Integer, default=0)
+    playoff_losses = Column(Integer, default=0)
+    playoff_ties = Column(Integer, default=0)
+    playoff_points_for = Column(Float, default=0.0)
+    playoff_points_against = Column(Float, default=0.0)
+
+    consolation_wins = Column(Integer, default=0)
+    consolation_losses = Column(Integer, default=0)
+    consolation_ties = Column(Integer, default=0)
+    consolation_points_for = Column(Float, default=0.0)
+    consolation_points_against = Column(Float, default=0.0)
+
+    # Regular-season record against the weekly median
+    median_wins = Column(Integer, default=0)
+    median_losses = Column(Integer, default=0)
+    median_ties = Column(Integer, default=0)
+
+    champion_awards = Column(Integer, default=0)
+    division_winner_awards = Column(Integer, default=0)
+    most_points_awards = Column(Integer, default=0)
+    consolation_awards = Column(Integer, default=0)
+    bench_points_awards = Column(Integer, default=0)
+
+    def __repr__(self):
+        return f"<OwnerSeasonStats {self.user_id} ({self.year})>"
@@ -13,6 +13,7 @@ class Player(Base):
     last_name = Column(String(100))
     full_name = Column(String(200))
     position = Column(String(10))  # QB, RB, WR, TE, K, DEF
+    fantasy_positions = Column(JSON)  # Every position eligible at, e.g. ["RB", "WR"]
     team = Column(String(10))  # NFL team abbreviation
 
     # Player info
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, UniqueConstraint
+from datetime import datetime
+from app.database import Base
+
+
+class PlayoffOddsSnapshot(Base):
+    """Simulated playoff odds for a team as they stood after a given week."""
+
+    __tablename__ = "playoff_odds_snapshots"
+    __table_args__ = (
+        UniqueConstraint("season_id", "week", "roster_id", name="uq_playoff_odds_snapshot"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    season_id = Column(Integer, ForeignKey("seasons.id"), nullable=False, index=True)
+    week = Column(Integer, nullable=False)
+    roster_id = Column(Integer, ForeignKey("rosters.id"), nullable=False)  # DB PK of roster
+
+    # Record going into the remaining schedule
+    wins = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    team_rating = Column(Float)
+
+    # Simulated outcomes (percentages 0-100)
+    make_playoffs_pct = Column(Float)
+    win_division_pct = Column(Float)
+    first_round_bye_pct = Column(Float)
+    win_finals_pct = Column(Float)
+    projected_wins = Column(Float)
+    projected_losses = Column(Float)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<PlayoffOddsSnapshot season={self.season_id} week={self.week} roster={self.roster_id}>"
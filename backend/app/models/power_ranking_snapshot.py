@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, Float, String, ForeignKey, DateTime, UniqueConstraint
+from datetime import datetime
+from app.database import Base
+
+
+class PowerRankingSnapshot(Base):
+    """A team's power ranking as it stood after a given week."""
+
+    __tablename__ = "power_ranking_snapshots"
+    __table_args__ = (
+        UniqueConstraint("season_id", "week", "roster_id", name="uq_power_ranking_snapshot"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    season_id = Column(Integer, ForeignKey("seasons.id"), nullable=False, index=True)
+    week = Column(Integer, nullable=False)  # 0 = before any games were played
+    roster_id = Column(Integer, ForeignKey("rosters.id"), nullable=False)  # DB PK of roster
+
+    rank = Column(Integer, nullable=False)
+    total_score = Column(Float)
+    current_season_score = Column(Float)
+    roster_value_score = Column(Float)
+    historical_score = Column(Float)
+
+    # Record through this week
+    wins = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    ties = Column(Integer, default=0)
+    points_for = Column(Float, default=0.0)
+    avg_roster_age = Column(Float)
+
+    # Hash of the season's matchups and rosters the row was computed from
+    source_fingerprint = Column(String(40))
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<PowerRankingSnapshot season={self.season_id} week={self.week} rank={self.rank}>"
@@ -0,0 +1,51 @@
+from sqlalchemy import Column, String, Integer, BigInteger, Float, JSON, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.database import Base
+
+
+class TradeGrade(Base):
+    """Stored grade for a completed trade, regraded when its inputs change."""
+
+    __tablename__ = "trade_grades"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    transaction_id = Column(String(50), ForeignKey("transactions.id"), nullable=False, unique=True)
+    season_id = Column(Integer, ForeignKey("seasons.id"), nullable=False)
+    season_year = Column(Integer, nullable=False, index=True)
+    week = Column(Integer)
+    trade_date = Column(BigInteger)  # Transaction.status_updated (ms)
+
+    lopsidedness = Column(Float, nullable=False, default=0.0)
+    weeks_of_data = Column(Integer, default=0)
+    grade = Column(JSON, nullable=False)  # Full graded trade as served by the API
+
+    # Dependencies: players whose points feed the grade and the traded pick
+    # slots as [season, round, original roster_id]
+    player_ids = Column(JSON)
+    pick_slots = Column(JSON)
+    dependency_fingerprint = Column(String(40))
+
+    graded_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    owners = relationship("TradeGradeOwner", back_populates="trade_grade", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<TradeGrade {self.transaction_id} lopsidedness={self.lopsidedness}>"
+
+
+class TradeGradeOwner(Base):
+    """An owner involved in a graded trade, for owner-filtered reads."""
+
+    __tablename__ = "trade_grade_owners"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    trade_grade_id = Column(Integer, ForeignKey("trade_grades.id"), nullable=False, index=True)
+    user_id = Column(String(50), ForeignKey("users.id"), nullable=False, index=True)
+
+    # Relationships
+    trade_grade = relationship("TradeGrade", back_populates="owners")
+
+    def __repr__(self):
+        return f"<TradeGradeOwner {self.trade_grade_id} {self.user_id}>"
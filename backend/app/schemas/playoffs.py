@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List
+
+
+class ForcedResult(BaseModel):
+    """Lock the outcome of a remaining regular season matchup."""
+    matchup_id: int  # Matchup db id
+    winner_roster_id: int  # Sleeper roster ID of the winning team
+
+
+class PlayoffScenarioRequest(BaseModel):
+    """What-if scenario: locked results plus optional team rating overrides."""
+    forced_results: List[ForcedResult] = Field(default_factory=list)
+    rating_overrides: Dict[int, float] = Field(default_factory=dict)  # Sleeper roster ID -> rating
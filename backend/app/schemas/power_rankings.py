@@ -24,9 +24,36 @@ class PowerRankingTeam(BaseModel):
 class PowerRankingsResponse(BaseModel):
     """Response containing all team power rankings."""
     season: int
+    week: Optional[int] = None  # Snapshot week; None when computed live
     rankings: List[PowerRankingTeam]
 
 
+class PowerRankingWeek(BaseModel):
+    """A team's ranking after one week."""
+    week: int
+    rank: int
+    total_score: float
+    current_season_score: float
+    roster_value_score: float
+    historical_score: float
+
+
+class PowerRankingHistoryTeam(BaseModel):
+    """A team's week-by-week power rankings."""
+    roster_id: int
+    user_id: str
+    display_name: str
+    team_name: Optional[str]
+    weeks: List[PowerRankingWeek]
+
+
+class PowerRankingHistoryResponse(BaseModel):
+    """Week-by-week power rankings for a season."""
+    season: int
+    weeks: List[int]
+    teams: List[PowerRankingHistoryTeam]
+
+
 class PlayerPowerScore(BaseModel):
     """Power score breakdown for an individual player."""
     player_id: str
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class PickAsset(BaseModel):
+    """A draft pick in a proposed trade."""
+    season: int
+    round: int = Field(ge=1)
+
+
+class TradeEvaluationSide(BaseModel):
+    """What one roster would receive in a proposed trade."""
+    roster_id: int  # Sleeper roster ID in the current season
+    players: List[str] = Field(default_factory=list)
+    picks: List[PickAsset] = Field(default_factory=list)
+
+
+class TradeEvaluationRequest(BaseModel):
+    """A proposed trade between two or more rosters."""
+    sides: List[TradeEvaluationSide] = Field(min_length=2)
@@ -0,0 +1,81 @@
+"""In-process data version for derived-data caches.
+
+League data only changes through a sync, so a monotonic counter bumped
+after each successful sync commit is enough to invalidate caches of
+derived values.  The app runs as a single process, so the counter does not
+need to be shared between workers.
+
+A sync commits its league data first and its derived tables (snapshots,
+grades) after, so the two are published separately: invalidate_caches()
+makes the in-process caches used to build the derived tables reload the
+new data, and bump_version() publishes everything at once, which also
+moves the response cache and ETags to the new version.  A response built
+while the derived tables are still being written is cached under the old
+version and is dropped by the bump.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Dict
+
+_version = 0
+
+# Moves with every bump and every invalidate_caches()
+_cache_generation = 0
+
+
+def current_version() -> int:
+    """Return the current data version."""
+    return _version
+
+
+def bump_version() -> int:
+    """Mark all derived data as stale.  Call once everything a sync derives
+    from new data has been committed."""
+    global _version, _cache_generation
+    _version += 1
+    _cache_generation += 1
+    return _version
+
+
+def invalidate_caches() -> None:
+    """Drop VersionedCache entries without publishing a new version.  Call
+    after committing new data that derived tables will be rebuilt from."""
+    global _cache_generation
+    _cache_generation += 1
+
+
+class VersionedCache:
+    """LRU cache whose entries are dropped whenever the data version moves
+    or caches are invalidated."""
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._generation = _cache_generation
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def _check_version(self) -> None:
+        if _cache_generation != self._generation:
+            self._entries.clear()
+            self._generation = _cache_generation
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Return the cached values for whichever keys are present."""
+        self._check_version()
+        found = {}
+        for key in keys:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                found[key] = self._entries[key]
+        return found
+
+    def set_many(self, values: Dict[Hashable, Any]) -> None:
+        """Store values, evicting the least recently used past max_entries."""
+        self._check_version()
+        for key, value in values.items():
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
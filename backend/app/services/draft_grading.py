@@ -7,28 +7,40 @@ Algorithm:
 3. Sum total value per owner
 4. Calculate average value per pick across all owners
 5. Grade each owner based on their value share (A+ to F scale)
+
+Per-pick values are stored in draft_grade_picks and brought up to date after
+each sync by adding only the weeks scored since they were last updated.
 """
 
+import asyncio
 from collections import defaultdict
+from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import (
     Draft,
+    DraftGrade,
+    DraftGradePick,
     DraftPick,
-    Matchup,
-    MatchupPlayerPoint,
     Player,
     Roster,
     Season,
     User,
 )
+from app.services.data_version import current_version
+from app.services.pick_values import (
+    DRAFT_TYPES,
+    STARTUP_MIN_ROUNDS,
+    load_pick_value_curve,
+)
+from app.services.player_weeks import PlayerWeekStore, load_player_week_store
 
-# Weights for starter vs bench scoring (same as trade grading)
-STARTER_WEIGHT = 1.5
-BENCH_WEIGHT = 0.1
+# Data version the stored grades were last refreshed at
+_graded_version: Optional[int] = None
+_refresh_lock = asyncio.Lock()
 
 
 def _value_share_to_grade(share: float) -> str:
@@ -75,178 +87,251 @@ class DraftGradingService:
     # Public API
     # ------------------------------------------------------------------
 
-    async def grade_all_drafts(
+    async def get_draft_grades(
         self,
         draft_type: Optional[str] = None,  # "startup" or "rookie"
         owner_id: Optional[str] = None,
     ) -> List[dict]:
-        """Grade all drafts. Optionally filter by draft type or owner."""
-        drafts = await self._fetch_drafts(draft_type)
-        if not drafts:
-            return []
+        """Stored draft grades, newest first.  Optionally filter by draft
+        type or owner."""
+        await self.ensure_fresh()
 
-        # Build maps
-        user_roster_map = await self._build_user_roster_map()
-        roster_to_user = await self._build_roster_to_user_map()
-
-        # Get all player IDs from all drafts
-        all_player_ids: Set[str] = set()
-        for draft in drafts:
-            result = await self.db.execute(
-                select(DraftPick.player_id)
-                .where(
-                    DraftPick.draft_id == draft.id,
-                    DraftPick.player_id.isnot(None),
+        query = select(DraftGrade)
+        if draft_type == "startup":
+            query = query.where(DraftGrade.rounds >= STARTUP_MIN_ROUNDS)
+        elif draft_type == "rookie":
+            query = query.where(DraftGrade.rounds < STARTUP_MIN_ROUNDS)
+        if owner_id:
+            query = query.where(
+                DraftGrade.id.in_(
+                    select(DraftGradePick.draft_grade_id).where(
+                        DraftGradePick.user_id == owner_id
+                    )
                 )
             )
-            for (pid,) in result.all():
-                all_player_ids.add(pid)
-
-        player_map = await self._build_player_map(all_player_ids)
-        points_index = await self._fetch_all_player_points(all_player_ids)
-
-        graded: List[dict] = []
-        for draft in drafts:
-            g = await self._grade_draft(
-                draft,
-                user_roster_map,
-                roster_to_user,
-                player_map,
-                points_index,
-            )
-            # Filter by owner if specified
-            if owner_id:
-                # Check if this owner participated in this draft
-                has_owner = any(
-                    owner["user_id"] == owner_id for owner in g["owners"]
-                )
-                if not has_owner:
-                    continue
-            graded.append(g)
-
-        return graded
-
-    async def grade_single_draft(self, draft_id: str) -> Optional[dict]:
-        """Grade a single draft by its ID."""
         result = await self.db.execute(
-            select(Draft).where(Draft.id == draft_id)
+            query.order_by(DraftGrade.year.desc(), DraftGrade.id)
         )
-        draft = result.scalar_one_or_none()
-        if not draft:
-            return None
+        return await self._assemble_grades(list(result.scalars().all()))
 
-        user_roster_map = await self._build_user_roster_map()
-        roster_to_user = await self._build_roster_to_user_map()
+    async def get_draft_grade(self, draft_id: str) -> Optional[dict]:
+        """Stored grade for a single completed draft."""
+        await self.ensure_fresh()
 
-        # Get player IDs from this draft
         result = await self.db.execute(
-            select(DraftPick.player_id)
-            .where(
-                DraftPick.draft_id == draft.id,
-                DraftPick.player_id.isnot(None),
-            )
+            select(DraftGrade).where(DraftGrade.draft_id == draft_id)
         )
-        player_ids = {pid for (pid,) in result.all() if pid}
+        grade = result.scalar_one_or_none()
+        if not grade:
+            return None
+        return (await self._assemble_grades([grade]))[0]
+
+    async def get_value_curve(self, draft_type: Optional[str] = None) -> List[dict]:
+        """League-wide expected value by overall pick number, per draft type."""
+        curve = await load_pick_value_curve(self.db)
+        types = [draft_type] if draft_type else DRAFT_TYPES
+        return [curve.to_dict(t) for t in types]
+
+    async def refresh_grades(self, force: bool = False) -> dict:
+        """Bring the stored grades up to date now.  Holds the refresh lock,
+        so it never runs alongside a read's ensure_fresh()."""
+        async with _refresh_lock:
+            return await self._refresh_grades(force)
+
+    async def _refresh_grades(self, force: bool = False) -> dict:
+        """Bring the stored draft grades up to date.
+
+        New drafts, drafts whose picks or owners changed, and (with force)
+        every draft are graded from scratch.  If a week the grade already
+        includes was re-synced since (its row count or points changed, e.g.
+        final scores replacing a mid-week sync, or a late older week), every
+        pick is recomputed.  Otherwise each pick only gains the weeks scored
+        after the grade's points_through.
+        """
+        global _graded_version
+        version = current_version()
+
+        drafts = await self._fetch_drafts()
+        result = await self.db.execute(select(DraftGrade))
+        stored = {row.draft_id: row for row in result.scalars().all()}
+        result = await self.db.execute(select(DraftGradePick))
+        stored_picks: Dict[int, List[DraftGradePick]] = defaultdict(list)
+        for pick_row in result.scalars().all():
+            stored_picks[pick_row.draft_grade_id].append(pick_row)
+
+        draft_ids = {d.id for d in drafts}
+        removed = [row for draft_id, row in stored.items() if draft_id not in draft_ids]
+        if removed:
+            removed_ids = [row.id for row in removed]
+            await self.db.execute(
+                delete(DraftGradePick).where(DraftGradePick.draft_grade_id.in_(removed_ids))
+            )
+            await self.db.execute(delete(DraftGrade).where(DraftGrade.id.in_(removed_ids)))
+
+        graded: List[str] = []
+        updated: List[str] = []
+        unchanged = 0
+        if drafts:
+            picks_by_draft = await self._fetch_picks([d.id for d in drafts])
+            season_ids = {d.season_id for d in drafts}
+            seasons = await self._fetch_seasons(season_ids)
+            rosters_by_season = await self._build_roster_info_map(season_ids)
+            points_index = await load_player_week_store(self.db)
+            through = (
+                points_index.latest[0] * 100 + points_index.latest[1]
+                if points_index.latest else 0
+            )
 
-        player_map = await self._build_player_map(player_ids)
-        points_index = await self._fetch_all_player_points(player_ids)
+            for draft in drafts:
+                if draft.season_id not in seasons:
+                    continue
+                picks = picks_by_draft.get(draft.id, [])
+                owned = self._owned_picks(
+                    picks, rosters_by_season.get(draft.season_id, {})
+                )
+                row = stored.get(draft.id)
+                existing = stored_picks.get(row.id, []) if row else []
+                fingerprints = points_index.week_fingerprints(draft.year)
+
+                if (
+                    force
+                    or row is None
+                    or row.total_picks != len(picks)
+                    or through < (row.points_through or 0)
+                    or sorted((p.pick_no, p.player_id, uid) for p, uid in owned)
+                    != sorted((r.pick_no, r.player_id, r.user_id) for r in existing)
+                ):
+                    if row is None:
+                        row = DraftGrade(
+                            draft_id=draft.id,
+                            season_id=draft.season_id,
+                            year=draft.year,
+                        )
+                        self.db.add(row)
+                        await self.db.flush()
+                    else:
+                        await self.db.execute(
+                            delete(DraftGradePick).where(DraftGradePick.draft_grade_id == row.id)
+                        )
+                    for pick, user_id in owned:
+                        val, s_wks, b_wks = self._calculate_player_value(
+                            pick.player_id, user_id, draft.year, points_index
+                        )
+                        self.db.add(DraftGradePick(
+                            draft_grade_id=row.id,
+                            user_id=user_id,
+                            pick_no=pick.pick_no,
+                            round=pick.round,
+                            player_id=pick.player_id,
+                            weighted_points=val,
+                            starter_weeks=s_wks,
+                            bench_weeks=b_wks,
+                        ))
+                    row.graded_at = datetime.utcnow()
+                    graded.append(draft.id)
+                elif self._weeks_resynced(row, fingerprints):
+                    # A week already included changed (final or corrected
+                    # scores after a mid-week sync): recompute each pick's
+                    # value, which is two prefix-sum lookups
+                    for pick_row in existing:
+                        (
+                            pick_row.weighted_points,
+                            pick_row.starter_weeks,
+                            pick_row.bench_weeks,
+                        ) = self._calculate_player_value(
+                            pick_row.player_id, pick_row.user_id, draft.year, points_index
+                        )
+                    updated.append(draft.id)
+                elif through > (row.points_through or 0):
+                    for pick_row in existing:
+                        self._add_new_weeks(
+                            pick_row, draft.year, row.points_through or 0, points_index
+                        )
+                    updated.append(draft.id)
+                else:
+                    unchanged += 1
+
+                row.season_id = draft.season_id
+                row.year = draft.year
+                row.type = draft.type
+                row.rounds = draft.rounds
+                row.total_picks = len(picks)
+                row.points_through = through
+                row.week_fingerprints = fingerprints
+                row.weeks_of_data = self._weeks_since_draft(draft.year, points_index)
+
+        await self.db.commit()
+        _graded_version = version
+        return {
+            "graded": graded,
+            "updated": updated,
+            "unchanged": unchanged,
+            "removed": len(removed),
+        }
 
-        return await self._grade_draft(
-            draft,
-            user_roster_map,
-            roster_to_user,
-            player_map,
-            points_index,
-        )
+    async def ensure_fresh(self) -> None:
+        """Refresh stored grades once per data version."""
+        if _graded_version == current_version():
+            return
+        async with _refresh_lock:
+            if _graded_version != current_version():
+                await self._refresh_grades()
 
     # ------------------------------------------------------------------
     # Data fetching helpers
     # ------------------------------------------------------------------
 
-    async def _fetch_drafts(
-        self, draft_type: Optional[str] = None
-    ) -> List[Draft]:
-        """Fetch all completed drafts, optionally filtered by type.
+    async def _fetch_drafts(self) -> List[Draft]:
+        """Fetch all completed drafts.
 
         Startup draft = 25-round draft (the initial league draft)
         Rookie drafts = all subsequent drafts (typically 3-5 rounds)
         """
-        query = select(Draft).where(Draft.status == "complete")
-
-        # Filter by draft type based on number of rounds:
-        # "startup" = 20+ rounds (startup drafts are much larger)
-        # "rookie" = <20 rounds (rookie drafts are shorter)
-        if draft_type == "startup":
-            query = query.where(Draft.rounds >= 20)
-        elif draft_type == "rookie":
-            query = query.where(Draft.rounds < 20)
-
-        query = query.order_by(Draft.year.desc())
-        result = await self.db.execute(query)
+        result = await self.db.execute(
+            select(Draft)
+            .where(Draft.status == "complete")
+            .order_by(Draft.year.desc())
+        )
         return list(result.scalars().all())
 
-    async def _build_user_roster_map(self) -> Dict[str, Set[int]]:
-        """user_id -> set of all db_roster_ids across all seasons."""
-        result = await self.db.execute(select(Roster.user_id, Roster.id))
-        mapping: Dict[str, Set[int]] = defaultdict(set)
-        for user_id, db_id in result.all():
-            if user_id:
-                mapping[user_id].add(db_id)
-        return dict(mapping)
+    async def _fetch_picks(
+        self, draft_ids: List[str]
+    ) -> Dict[str, List[DraftPick]]:
+        """draft_id -> picks ordered by pick number."""
+        result = await self.db.execute(
+            select(DraftPick)
+            .where(DraftPick.draft_id.in_(draft_ids))
+            .order_by(DraftPick.draft_id, DraftPick.pick_no)
+        )
+        picks_by_draft: Dict[str, List[DraftPick]] = defaultdict(list)
+        for pick in result.scalars().all():
+            picks_by_draft[pick.draft_id].append(pick)
+        return dict(picks_by_draft)
 
-    async def _build_roster_to_user_map(self) -> Dict[int, str]:
-        """db_roster_id -> user_id."""
-        result = await self.db.execute(select(Roster.id, Roster.user_id))
-        return {db_id: uid for db_id, uid in result.all() if uid}
-
-    async def _build_player_map(
-        self, player_ids: Set[str]
-    ) -> Dict[str, dict]:
-        """player_id -> {full_name, position, team}"""
-        if not player_ids:
-            return {}
+    async def _fetch_seasons(self, season_ids: Set[int]) -> Dict[int, Season]:
+        """season_id -> Season."""
         result = await self.db.execute(
-            select(Player).where(Player.id.in_(list(player_ids)))
+            select(Season).where(Season.id.in_(list(season_ids)))
         )
-        mapping: Dict[str, dict] = {}
-        for p in result.scalars().all():
-            mapping[p.id] = {
-                "full_name": p.full_name,
-                "position": p.position,
-                "team": p.team,
-            }
-        return mapping
-
-    async def _fetch_all_player_points(
-        self, player_ids: Set[str]
-    ) -> Dict:
-        """Returns index keyed by (player_id, db_roster_id, season_year, week)
-        -> (points, is_starter)."""
-        if not player_ids:
-            return {}
+        return {season.id: season for season in result.scalars().all()}
+
+    async def _build_roster_info_map(
+        self, season_ids: Set[int]
+    ) -> Dict[int, Dict[int, dict]]:
+        """season_id -> {sleeper_roster_id -> {user_id, username, avatar}}"""
         result = await self.db.execute(
-            select(
-                MatchupPlayerPoint.player_id,
-                MatchupPlayerPoint.points,
-                MatchupPlayerPoint.is_starter,
-                MatchupPlayerPoint.roster_id,
-                Matchup.week,
-                Season.year.label("season_year"),
-            )
-            .join(Matchup, MatchupPlayerPoint.matchup_id == Matchup.id)
-            .join(Season, Matchup.season_id == Season.id)
-            .where(MatchupPlayerPoint.player_id.in_(list(player_ids)))
+            select(Roster, User)
+            .join(User, Roster.user_id == User.id)
+            .where(Roster.season_id.in_(list(season_ids)))
         )
-        index: Dict[tuple, tuple] = {}
-        for row in result.all():
-            key = (
-                row.player_id,
-                row.roster_id,
-                row.season_year,
-                row.week,
-            )
-            index[key] = (row.points or 0.0, bool(row.is_starter))
-        return index
+        mapping: Dict[int, Dict[int, dict]] = defaultdict(dict)
+        for roster, user in result.all():
+            mapping[roster.season_id][roster.roster_id] = {
+                "user_id": user.id,
+                "username": user.display_name or user.username,
+                "avatar": user.avatar,
+            }
+        return dict(mapping)
 
     # ------------------------------------------------------------------
     # Computation helpers
@@ -257,155 +342,156 @@ class DraftGradingService:
         player_id: str,
         user_id: str,
         draft_season_year: int,
-        points_index: Dict,
-        user_roster_map: Dict[str, Set[int]],
+        points_index: PlayerWeekStore,
     ) -> Tuple[float, int, int]:
         """Sum weighted points for a player on ANY roster belonging to
-        user_id after the draft. Returns (total_value, starter_weeks,
-        bench_weeks)."""
-        total = 0.0
-        starter_weeks = 0
-        bench_weeks = 0
-
-        # All db_roster_ids that belong to this user
-        user_rids = user_roster_map.get(user_id, set())
-
-        for key, (pts, is_starter) in points_index.items():
-            pid, rid, year, week = key
-            if pid != str(player_id):
-                continue
-            if rid not in user_rids:
-                continue
-            # Only count points from draft year onwards
-            if year < draft_season_year:
-                continue
-
-            weight = STARTER_WEIGHT if is_starter else BENCH_WEIGHT
-            total += pts * weight
-            if is_starter:
-                starter_weeks += 1
-            else:
-                bench_weeks += 1
-
-        return total, starter_weeks, bench_weeks
+        user_id from the draft season onwards. Returns (total_value,
+        starter_weeks, bench_weeks)."""
+        return points_index.value_since(player_id, user_id, draft_season_year)
 
     def _weeks_since_draft(
         self,
         draft_season_year: int,
-        points_index: Dict,
+        points_index: PlayerWeekStore,
     ) -> int:
         """Approximate number of weeks of data after the draft."""
-        max_year = draft_season_year
-        max_week = 0
-        for (_, _, year, week) in points_index:
-            if year > max_year or (year == max_year and week > max_week):
-                max_year = year
-                max_week = week
+        max_year, max_week = max(
+            (draft_season_year, 0), points_index.latest or (draft_season_year, 0)
+        )
         if max_year == draft_season_year:
             return max_week
         # Approximate weeks across seasons (17 weeks per season)
         return max_week + (max_year - draft_season_year) * 17
 
-    # ------------------------------------------------------------------
-    # Core grade computation
-    # ------------------------------------------------------------------
+    def _owned_picks(
+        self, picks: List[DraftPick], roster_info_map: Dict[int, dict]
+    ) -> List[Tuple[DraftPick, str]]:
+        """(pick, user_id) for each made pick whose roster maps to an owner."""
+        owned = []
+        for pick in picks:
+            if pick.roster_id and pick.player_id:
+                info = roster_info_map.get(pick.roster_id)
+                if info:
+                    owned.append((pick, info["user_id"]))
+        return owned
+
+    @staticmethod
+    def _weeks_resynced(row: DraftGrade, fingerprints: Dict[str, list]) -> bool:
+        """Whether any week the stored grade already includes has changed
+        since, or was synced late.  Grades stored without fingerprints
+        count as changed."""
+        if row.week_fingerprints is None:
+            return True
+        included = {
+            week: fingerprint for week, fingerprint in fingerprints.items()
+            if int(week) <= (row.points_through or 0)
+        }
+        return included != row.week_fingerprints
 
-    async def _grade_draft(
+    def _add_new_weeks(
         self,
-        draft: Draft,
-        user_roster_map: Dict[str, Set[int]],
-        roster_to_user: Dict[int, str],
-        player_map: Dict,
-        points_index: Dict,
-    ) -> dict:
-        """Grade a single draft by calculating each owner's total pick value."""
-        draft_year = draft.year
-
-        # Get all picks for this draft
-        result = await self.db.execute(
-            select(DraftPick)
-            .where(DraftPick.draft_id == draft.id)
-            .order_by(DraftPick.pick_no)
-        )
-        picks = result.scalars().all()
+        pick_row: DraftGradePick,
+        draft_season_year: int,
+        points_through: int,
+        points_index: PlayerWeekStore,
+    ) -> None:
+        """Add the weeks scored after points_through to a stored pick."""
+        if points_through < draft_season_year * 100:
+            # Nothing from the draft season was included yet
+            new = points_index.value_since(
+                pick_row.player_id, pick_row.user_id, draft_season_year
+            )
+        else:
+            new = points_index.value_after(
+                pick_row.player_id, pick_row.user_id, *divmod(points_through, 100)
+            )
+            full = points_index.value_since(
+                pick_row.player_id, pick_row.user_id, draft_season_year
+            )
+            stored_weeks = (pick_row.starter_weeks or 0) + (pick_row.bench_weeks or 0)
+            if stored_weeks + new[1] + new[2] != full[1] + full[2]:
+                # Weeks before points_through changed; start over
+                pick_row.weighted_points = 0.0
+                pick_row.starter_weeks = 0
+                pick_row.bench_weeks = 0
+                new = full
+        pick_row.weighted_points = (pick_row.weighted_points or 0.0) + new[0]
+        pick_row.starter_weeks = (pick_row.starter_weeks or 0) + new[1]
+        pick_row.bench_weeks = (pick_row.bench_weeks or 0) + new[2]
 
-        # Get season for this draft
-        result = await self.db.execute(
-            select(Season).where(Season.id == draft.season_id)
-        )
-        season = result.scalar_one_or_none()
-        if not season:
-            return None
+    # ------------------------------------------------------------------
+    # Response assembly
+    # ------------------------------------------------------------------
 
-        # Get roster info to map roster_id to user
-        roster_ids = list(set(p.roster_id for p in picks if p.roster_id))
+    async def _assemble_grades(self, grades: List[DraftGrade]) -> List[dict]:
+        """Build API responses for stored grades from their pick rows."""
+        if not grades:
+            return []
         result = await self.db.execute(
-            select(Roster, User)
-            .join(User, Roster.user_id == User.id)
-            .where(
-                Roster.roster_id.in_(roster_ids),
-                Roster.season_id == season.id,
+            select(
+                DraftGradePick,
+                User.display_name,
+                User.username,
+                User.avatar,
+                Player.full_name,
+                Player.position,
+                Player.team,
             )
+            .join(User, DraftGradePick.user_id == User.id)
+            .outerjoin(Player, DraftGradePick.player_id == Player.id)
+            .where(DraftGradePick.draft_grade_id.in_([g.id for g in grades]))
+            .order_by(DraftGradePick.draft_grade_id, DraftGradePick.pick_no)
         )
-        roster_info_map = {}
-        for roster, user in result.all():
-            roster_info_map[roster.roster_id] = {
-                "user_id": user.id,
-                "username": user.display_name or user.username,
-                "avatar": user.avatar,
-            }
-
-        # Group picks by owner
-        picks_by_owner: Dict[str, List[DraftPick]] = defaultdict(list)
-        for pick in picks:
-            if pick.roster_id and pick.player_id:
-                info = roster_info_map.get(pick.roster_id)
-                if info:
-                    picks_by_owner[info["user_id"]].append(pick)
+        rows_by_grade: Dict[int, list] = defaultdict(list)
+        for row in result.all():
+            rows_by_grade[row[0].draft_grade_id].append(row)
+        return [self._assemble_grade(g, rows_by_grade.get(g.id, [])) for g in grades]
+
+    def _assemble_grade(self, grade: DraftGrade, rows: list) -> dict:
+        """Grade a single draft from its stored per-pick values."""
+        # Group picks by owner, in draft order
+        owners: Dict[str, dict] = {}
+        for pick_row, display_name, username, avatar, full_name, position, team in rows:
+            owner = owners.get(pick_row.user_id)
+            if owner is None:
+                owner = owners[pick_row.user_id] = {
+                    "user_id": pick_row.user_id,
+                    "username": display_name or username,
+                    "avatar": avatar,
+                    "value": 0.0,
+                    "picks": [],
+                }
+            val = pick_row.weighted_points or 0.0
+            s_wks = pick_row.starter_weeks or 0
+            b_wks = pick_row.bench_weeks or 0
+            owner["value"] += val
+            owner["picks"].append({
+                "pick_no": pick_row.pick_no,
+                "round": pick_row.round,
+                "player_id": pick_row.player_id,
+                "player_name": full_name or f"Player {pick_row.player_id}",
+                "position": position,
+                "team": team,
+                "weighted_points": round(val, 2),
+                "starter_weeks": s_wks,
+                "bench_weeks": b_wks,
+                "total_weeks": s_wks + b_wks,
+            })
 
         # Calculate value for each owner
         owner_data: List[dict] = []
         total_value_sum = 0.0
-
-        for user_id, user_picks in picks_by_owner.items():
-            total_value = 0.0
-            pick_details = []
-
-            for pick in user_picks:
-                pinfo = player_map.get(pick.player_id, {})
-                val, s_wks, b_wks = self._calculate_player_value(
-                    pick.player_id,
-                    user_id,
-                    draft_year,
-                    points_index,
-                    user_roster_map,
-                )
-
-                total_value += val
-                pick_details.append({
-                    "pick_no": pick.pick_no,
-                    "round": pick.round,
-                    "player_id": pick.player_id,
-                    "player_name": pinfo.get("full_name", f"Player {pick.player_id}"),
-                    "position": pinfo.get("position"),
-                    "team": pinfo.get("team"),
-                    "weighted_points": round(val, 2),
-                    "starter_weeks": s_wks,
-                    "bench_weeks": b_wks,
-                    "total_weeks": s_wks + b_wks,
-                })
-
-            roster_id = user_picks[0].roster_id if user_picks else None
-            info = roster_info_map.get(roster_id, {})
-
+        for owner in owners.values():
+            total_value = owner["value"]
+            num_picks = len(owner["picks"])
             owner_data.append({
-                "user_id": user_id,
-                "username": info.get("username", "Unknown"),
-                "avatar": info.get("avatar"),
+                "user_id": owner["user_id"],
+                "username": owner["username"],
+                "avatar": owner["avatar"],
                 "total_value": round(total_value, 2),
-                "num_picks": len(user_picks),
-                "avg_value_per_pick": round(total_value / len(user_picks), 2) if user_picks else 0,
-                "picks": pick_details,
+                "num_picks": num_picks,
+                "avg_value_per_pick": round(total_value / num_picks, 2) if num_picks else 0,
+                "picks": owner["picks"],
             })
             total_value_sum += total_value
 
@@ -424,15 +510,13 @@ class DraftGradingService:
         # Sort by total value descending
         owner_data.sort(key=lambda x: x["total_value"], reverse=True)
 
-        weeks_of_data = self._weeks_since_draft(draft_year, points_index)
-
         return {
-            "draft_id": draft.id,
-            "year": draft_year,
-            "type": draft.type,
-            "rounds": draft.rounds,
-            "weeks_of_data": weeks_of_data,
+            "draft_id": grade.draft_id,
+            "year": grade.year,
+            "type": grade.type,
+            "rounds": grade.rounds,
+            "weeks_of_data": grade.weeks_of_data,
             "avg_value": round(avg_value, 2),
-            "total_picks": len(picks),
+            "total_picks": grade.total_picks,
             "owners": owner_data,
         }
@@ -1,24 +1,111 @@
-"""Optimal lineup calculation for max potential points."""
-from typing import List, Dict, Any
+"""Optimal lineup calculation for max potential points.
+
+Each league's roster_positions are compiled once into a LineupPlan: the
+starting slot types, how many of each, and which slot types every player
+position can fill.  Solving a roster is then an exact max-weight
+assignment.  Players with the same eligibility are interchangeable, so
+each eligibility group only ever starts its top players; slot types that
+only one group can fill are filled first, and the slot types groups share
+(FLEX, SUPER_FLEX, IDP_FLEX, ...) are split between groups with a small DP
+over their remaining capacities.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Any, Dict, List, Tuple
 from collections import defaultdict
 
+# Player positions each Sleeper starting slot accepts.  Slots not listed
+# accept only the position of the same name.
+SLOT_ELIGIBILITY: Dict[str, frozenset] = {
+    "QB": frozenset({"QB"}),
+    "RB": frozenset({"RB"}),
+    "WR": frozenset({"WR"}),
+    "TE": frozenset({"TE"}),
+    "K": frozenset({"K"}),
+    "DEF": frozenset({"DEF"}),
+    "FLEX": frozenset({"RB", "WR", "TE"}),
+    "WRRB_FLEX": frozenset({"RB", "WR"}),
+    "REC_FLEX": frozenset({"WR", "TE"}),
+    "SUPER_FLEX": frozenset({"QB", "RB", "WR", "TE"}),
+    "DL": frozenset({"DL", "DE", "DT"}),
+    "LB": frozenset({"LB"}),
+    "DB": frozenset({"DB", "CB", "S"}),
+    "IDP_FLEX": frozenset({"DL", "DE", "DT", "LB", "DB", "CB", "S"}),
+}
+
+# Roster slots that never score
+NON_STARTING_SLOTS = frozenset({"BN", "IR", "TAXI"})
+
+
+class LineupPlan:
+    """A league's starting slots, compiled for repeated solving."""
+
+    def __init__(self, roster_positions: Tuple[str, ...]):
+        self.starters: List[str] = [
+            slot for slot in roster_positions if slot not in NON_STARTING_SLOTS
+        ]
+        self.slot_types: List[str] = list(dict.fromkeys(self.starters))
+        index = {slot: i for i, slot in enumerate(self.slot_types)}
+        self.capacities: List[int] = [0] * len(self.slot_types)
+        # Lineup positions (indexes into starters) of each slot type
+        self.slot_positions: List[List[int]] = [[] for _ in self.slot_types]
+        # Slot type of each lineup position
+        self.starter_types: List[int] = [index[slot] for slot in self.starters]
+        for i, slot in enumerate(self.starters):
+            self.capacities[index[slot]] += 1
+            self.slot_positions[index[slot]].append(i)
+        self._position_masks: Dict[str, int] = {}
+
+    def position_mask(self, position: str) -> int:
+        """Bitmask of the slot types a player position can fill."""
+        mask = self._position_masks.get(position)
+        if mask is None:
+            mask = 0
+            for i, slot in enumerate(self.slot_types):
+                if position in SLOT_ELIGIBILITY.get(slot, (slot,)):
+                    mask |= 1 << i
+            self._position_masks[position] = mask
+        return mask
+
+    def can_start(self, lineup_index: int, position: str) -> bool:
+        """Whether a player position can fill the slot at a lineup position."""
+        return bool(self.position_mask(position) >> self.starter_types[lineup_index] & 1)
+
+
+@lru_cache(maxsize=64)
+def compile_plan(roster_positions: Tuple[str, ...]) -> LineupPlan:
+    """The LineupPlan for a roster_positions setting, compiled once."""
+    return LineupPlan(roster_positions)
+
+
+@dataclass(eq=False)
+class _Group:
+    """Players sharing the same slot eligibility, best first."""
+
+    mask: int
+    players: List[Dict[str, Any]]
+    exclusive: List[int]  # slot types only this group can fill
+    dedicated: int = 0  # players going into exclusive slots
+
+    def gain(self, extra: int) -> float:
+        """Points from starting `extra` more players beyond the dedicated."""
+        return sum(p["points"] for p in self.players[self.dedicated:self.dedicated + extra])
+
 
 class LineupOptimizer:
     """Calculate the optimal lineup given player points and positions."""
 
-    # Position priorities for FLEX spots (higher score takes precedence)
-    FLEX_POSITIONS = ["RB", "WR", "TE"]
-    SUPER_FLEX_POSITIONS = ["QB", "RB", "WR", "TE"]
-
     def __init__(self, roster_positions: List[str]):
         """
         Initialize with league roster position requirements.
 
         Args:
             roster_positions: List of position slots from league settings
-                             e.g., ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "FLEX", "FLEX", "SUPER_FLEX", "K", "DEF"]
+                             e.g., ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "FLEX", "FLEX", "SUPER_FLEX", "K", "DEF", "BN"]
         """
         self.roster_positions = roster_positions or []
+        self.plan = compile_plan(tuple(self.roster_positions))
 
     def calculate_optimal_lineup(self, player_points: List[Dict[str, Any]]) -> float:
         """
@@ -31,82 +118,168 @@ class LineupOptimizer:
         Returns:
             Maximum potential points from optimal lineup
         """
-        if not player_points or not self.roster_positions:
-            return 0.0
+        return self.optimal_lineup(player_points)["total"]
 
-        # Group players by position and sort by points (descending)
-        players_by_position = defaultdict(list)
+    def optimal_lineup(self, player_points: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Solve for the highest-scoring lineup.
+
+        Args:
+            player_points: List of dicts with keys: player_id, position, points
+                          and optionally positions (every position the player
+                          is eligible at, e.g. Sleeper's fantasy_positions)
+
+        Returns:
+            {"total": points, "lineup": [{slot, player_id, position, points}]}
+            with one lineup entry per starting slot in roster_positions
+            order; slots nobody can fill have player_id None.  Players with
+            no points never start, since leaving a slot empty is better.
+        """
+        plan = self.plan
+        lineup: List[Dict[str, Any]] = [
+            {"slot": slot, "player_id": None, "position": None, "points": 0.0}
+            for slot in plan.starters
+        ]
+        if not player_points or not plan.starters:
+            return {"total": 0.0, "lineup": lineup}
+
+        groups = self._group_players(player_points)
+
+        # Slot types only one group can fill go to that group's best players
+        eligible_groups: Dict[int, List[_Group]] = defaultdict(list)
+        for group in groups:
+            for t in range(len(plan.slot_types)):
+                if group.mask >> t & 1:
+                    eligible_groups[t].append(group)
+        shared: List[int] = []
+        for t, owners in eligible_groups.items():
+            if len(owners) == 1:
+                owners[0].exclusive.append(t)
+            else:
+                shared.append(t)
+        for group in groups:
+            group.dedicated = min(
+                len(group.players), sum(plan.capacities[t] for t in group.exclusive)
+            )
+
+        # Split the shared slot types between groups, per connected component
+        allocation: Dict[int, Dict[int, int]] = {}
+        for component_types, component_groups in self._components(groups, shared):
+            allocation.update(self._solve_shared(component_types, component_groups))
+
+        # Place players: exclusive slots first, then their shared slot types
+        open_positions = [list(reversed(p)) for p in plan.slot_positions]
+        total = 0.0
+        for group in groups:
+            starters = iter(group.players)
+            for t in sorted(group.exclusive):
+                for _ in range(plan.capacities[t]):
+                    player = next(starters, None)
+                    if player is None:
+                        break
+                    total += self._place(lineup, open_positions[t].pop(), player)
+            for t, count in sorted(allocation.get(id(group), {}).items()):
+                for _ in range(count):
+                    total += self._place(lineup, open_positions[t].pop(), next(starters))
+
+        return {"total": round(total, 2), "lineup": lineup}
+
+    def _group_players(self, player_points: List[Dict[str, Any]]) -> List[_Group]:
+        """Group scoring players by the slot types they can fill, keeping
+        only as many per group as those slot types can hold."""
+        plan = self.plan
+        by_mask: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
         for player in player_points:
             position = player.get("position")
             points = player.get("points", 0) or 0
-            if position:
-                players_by_position[position].append({
+            if not position or points <= 0:
+                continue
+            mask = 0
+            for pos in player.get("positions") or (position,):
+                mask |= plan.position_mask(pos)
+            if mask:
+                by_mask[mask].append({
                     "player_id": player.get("player_id"),
                     "position": position,
-                    "points": points
+                    "points": points,
                 })
 
-        # Sort each position by points descending
-        for position in players_by_position:
-            players_by_position[position].sort(key=lambda x: x["points"], reverse=True)
+        groups = []
+        for mask, players in by_mask.items():
+            players.sort(key=lambda x: x["points"], reverse=True)
+            room = sum(
+                cap for t, cap in enumerate(plan.capacities) if mask >> t & 1
+            )
+            groups.append(_Group(mask=mask, players=players[:room], exclusive=[]))
+        return groups
 
-        # Track which players have been used
-        used_player_ids = set()
-        total_points = 0.0
+    @staticmethod
+    def _components(
+        groups: List[_Group], shared: List[int]
+    ) -> List[Tuple[List[int], List[_Group]]]:
+        """Shared slot types and the groups competing for them, split into
+        independent components (e.g. offense flex vs IDP flex)."""
+        remaining = set(shared)
+        components = []
+        while remaining:
+            types = {remaining.pop()}
+            members: List[_Group] = []
+            changed = True
+            while changed:
+                changed = False
+                for group in groups:
+                    if group in members:
+                        continue
+                    if any(group.mask >> t & 1 for t in types):
+                        members.append(group)
+                        new = {t for t in remaining if group.mask >> t & 1}
+                        if new:
+                            types |= new
+                            remaining -= new
+                        changed = True
+            components.append((sorted(types), members))
+        return components
 
-        # Count position requirements
-        position_counts = defaultdict(int)
-        flex_count = 0
-        super_flex_count = 0
+    def _solve_shared(
+        self, types: List[int], groups: List[_Group]
+    ) -> Dict[int, Dict[int, int]]:
+        """Exact split of shared slot types between groups: DP over groups
+        with the remaining capacity of each slot type as the state.
+        Returns id(group) -> {slot type: players placed there}."""
+        capacities = tuple(self.plan.capacities[t] for t in types)
+        # state -> (points, [(group, allocation)...])
+        best: Dict[Tuple[int, ...], Tuple[float, list]] = {capacities: (0.0, [])}
+        for group in groups:
+            extra = len(group.players) - group.dedicated
+            eligible = [i for i, t in enumerate(types) if group.mask >> t & 1]
+            if extra <= 0 or not eligible:
+                continue
+            gains = [group.gain(k) for k in range(extra + 1)]
+            step: Dict[Tuple[int, ...], Tuple[float, list]] = {}
+            for state, (points, choices) in best.items():
+                ranges = [range(min(state[i], extra) + 1) for i in eligible]
+                for counts in product(*ranges):
+                    used = sum(counts)
+                    if used > extra:
+                        continue
+                    remaining = list(state)
+                    for i, c in zip(eligible, counts):
+                        remaining[i] -= c
+                    key = tuple(remaining)
+                    value = points + gains[used]
+                    if key not in step or value > step[key][0]:
+                        alloc = {types[i]: c for i, c in zip(eligible, counts) if c}
+                        step[key] = (value, choices + [(group, alloc)])
+            best = step
 
-        for pos in self.roster_positions:
-            if pos == "FLEX":
-                flex_count += 1
-            elif pos == "SUPER_FLEX":
-                super_flex_count += 1
-            else:
-                position_counts[pos] += 1
-
-        # First pass: Fill specific position requirements
-        for position, count in position_counts.items():
-            available = [p for p in players_by_position.get(position, [])
-                        if p["player_id"] not in used_player_ids]
-
-            for i in range(min(count, len(available))):
-                player = available[i]
-                total_points += player["points"]
-                used_player_ids.add(player["player_id"])
-
-        # Second pass: Fill FLEX spots (RB/WR/TE)
-        if flex_count > 0:
-            flex_candidates = []
-            for position in self.FLEX_POSITIONS:
-                flex_candidates.extend([
-                    p for p in players_by_position.get(position, [])
-                    if p["player_id"] not in used_player_ids
-                ])
-
-            # Sort by points and take top flex_count players
-            flex_candidates.sort(key=lambda x: x["points"], reverse=True)
-            for i in range(min(flex_count, len(flex_candidates))):
-                player = flex_candidates[i]
-                total_points += player["points"]
-                used_player_ids.add(player["player_id"])
-
-        # Third pass: Fill SUPER_FLEX spots (QB/RB/WR/TE)
-        if super_flex_count > 0:
-            superflex_candidates = []
-            for position in self.SUPER_FLEX_POSITIONS:
-                superflex_candidates.extend([
-                    p for p in players_by_position.get(position, [])
-                    if p["player_id"] not in used_player_ids
-                ])
-
-            # Sort by points and take top super_flex_count players
-            superflex_candidates.sort(key=lambda x: x["points"], reverse=True)
-            for i in range(min(super_flex_count, len(superflex_candidates))):
-                player = superflex_candidates[i]
-                total_points += player["points"]
-                used_player_ids.add(player["player_id"])
-
-        return round(total_points, 2)
+        _, choices = max(best.values(), key=lambda entry: entry[0])
+        return {id(group): alloc for group, alloc in choices if alloc}
+
+    @staticmethod
+    def _place(lineup: List[Dict[str, Any]], index: int, player: Dict[str, Any]) -> float:
+        lineup[index].update(
+            player_id=player["player_id"],
+            position=player["position"],
+            points=player["points"],
+        )
+        return player["points"]
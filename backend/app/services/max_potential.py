@@ -0,0 +1,226 @@
+"""Batch recomputation of matchup max potential points.
+
+Sync computes home/away_max_potential_points one matchup at a time as
+weeks come in.  After the lineup optimizer changes, or player positions are
+fixed, every stored value is stale; this recomputes whole seasons at once:
+player points are streamed in (matchup, roster) order, positions come from
+one in-memory map, and the results are written back in bulk UPDATEs.
+
+Stored start/sit analyses are redone from the same players, and the
+playoff odds timeline, power rankings and owner stats are refreshed as
+after a sync.  Rosters without player points keep their
+stored value, which is NULL unless a sync set it.
+"""
+
+import logging
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import League, LineupDecision, Matchup, MatchupPlayerPoint, Season
+from app.services.data_version import bump_version
+from app.services.lineup_optimizer import LineupOptimizer
+from app.services.owner_stats import OwnerStatsService
+from app.services.playoff_timeline import backfill_playoff_timeline
+from app.services.power_rankings import refresh_power_rankings
+from app.services.start_sit import (
+    analyze_lineup,
+    lineup_candidates,
+    load_player_positions,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip while streaming player points
+STREAM_BATCH_SIZE = 5000
+
+# Matchups per bulk UPDATE statement
+UPDATE_BATCH_SIZE = 500
+
+
+class MaxPotentialService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def load_seasons(self, year: Optional[int] = None) -> List[Tuple[Season, League]]:
+        """(season, league) for every season, or just `year`, oldest first."""
+        query = (
+            select(Season, League)
+            .join(League, Season.league_id == League.id)
+            .order_by(Season.year)
+        )
+        if year is not None:
+            query = query.where(Season.year == year)
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def recompute_seasons(
+        self, seasons: List[Tuple[Season, League]]
+    ) -> AsyncIterator[dict]:
+        """Recompute the given seasons, yielding each season's summary as
+        it is committed, then refresh the tables derived from them."""
+        positions = await load_player_positions(self.db)
+
+        changed_years = []
+        for season, league in seasons:
+            summary = await self._recompute_season(season, league, positions)
+            logger.info(
+                f"Max potential {summary['year']}: "
+                f"{summary['updated']}/{summary['matchups']} matchups updated"
+            )
+            if summary["updated"] or summary["lineups"]:
+                changed_years.append(summary["year"])
+            yield summary
+
+        if changed_years:
+            await self._refresh_derived(changed_years)
+
+    async def recompute(
+        self,
+        year: Optional[int] = None,
+        on_progress: Optional[Callable[[dict], None]] = None,
+    ) -> Optional[dict]:
+        """Recompute max potential points for every matchup in every season
+        (or just `year`).  on_progress is called with each season's summary
+        as it finishes.  Returns None if `year` has no season."""
+        seasons = await self.load_seasons(year)
+        if year is not None and not seasons:
+            return None
+
+        summaries: List[dict] = []
+        async for summary in self.recompute_seasons(seasons):
+            summaries.append(summary)
+            if on_progress:
+                on_progress(summary)
+        return {
+            "status": "success",
+            "updated": sum(s["updated"] for s in summaries),
+            "seasons": summaries,
+        }
+
+    async def _refresh_derived(self, years: List[int]):
+        """Rebuild what sync derives from max potential and bump the data
+        version once; failures only log.  None of the snapshots read
+        versioned caches that depend on max potential."""
+        for year in years:
+            try:
+                # Team ratings use max potential, so every week is stale
+                await backfill_playoff_timeline(self.db, year, force=True)
+                await refresh_power_rankings(self.db, year)
+            except Exception as e:
+                await self.db.rollback()
+                logger.warning(f"Could not refresh snapshots for {year}: {e}")
+        bump_version()
+        try:
+            await OwnerStatsService(self.db).ensure_fresh()
+        except Exception as e:
+            await self.db.rollback()
+            logger.warning(f"Could not refresh owner stats: {e}")
+
+    async def _recompute_season(
+        self, season: Season, league: League, positions: Dict[str, Tuple[str, ...]]
+    ) -> dict:
+        summary = {"year": season.year, "matchups": 0, "rosters": 0, "updated": 0, "lineups": 0}
+        if not league.roster_positions:
+            summary["skipped"] = "league has no roster positions"
+            return summary
+
+        result = await self.db.execute(
+            select(
+                Matchup.id,
+                Matchup.home_roster_id,
+                Matchup.away_roster_id,
+                Matchup.home_max_potential_points,
+                Matchup.away_max_potential_points,
+            ).where(Matchup.season_id == season.id)
+        )
+        matchups = result.all()
+        summary["matchups"] = len(matchups)
+
+        result = await self.db.execute(
+            select(LineupDecision).where(LineupDecision.season_id == season.id)
+        )
+        decisions = {(d.matchup_id, d.roster_id): d for d in result.scalars().all()}
+
+        maxes = await self._stream_roster_maxes(
+            season.id, LineupOptimizer(league.roster_positions), positions, decisions
+        )
+        summary["rosters"] = len(maxes)
+        summary["lineups"] = sum(1 for key in maxes if key in decisions)
+
+        updates = []
+        for mid, home_rid, away_rid, home_max, away_max in matchups:
+            # No player points to solve from: keep what is stored
+            new_home = maxes.get((mid, home_rid), home_max)
+            new_away = maxes.get((mid, away_rid), away_max)
+            if new_home != home_max or new_away != away_max:
+                updates.append({
+                    "id": mid,
+                    "home_max_potential_points": new_home,
+                    "away_max_potential_points": new_away,
+                })
+
+        for start in range(0, len(updates), UPDATE_BATCH_SIZE):
+            await self.db.execute(update(Matchup), updates[start:start + UPDATE_BATCH_SIZE])
+        await self.db.commit()
+        summary["updated"] = len(updates)
+        return summary
+
+    async def _stream_roster_maxes(
+        self,
+        season_id: int,
+        optimizer: LineupOptimizer,
+        positions: Dict[str, Tuple[str, ...]],
+        decisions: Dict[Tuple[int, int], LineupDecision],
+    ) -> Dict[Tuple[int, int], float]:
+        """(matchup id, roster id) -> max potential, solving each roster's
+        players as soon as the streamed rows move past it.  Rosters with a
+        stored start/sit analysis get it redone in place."""
+        result = await self.db.stream(
+            select(
+                MatchupPlayerPoint.matchup_id,
+                MatchupPlayerPoint.roster_id,
+                MatchupPlayerPoint.player_id,
+                MatchupPlayerPoint.points,
+            )
+            .join(Matchup, MatchupPlayerPoint.matchup_id == Matchup.id)
+            .where(Matchup.season_id == season_id)
+            .order_by(MatchupPlayerPoint.matchup_id, MatchupPlayerPoint.roster_id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+
+        maxes: Dict[Tuple[int, int], float] = {}
+
+        def solve(key, player_points):
+            decision = decisions.get(key)
+            if decision is None:
+                maxes[key] = optimizer.calculate_optimal_lineup(
+                    lineup_candidates(player_points, positions)
+                )
+                return
+            # The lineup as played is stored; only the optimal side changes
+            analysis = analyze_lineup(
+                optimizer,
+                player_points,
+                [pid or "0" for pid in decision.actual_lineup or []],
+                positions,
+                decision.actual_points or 0.0,
+                decision.opponent_points or 0.0,
+            )
+            for field, value in analysis.items():
+                setattr(decision, field, value)
+            maxes[key] = analysis["optimal_points"]
+
+        key = None
+        player_points: Dict[str, float] = {}
+        async for mid, rid, pid, points in result:
+            if (mid, rid) != key:
+                if key is not None:
+                    solve(key, player_points)
+                key = (mid, rid)
+                player_points = {}
+            player_points[pid] = points
+        if key is not None:
+            solve(key, player_points)
+        return maxes
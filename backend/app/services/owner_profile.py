@@ -0,0 +1,93 @@
+"""Owner profile loader for /owners/{user_id}.
+
+The profile is read from owner_season_stats: one indexed lookup returns
+every season the owner played with its splits, median record and trophies,
+and career stats and trophies are rollups of those rows.  The result is
+cached until the next sync.
+"""
+
+from typing import Optional
+
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import OwnerSeasonStats, User
+from app.services.data_version import VersionedCache
+from app.services.owner_stats import (
+    TOTAL_COLUMNS,
+    OwnerStatsService,
+    categories_from_totals,
+    owner_career_stats,
+    row_totals,
+    trophies_from_totals,
+)
+
+_profile_cache = VersionedCache(max_entries=256)
+
+
+class OwnerProfileService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_owner_profile(self, user_id: str) -> Optional[dict]:
+        """Career stats, trophies and season-by-season breakdown for an
+        owner.  Returns None for an unknown owner."""
+        cached = _profile_cache.get_many([user_id])
+        if cached:
+            return cached[user_id]
+
+        await OwnerStatsService(self.db).ensure_fresh()
+
+        result = await self.db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if not user:
+            return None
+
+        result = await self.db.execute(
+            select(OwnerSeasonStats)
+            .where(OwnerSeasonStats.user_id == user_id)
+            .order_by(desc(OwnerSeasonStats.year))
+        )
+        rows = result.scalars().all()
+
+        seasons = []
+        career_totals = dict.fromkeys(TOTAL_COLUMNS, 0)
+        for row in rows:
+            totals = row_totals(row)
+            for column, value in totals.items():
+                career_totals[column] += value or 0
+            cats = categories_from_totals(totals)
+            reg = cats["regular"]
+            seasons.append({
+                "year": row.year,
+                "team_name": row.team_name,
+                "division": row.division,
+                "division_name": row.division_name,
+                "regular_season": cats["regular"],
+                "playoff": cats["playoff"],
+                "consolation": cats["consolation"],
+                "median_wins": row.median_wins or 0,
+                "median_losses": row.median_losses or 0,
+                "median_ties": row.median_ties or 0,
+                # Legacy flat fields (regular season)
+                "wins": reg["wins"],
+                "losses": reg["losses"],
+                "ties": reg["ties"],
+                "points_for": reg["points_for"],
+                "points_against": reg["points_against"],
+                "win_percentage": reg["win_percentage"],
+            })
+
+        profile = {
+            "user_id": user.id,
+            "username": user.username,
+            "display_name": user.display_name,
+            "avatar": user.avatar,
+            "career_stats": owner_career_stats(
+                len(rows), categories_from_totals(career_totals) if rows else None
+            ),
+            "trophies": trophies_from_totals(career_totals),
+            "seasons": seasons
+        }
+        _profile_cache.set_many({user_id: profile})
+        return profile
@@ -0,0 +1,286 @@
+"""Owner-season stats: each owner's record for each season, kept in the
+owner_season_stats table.
+
+Sync rebuilds the table after every run (and reads rebuild it once per data
+version if it is behind), computing every roster's regular, playoff and
+consolation splits and trophies from a handful of set-based queries, and
+its record against the weekly median from the weekly score index.
+Career stats are rollups over the table, so the owner list is one grouped
+query and an owner's page one indexed lookup.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import League, Matchup, OwnerSeasonStats, Roster, Season, SeasonAward, User
+from app.services.data_version import current_version
+from app.services.weekly_scores import load_weekly_scores
+
+CATEGORIES = ("regular", "playoff", "consolation")
+RECORD_FIELDS = ("wins", "losses", "ties")
+POINTS_FIELDS = ("points_for", "points_against")
+TROPHY_TYPES = ("champion", "division_winner", "most_points", "consolation", "bench_points")
+
+# Numeric owner_season_stats columns that career totals sum over
+TOTAL_COLUMNS: Tuple[str, ...] = tuple(
+    [f"{cat}_{field}" for cat in CATEGORIES for field in RECORD_FIELDS + POINTS_FIELDS]
+    + ["max_potential_points"]
+    + [f"median_{field}" for field in RECORD_FIELDS]
+    + [f"{trophy}_awards" for trophy in TROPHY_TYPES]
+)
+
+# Data version the table was last rebuilt at
+_stats_version: Optional[int] = None
+_refresh_lock = asyncio.Lock()
+
+
+def tally_matchups(matchups: Iterable[Any], roster_id: int) -> Dict[str, float]:
+    """Unrounded W-L-T and points by match_type for one roster, as
+    owner_season_stats column values."""
+    totals: Dict[str, float] = defaultdict(int)
+    for m in matchups:
+        cat = m.match_type or "regular"
+        if cat not in CATEGORIES:
+            cat = "regular"
+
+        is_home = m.home_roster_id == roster_id
+        my_points = m.home_points if is_home else m.away_points
+        opp_points = m.away_points if is_home else m.home_points
+        totals[f"{cat}_points_for"] += my_points or 0.0
+        totals[f"{cat}_points_against"] += opp_points or 0.0
+
+        # Max potential counts for the regular season only
+        if cat == "regular":
+            my_max_potential = m.home_max_potential_points if is_home else m.away_max_potential_points
+            if my_max_potential is not None:
+                totals["max_potential_points"] += my_max_potential
+
+        if m.winner_roster_id is None:
+            totals[f"{cat}_ties"] += 1
+        elif m.winner_roster_id == roster_id:
+            totals[f"{cat}_wins"] += 1
+        else:
+            totals[f"{cat}_losses"] += 1
+    return totals
+
+
+def categories_from_totals(totals: Dict[str, Any]) -> Dict[str, Dict]:
+    """Regular, playoff and consolation stats from owner_season_stats
+    column values (one row, or a rollup of several)."""
+    categories = {}
+    for cat in CATEGORIES:
+        stats: Dict[str, Any] = {
+            field: int(totals.get(f"{cat}_{field}") or 0) for field in RECORD_FIELDS
+        }
+        games = stats["wins"] + stats["losses"] + stats["ties"]
+        stats["points_for"] = round(totals.get(f"{cat}_points_for") or 0.0, 2)
+        stats["points_against"] = round(totals.get(f"{cat}_points_against") or 0.0, 2)
+        if cat == "regular":
+            stats["max_potential_points"] = round(totals.get("max_potential_points") or 0.0, 2)
+        stats["win_percentage"] = round(stats["wins"] / max(games, 1), 3)
+        if cat == "regular":
+            stats["points_left_on_bench"] = round(
+                stats["max_potential_points"] - stats["points_for"], 2
+            )
+        categories[cat] = stats
+    return categories
+
+
+def trophies_from_totals(totals: Dict[str, Any]) -> Dict[str, int]:
+    """Trophy counts by award type from owner_season_stats column values."""
+    return {trophy: int(totals.get(f"{trophy}_awards") or 0) for trophy in TROPHY_TYPES}
+
+
+def owner_career_stats(seasons_played: int, categories: Optional[Dict[str, Dict]]) -> Dict[str, Any]:
+    """Career stats from categorized stats over all of an owner's seasons."""
+    if not seasons_played:
+        empty_category = {
+            "wins": 0, "losses": 0, "ties": 0,
+            "points_for": 0.0, "points_against": 0.0,
+            "win_percentage": 0.0
+        }
+        return {
+            "seasons_played": 0,
+            "regular_season": dict(empty_category),
+            "playoff": dict(empty_category),
+            "consolation": dict(empty_category),
+            "total_wins": 0,
+            "total_losses": 0,
+            "total_ties": 0,
+            "total_points_for": 0,
+            "total_points_against": 0,
+            "career_win_percentage": 0.0,
+            "championships": 0,
+            "playoff_appearances": 0,
+        }
+
+    reg = categories["regular"]
+    return {
+        "seasons_played": seasons_played,
+        "regular_season": categories["regular"],
+        "playoff": categories["playoff"],
+        "consolation": categories["consolation"],
+        # Legacy flat fields (regular season)
+        "total_wins": reg["wins"],
+        "total_losses": reg["losses"],
+        "total_ties": reg["ties"],
+        "total_points_for": reg["points_for"],
+        "total_points_against": reg["points_against"],
+        "career_win_percentage": reg["win_percentage"],
+        "championships": 0,
+        "playoff_appearances": 0,
+    }
+
+
+def row_totals(row: OwnerSeasonStats) -> Dict[str, Any]:
+    """Numeric column values of one owner_season_stats row."""
+    return {column: getattr(row, column) for column in TOTAL_COLUMNS}
+
+
+def _division_name(roster: Roster, season: Season, league: Optional[League]) -> str:
+    """Division name from league metadata (division_1, division_2, ...)."""
+    default = f"Division {roster.division}"
+    if roster.division is None or not 1 <= roster.division <= (season.num_divisions or 2):
+        return default
+    league_metadata = (league.league_metadata if league else None) or {}
+    return league_metadata.get(f"division_{roster.division}", default)
+
+
+class OwnerStatsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_owners(self) -> List[dict]:
+        """Every owner with career stats and trophies, most regular-season
+        wins first."""
+        await self.ensure_fresh()
+
+        result = await self.db.execute(select(User))
+        users = result.scalars().all()
+
+        result = await self.db.execute(
+            select(
+                OwnerSeasonStats.user_id,
+                func.count(OwnerSeasonStats.id).label("seasons_played"),
+                *[func.sum(getattr(OwnerSeasonStats, c)).label(c) for c in TOTAL_COLUMNS],
+            ).group_by(OwnerSeasonStats.user_id)
+        )
+        career = {row.user_id: row._mapping for row in result.all()}
+
+        owners = []
+        for user in users:
+            totals = career.get(user.id, {})
+            seasons_played = totals.get("seasons_played") or 0
+            owners.append({
+                "user_id": user.id,
+                "username": user.username,
+                "display_name": user.display_name,
+                "avatar": user.avatar,
+                "trophies": trophies_from_totals(totals),
+                **owner_career_stats(
+                    seasons_played,
+                    categories_from_totals(totals) if seasons_played else None,
+                ),
+            })
+
+        # Sort by regular season wins descending
+        owners.sort(key=lambda x: x["total_wins"], reverse=True)
+        return owners
+
+    async def refresh_stats(self) -> dict:
+        """Rebuild owner_season_stats now.  Holds the refresh lock, so it
+        never runs alongside a read's ensure_fresh()."""
+        async with _refresh_lock:
+            return await self._refresh_stats()
+
+    async def _refresh_stats(self) -> dict:
+        """Rebuild owner_season_stats from matchups and awards."""
+        global _stats_version
+        version = current_version()
+
+        result = await self.db.execute(
+            select(Roster, Season, League)
+            .join(Season, Roster.season_id == Season.id)
+            .outerjoin(League, Season.league_id == League.id)
+            .where(Roster.user_id.isnot(None))
+        )
+        rosters = result.all()
+
+        result = await self.db.execute(
+            select(
+                Matchup.match_type,
+                Matchup.home_roster_id,
+                Matchup.away_roster_id,
+                Matchup.home_points,
+                Matchup.away_points,
+                Matchup.home_max_potential_points,
+                Matchup.away_max_potential_points,
+                Matchup.winner_roster_id,
+            )
+        )
+        matchups_by_roster: Dict[int, list] = defaultdict(list)
+        for m in result.all():
+            matchups_by_roster[m.home_roster_id].append(m)
+            matchups_by_roster[m.away_roster_id].append(m)
+        scores = await load_weekly_scores(self.db)
+        medians = {sid: season_scores.median_records() for sid, season_scores in scores.items()}
+
+        result = await self.db.execute(
+            select(SeasonAward.season_id, SeasonAward.user_id, SeasonAward.award_type)
+        )
+        awards: Dict[Tuple[int, str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for season_id, user_id, award_type in result.all():
+            if award_type in TROPHY_TYPES:
+                awards[(season_id, user_id)][award_type] += 1
+
+        result = await self.db.execute(select(OwnerSeasonStats))
+        stored = {row.roster_id: row for row in result.scalars().all()}
+
+        awarded = set()
+        for roster, season, league in rosters:
+            row = stored.pop(roster.id, None)
+            if row is None:
+                row = OwnerSeasonStats(roster_id=roster.id)
+                self.db.add(row)
+            row.user_id = roster.user_id
+            row.season_id = season.id
+            row.year = season.year
+            row.team_name = roster.team_name
+            row.division = roster.division
+            row.division_name = _division_name(roster, season, league)
+
+            totals = tally_matchups(matchups_by_roster.get(roster.id, []), roster.id)
+            median = medians.get(season.id, {}).get(roster.id, {})
+            for field in RECORD_FIELDS:
+                totals[f"median_{field}"] = median.get(field, 0)
+            # An owner's awards go on their (first) roster that season
+            key = (season.id, roster.user_id)
+            if key not in awarded:
+                awarded.add(key)
+                for trophy, count in awards.get(key, {}).items():
+                    totals[f"{trophy}_awards"] = count
+            for column in TOTAL_COLUMNS:
+                setattr(row, column, totals.get(column, 0))
+
+        if stored:
+            await self.db.execute(
+                delete(OwnerSeasonStats).where(
+                    OwnerSeasonStats.id.in_([row.id for row in stored.values()])
+                )
+            )
+
+        await self.db.commit()
+        _stats_version = version
+        return {"seasons": len(rosters), "removed": len(stored)}
+
+    async def ensure_fresh(self) -> None:
+        """Rebuild the table once per data version."""
+        if _stats_version == current_version():
+            return
+        async with _refresh_lock:
+            if _stats_version != current_version():
+                await self._refresh_stats()
@@ -0,0 +1,222 @@
+"""League-wide draft pick value curve.
+
+Expected weighted points per week by overall pick number, fitted from every
+completed league draft and kept separately for startup and rookie drafts.
+Each drafted player's production since their draft season (on any roster)
+is averaged per pick number, smoothed with a triangular kernel over
+neighbouring picks, and forced non-increasing so an earlier pick is never
+worth less than a later one.  Built once per data version; lookups by pick
+number or by (round, slot) are list/dict indexing.
+
+The production per pick is summed in SQL, one row per drafted player, so
+fitting the curve does not need the league-wide PlayerWeekStore; grading
+a single trade with an unused pick stays on its scoped store.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Draft, DraftPick, Matchup, MatchupPlayerPoint, Season
+from app.services.data_version import VersionedCache
+from app.services.player_weeks import (
+    BENCH_WEIGHT,
+    STARTER_WEIGHT,
+    latest_scored_week,
+)
+
+# Startup drafts have 20+ rounds; rookie drafts are shorter
+STARTUP_MIN_ROUNDS = 20
+DRAFT_TYPES = ("startup", "rookie")
+
+# Picks on either side of a pick number that feed its smoothed value
+SMOOTHING_RADIUS = 6
+
+CURVE_KEY = "pick_value_curve"
+_curve_cache = VersionedCache(max_entries=1)
+
+# (draft_type, pick_no, pick_in_round, weighted points per week)
+PickObservation = Tuple[str, int, int, float]
+
+
+def draft_type_for_rounds(rounds: Optional[int]) -> str:
+    """"startup" or "rookie" for a draft with this many rounds."""
+    return "startup" if (rounds or 0) >= STARTUP_MIN_ROUNDS else "rookie"
+
+
+def _smooth(totals: List[float], counts: List[int], radius: int) -> List[float]:
+    """Kernel-smoothed means, then pool-adjacent-violators so the result
+    never increases with pick number."""
+    n = len(totals)
+    blocks: List[List[float]] = []  # [value, weight, length]
+    for i in range(n):
+        value_sum = 0.0
+        weight_sum = 0.0
+        for j in range(max(0, i - radius), min(n, i + radius + 1)):
+            if counts[j]:
+                kernel = radius + 1 - abs(i - j)
+                value_sum += totals[j] * kernel
+                weight_sum += counts[j] * kernel
+        value = value_sum / weight_sum if weight_sum else 0.0
+        blocks.append([value, weight_sum or 1e-9, 1])
+        while len(blocks) > 1 and blocks[-2][0] < blocks[-1][0]:
+            v2, w2, l2 = blocks.pop()
+            v1, w1, l1 = blocks.pop()
+            blocks.append([(v1 * w1 + v2 * w2) / (w1 + w2), w1 + w2, l1 + l2])
+
+    smoothed: List[float] = []
+    for value, _, length in blocks:
+        smoothed.extend([value] * length)
+    return smoothed
+
+
+class PickValueCurve:
+    """Smoothed expected weighted points per week by overall pick number."""
+
+    def __init__(self, observations: Iterable[PickObservation]):
+        totals: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        counts: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.teams: Dict[str, int] = {}
+        for draft_type, pick_no, pick_in_round, ppw in observations:
+            totals[draft_type][pick_no] += ppw
+            counts[draft_type][pick_no] += 1
+            self.teams[draft_type] = max(self.teams.get(draft_type, 0), pick_in_round)
+
+        self.values: Dict[str, List[float]] = {}
+        self.observed: Dict[str, List[Optional[float]]] = {}
+        self.samples: Dict[str, List[int]] = {}
+        self.round_values: Dict[str, List[float]] = {}
+        for draft_type, by_pick in totals.items():
+            num_picks = max(by_pick)
+            pick_totals = [by_pick.get(no, 0.0) for no in range(1, num_picks + 1)]
+            pick_counts = [counts[draft_type].get(no, 0) for no in range(1, num_picks + 1)]
+            values = _smooth(pick_totals, pick_counts, SMOOTHING_RADIUS)
+            self.values[draft_type] = values
+            self.samples[draft_type] = pick_counts
+            self.observed[draft_type] = [
+                t / c if c else None for t, c in zip(pick_totals, pick_counts)
+            ]
+            teams = self.teams[draft_type]
+            self.round_values[draft_type] = [
+                sum(values[start:start + teams]) / len(values[start:start + teams])
+                for start in range(0, num_picks, teams)
+            ]
+
+    def pick_value(self, draft_type: str, pick_no: int) -> float:
+        """Expected weighted points per week for an overall pick number.
+        Picks past the fitted range take the last fitted value."""
+        values = self.values.get(draft_type)
+        if not values:
+            return 0.0
+        return values[min(max(pick_no, 1), len(values)) - 1]
+
+    def value(self, draft_type: str, round_num: int, slot: Optional[int] = None) -> float:
+        """Expected weighted points per week for a pick in a round, at its
+        slot when known and otherwise averaged over the round."""
+        teams = self.teams.get(draft_type)
+        if not teams or not round_num:
+            return 0.0
+        if slot is not None:
+            return self.pick_value(draft_type, (round_num - 1) * teams + slot)
+        rounds = self.round_values[draft_type]
+        return rounds[min(max(round_num, 1), len(rounds)) - 1]
+
+    def to_dict(self, draft_type: str) -> dict:
+        teams = self.teams.get(draft_type, 0)
+        values = self.values.get(draft_type, [])
+        return {
+            "draft_type": draft_type,
+            "teams": teams,
+            "drafted_players": sum(self.samples.get(draft_type, [])),
+            "picks": [
+                {
+                    "pick_no": i + 1,
+                    "round": i // teams + 1,
+                    "pick_in_round": i % teams + 1,
+                    "expected_ppw": round(value, 2),
+                    "observed_ppw": (
+                        round(self.observed[draft_type][i], 2)
+                        if self.observed[draft_type][i] is not None else None
+                    ),
+                    "samples": self.samples[draft_type][i],
+                }
+                for i, value in enumerate(values)
+            ],
+            "rounds": [
+                {"round": i + 1, "expected_ppw": round(value, 2)}
+                for i, value in enumerate(self.round_values.get(draft_type, []))
+            ],
+        }
+
+
+def _pick_production_query(latest_year: int):
+    """(rounds, pick_no, pick_in_round, weighted points, weeks) for every
+    completed draft's picks from before latest_year, totalling the
+    player's weeks on any roster since the draft season."""
+    weight = case(
+        (MatchupPlayerPoint.is_starter.is_(True), STARTER_WEIGHT),
+        else_=BENCH_WEIGHT,
+    )
+    # Per (player, season) totals, so the join to picks stays small
+    production = (
+        select(
+            MatchupPlayerPoint.player_id,
+            Season.year,
+            func.sum(func.coalesce(MatchupPlayerPoint.points, 0.0) * weight).label("weighted"),
+            func.count().label("weeks"),
+        )
+        .join(Matchup, MatchupPlayerPoint.matchup_id == Matchup.id)
+        .join(Season, Matchup.season_id == Season.id)
+        .group_by(MatchupPlayerPoint.player_id, Season.year)
+        .subquery()
+    )
+    return (
+        select(
+            Draft.rounds,
+            DraftPick.pick_no,
+            DraftPick.pick_in_round,
+            func.coalesce(func.sum(production.c.weighted), 0.0),
+            func.coalesce(func.sum(production.c.weeks), 0),
+        )
+        .join(DraftPick, Draft.id == DraftPick.draft_id)
+        .outerjoin(
+            production,
+            and_(
+                production.c.player_id == DraftPick.player_id,
+                production.c.year >= Draft.year,
+            ),
+        )
+        .where(
+            Draft.status == "complete",
+            DraftPick.player_id.isnot(None),
+            Draft.year <= latest_year,
+        )
+        .group_by(DraftPick.id, Draft.rounds, DraftPick.pick_no, DraftPick.pick_in_round)
+    )
+
+
+async def load_pick_value_curve(db: AsyncSession) -> PickValueCurve:
+    """The PickValueCurve for the current data version, fitted on first use
+    after a sync."""
+    cached = _curve_cache.get_many([CURVE_KEY])
+    if cached:
+        return cached[CURVE_KEY]
+
+    latest = await latest_scored_week(db)
+    observations: List[PickObservation] = []
+    # Drafts without a scored week since cannot say anything yet
+    if latest is not None:
+        result = await db.execute(_pick_production_query(latest[0]))
+        for rounds, pick_no, pick_in_round, weighted, weeks in result.all():
+            observations.append((
+                draft_type_for_rounds(rounds),
+                pick_no,
+                pick_in_round,
+                weighted / weeks if weeks else 0.0,
+            ))
+
+    curve = PickValueCurve(observations)
+    _curve_cache.set_many({CURVE_KEY: curve})
+    return curve
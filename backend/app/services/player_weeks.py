@@ -0,0 +1,238 @@
+"""Shared in-memory store of player-week scoring facts.
+
+Trade and draft grading both need every week a player scored, attributed
+to the owner of the roster it was scored on.  Rather than each grader
+re-running the matchup_player_points -> matchups -> seasons join and
+building its own tuple-keyed dict, the facts are loaded once per data
+version and sorted by (player, owner, season, week), so a player's weeks
+for one owner are a contiguous range and "value after week W" is a binary
+search plus a prefix-sum subtraction.  Only the sort key and the prefix
+sums are kept.
+
+Grading a single trade loads a store scoped to the trade's players and
+owners instead, unless the league-wide store is already cached.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Matchup, MatchupPlayerPoint, Roster, Season
+from app.services.data_version import VersionedCache
+
+# Weights for starter vs bench scoring (shared by trade and draft grading)
+STARTER_WEIGHT = 1.5
+BENCH_WEIGHT = 0.1
+
+STORE_KEY = "player_weeks"
+_store_cache = VersionedCache(max_entries=1)
+
+# (player_id, db_roster_id, user_id, season_year, week, points, is_starter)
+PlayerWeekRow = Tuple[str, int, Optional[str], int, int, float, bool]
+
+
+def _season_week(year: int, week: int) -> int:
+    """Sortable single integer for (season_year, week)."""
+    return year * 100 + week
+
+
+class PlayerWeekStore:
+    """Player-week prefix sums with per-(player, owner) ranges."""
+
+    def __init__(self, rows: Iterable[PlayerWeekRow]):
+        # One fact per (player, roster, season, week)
+        unique: Dict[Tuple[str, int, int, int], PlayerWeekRow] = {}
+        for row in rows:
+            unique[(row[0], row[1], row[3], row[4])] = row
+        ordered = sorted(
+            unique.values(), key=lambda r: (r[0], r[2] or "", r[3], r[4], r[1])
+        )
+
+        # Sortable (season, week) of each sorted row; ranges are searched on it
+        self.season_week = array("i")
+
+        # Prefix sums over the sorted rows
+        self._weighted = array("d", [0.0])
+        self._starters = array("i", [0])
+        self._benches = array("i", [0])
+
+        # season_week -> [rows, points] over every player, to spot re-synced weeks
+        self._week_totals: Dict[int, List] = {}
+
+        self._owner_ranges: Dict[Tuple[str, Optional[str]], Tuple[int, int]] = {}
+        self._player_owners: Dict[str, List[Optional[str]]] = {}
+        self.latest: Optional[Tuple[int, int]] = None
+
+        start = 0
+        prev_key = None
+        for i, (pid, rid, uid, year, week, pts, is_starter) in enumerate(ordered):
+            uid = uid or None
+            key = (pid, uid)
+            if key != prev_key:
+                if prev_key is not None:
+                    self._owner_ranges[prev_key] = (start, i)
+                start = i
+                prev_key = key
+                self._player_owners.setdefault(pid, []).append(uid)
+            pts = pts or 0.0
+            season_week = _season_week(year, week)
+            self.season_week.append(season_week)
+            totals = self._week_totals.setdefault(season_week, [0, 0.0])
+            totals[0] += 1
+            totals[1] += pts
+
+            weight = STARTER_WEIGHT if is_starter else BENCH_WEIGHT
+            self._weighted.append(self._weighted[-1] + pts * weight)
+            self._starters.append(self._starters[-1] + (1 if is_starter else 0))
+            self._benches.append(self._benches[-1] + (0 if is_starter else 1))
+
+            if self.latest is None or (year, week) > self.latest:
+                self.latest = (year, week)
+        if prev_key is not None:
+            self._owner_ranges[prev_key] = (start, len(ordered))
+
+    def __len__(self) -> int:
+        return len(self.season_week)
+
+    def _totals(self, lo: int, hi: int) -> Tuple[float, int, int]:
+        return (
+            self._weighted[hi] - self._weighted[lo],
+            self._starters[hi] - self._starters[lo],
+            self._benches[hi] - self._benches[lo],
+        )
+
+    def value_after(
+        self, player_id: str, user_id: str, year: int, week: int
+    ) -> Tuple[float, int, int]:
+        """(weighted_points, starter_weeks, bench_weeks) the player produced
+        on user_id's rosters strictly after (year, week)."""
+        lo, hi = self._owner_ranges.get((str(player_id), user_id), (0, 0))
+        i = bisect_right(self.season_week, _season_week(year, week), lo, hi)
+        return self._totals(i, hi)
+
+    def value_since(
+        self, player_id: str, user_id: str, year: int, week: int = 0
+    ) -> Tuple[float, int, int]:
+        """Like value_after, but from (year, week) inclusive."""
+        lo, hi = self._owner_ranges.get((str(player_id), user_id), (0, 0))
+        i = bisect_left(self.season_week, _season_week(year, week), lo, hi)
+        return self._totals(i, hi)
+
+    def player_value_since(
+        self, player_id: str, year: int, week: int = 0
+    ) -> Tuple[float, int, int]:
+        """value_since summed over every owner the player was rostered by."""
+        weighted, starters, benches = 0.0, 0, 0
+        for uid in self._player_owners.get(str(player_id), []):
+            w, s, b = self.value_since(player_id, uid, year, week)
+            weighted += w
+            starters += s
+            benches += b
+        return weighted, starters, benches
+
+    def week_fingerprints(self, year: int) -> Dict[str, List]:
+        """"season*100+week" -> [rows, points] for every week from the
+        start of `year`.  A week whose fingerprint changes was re-synced,
+        e.g. with final scores after a mid-week sync."""
+        since = _season_week(year, 0)
+        return {
+            str(season_week): [rows, round(points, 4)]
+            for season_week, (rows, points) in sorted(self._week_totals.items())
+            if season_week >= since
+        }
+
+    def owner_summary(
+        self, player_id: str, user_id: str
+    ) -> Tuple[int, int, float, Optional[int]]:
+        """(weeks, starter_weeks, weighted_points, last season*100+week) for
+        the player on user_id's rosters, for change detection."""
+        lo, hi = self._owner_ranges.get((str(player_id), user_id), (0, 0))
+        weighted, starters, _ = self._totals(lo, hi)
+        last = self.season_week[hi - 1] if hi > lo else None
+        return hi - lo, starters, round(weighted, 4), last
+
+
+def _player_week_query():
+    return (
+        select(
+            MatchupPlayerPoint.player_id,
+            MatchupPlayerPoint.roster_id,
+            Roster.user_id,
+            Season.year,
+            Matchup.week,
+            MatchupPlayerPoint.points,
+            MatchupPlayerPoint.is_starter,
+        )
+        .join(Matchup, MatchupPlayerPoint.matchup_id == Matchup.id)
+        .join(Season, Matchup.season_id == Season.id)
+        .outerjoin(Roster, MatchupPlayerPoint.roster_id == Roster.id)
+    )
+
+
+def _build_store(rows) -> PlayerWeekStore:
+    return PlayerWeekStore(
+        (pid, rid, uid, year, week, pts, bool(is_starter))
+        for pid, rid, uid, year, week, pts, is_starter in rows
+    )
+
+
+async def load_player_week_store(db: AsyncSession) -> PlayerWeekStore:
+    """The PlayerWeekStore for the current data version, loading it in one
+    query on first use after a sync."""
+    cached = _store_cache.get_many([STORE_KEY])
+    if cached:
+        return cached[STORE_KEY]
+
+    result = await db.execute(_player_week_query())
+    store = _build_store(result.all())
+    _store_cache.set_many({STORE_KEY: store})
+    return store
+
+
+async def load_scoped_player_week_store(
+    db: AsyncSession, player_ids: Iterable[str], roster_ids: Iterable[int]
+) -> PlayerWeekStore:
+    """A PlayerWeekStore holding only the given players' weeks on the given
+    rosters, so its load does not grow with the league's history.  The
+    league-wide store is returned instead when it is already cached.
+
+    latest is still the league's latest scored week, as in the full store.
+    """
+    cached = _store_cache.get_many([STORE_KEY])
+    if cached:
+        return cached[STORE_KEY]
+
+    player_ids = [str(pid) for pid in player_ids]
+    roster_ids = list(roster_ids)
+    rows = []
+    if player_ids and roster_ids:
+        result = await db.execute(
+            _player_week_query().where(
+                MatchupPlayerPoint.player_id.in_(player_ids),
+                MatchupPlayerPoint.roster_id.in_(roster_ids),
+            )
+        )
+        rows = result.all()
+    store = _build_store(rows)
+    store.latest = await latest_scored_week(db)
+    return store
+
+
+async def latest_scored_week(db: AsyncSession) -> Optional[Tuple[int, int]]:
+    """Latest (season_year, week) with any player points."""
+    result = await db.execute(
+        select(Season.year, Matchup.week)
+        .join(Season, Matchup.season_id == Season.id)
+        .where(
+            select(MatchupPlayerPoint.id)
+            .where(MatchupPlayerPoint.matchup_id == Matchup.id)
+            .exists()
+        )
+        .order_by(Season.year.desc(), Matchup.week.desc())
+        .limit(1)
+    )
+    row = result.first()
+    return (row.year, row.week) if row else None
@@ -0,0 +1,179 @@
+"""Playoff bracket compiler and simulator.
+
+League settings (team count, divisions, round length, reseeding) are
+compiled once into a BracketPlan.  The simulator then runs that plan for
+every Monte Carlo iteration without re-deriving the bracket layout.
+
+Sleeper settings used:
+- playoff_teams: number of playoff teams
+- divisions: number of divisions (division winners take the top seeds)
+- playoff_round_type: 0 = one week per round, 1 = two week championship,
+  2 = two weeks per round
+- playoff_seed_type: 0 = fixed bracket, 1 = reseed every round
+
+Brackets are padded to the next power of two; the missing slots become
+first round byes for the top seeds.
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_PLAYOFF_TEAMS = 6
+DEFAULT_DIVISIONS = 2
+
+ROUND_TYPE_ONE_WEEK = 0
+ROUND_TYPE_TWO_WEEK_FINAL = 1
+ROUND_TYPE_TWO_WEEK = 2
+
+SEED_TYPE_RESEED = 1
+
+
+class BracketPlan:
+    """Compiled playoff format.
+
+    slots lists first round seeds in bracket order (None marks a bye), so
+    slot 2k plays slot 2k+1 and winners keep their relative order.
+    round_weeks[r] is how many weeks round r lasts.  finish_start[r] is the
+    best finish position available to teams eliminated in round r.
+    """
+
+    __slots__ = (
+        "num_teams", "num_divisions", "reseed", "slots", "round_weeks",
+        "bye_seeds", "finish_start", "key",
+    )
+
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+    @property
+    def num_rounds(self) -> int:
+        return len(self.round_weeks)
+
+
+def _bracket_order(size: int) -> List[int]:
+    """Standard seeding order, e.g. 8 -> [1, 8, 4, 5, 2, 7, 3, 6]."""
+    order = [1]
+    while len(order) < size:
+        n = len(order) * 2
+        order = [s for seed in order for s in (seed, n + 1 - seed)]
+    return order
+
+
+@lru_cache(maxsize=32)
+def compile_bracket(
+    num_teams: int,
+    num_divisions: int = DEFAULT_DIVISIONS,
+    round_type: int = ROUND_TYPE_ONE_WEEK,
+    reseed: bool = False,
+) -> BracketPlan:
+    """Compile a playoff format into a reusable plan."""
+    num_teams = max(num_teams, 0)
+    size = 1
+    while size < num_teams:
+        size *= 2
+    num_rounds = size.bit_length() - 1
+
+    slots = tuple(
+        seed if seed <= num_teams else None for seed in _bracket_order(size)
+    )
+    num_byes = size - num_teams if num_teams > 1 else 0
+
+    if round_type == ROUND_TYPE_TWO_WEEK:
+        round_weeks = tuple(2 for _ in range(num_rounds))
+    elif round_type == ROUND_TYPE_TWO_WEEK_FINAL and num_rounds:
+        round_weeks = tuple(1 for _ in range(num_rounds - 1)) + (2,)
+    else:
+        round_weeks = tuple(1 for _ in range(num_rounds))
+
+    # Round r eliminates the teams finishing below the 2^(rounds-r-1) that
+    # advance, e.g. for 3 rounds: round 0 -> 5th, round 1 -> 3rd, final -> 2nd
+    finish_start = tuple(2 ** (num_rounds - r - 1) + 1 for r in range(num_rounds))
+
+    return BracketPlan(
+        num_teams=num_teams,
+        num_divisions=num_divisions,
+        reseed=reseed,
+        slots=slots,
+        round_weeks=round_weeks,
+        bye_seeds=frozenset(range(1, num_byes + 1)),
+        finish_start=finish_start,
+        key=(num_teams, num_divisions, round_type, reseed),
+    )
+
+
+def bracket_plan_from_settings(
+    settings: Optional[Dict], num_divisions: Optional[int] = None
+) -> BracketPlan:
+    """Compile the bracket described by a league's Sleeper settings."""
+    settings = settings or {}
+    if num_divisions is None:
+        num_divisions = settings.get("divisions") or DEFAULT_DIVISIONS
+    return compile_bracket(
+        int(settings.get("playoff_teams") or DEFAULT_PLAYOFF_TEAMS),
+        int(num_divisions),
+        int(settings.get("playoff_round_type") or ROUND_TYPE_ONE_WEEK),
+        settings.get("playoff_seed_type") == SEED_TYPE_RESEED,
+    )
+
+
+def simulate_bracket(
+    plan: BracketPlan,
+    play_game: Callable[[int, int, int], int],
+) -> Tuple[int, Dict[int, int]]:
+    """Run one playoff simulation over seeds.
+
+    play_game(seed_a, seed_b, weeks) returns the winning seed.  Returns
+    (champion_seed, finish_map: {seed: finish_position}).  Teams eliminated
+    in the same round are ordered by seed.
+    """
+    finish: Dict[int, int] = {}
+    if plan.num_teams == 0:
+        return 0, finish
+    if plan.num_teams == 1:
+        return 1, {1: 1}
+
+    alive = list(plan.slots)
+    for rnd, weeks in enumerate(plan.round_weeks):
+        if plan.reseed:
+            alive = _reseed_pairs(alive, rnd, plan.bye_seeds)
+
+        winners = []
+        losers = []
+        for i in range(0, len(alive), 2):
+            a, b = alive[i], alive[i + 1]
+            if b is None:
+                winners.append(a)
+            elif a is None:
+                winners.append(b)
+            else:
+                w = play_game(a, b, weeks)
+                winners.append(w)
+                losers.append(b if w == a else a)
+
+        for pos, seed in enumerate(sorted(losers), start=plan.finish_start[rnd]):
+            finish[seed] = pos
+        alive = winners
+
+    champion = alive[0]
+    finish[champion] = 1
+    return champion, finish
+
+
+def _reseed_pairs(alive: List[Optional[int]], rnd: int, bye_seeds) -> List[Optional[int]]:
+    """Pair the best remaining seed with the worst for a reseeded round."""
+    if rnd == 0:
+        # First round: byes sit out, the rest play best vs worst
+        playing = sorted(s for s in alive if s is not None and s not in bye_seeds)
+        pairs: List[Optional[int]] = []
+        for seed in sorted(bye_seeds):
+            pairs.extend((seed, None))
+        while playing:
+            pairs.extend((playing.pop(0), playing.pop() if playing else None))
+        return pairs
+
+    seeds = sorted(s for s in alive if s is not None)
+    pairs = []
+    while seeds:
+        pairs.extend((seeds.pop(0), seeds.pop() if seeds else None))
+    return pairs
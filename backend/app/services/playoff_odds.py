@@ -1,19 +1,31 @@
 """Monte Carlo simulation engine for playoff odds calculation."""
 
+import hashlib
+import json
 import random
-import math
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from statistics import median as calc_median
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 
 from app.models import Season, Roster, User, League, Matchup
+from app.services.playoff_bracket import (
+    BracketPlan,
+    bracket_plan_from_settings,
+    compile_bracket,
+    simulate_bracket,
+)
+from app.services.score_models import NormalScoreModel, ScoreModel, build_score_model
+from app.services.weekly_scores import SeasonScores, is_decided, load_weekly_scores
 
 NUM_SIMULATIONS = 10_000
-NUM_PLAYOFF_TEAMS = 6
-NUM_DIVISIONS = 2
+
+# Simulation counters keyed by (season state fingerprint, score model,
+# scenario hash)
+SIMULATION_CACHE_SIZE = 64
+_SIMULATION_CACHE: "OrderedDict[Tuple, Dict[str, Dict[int, float]]]" = OrderedDict()
 
 
 class TeamState:
@@ -41,6 +53,104 @@ class TeamState:
         return (-self.total_wins(), -self.points_for, -self.points_against)
 
 
+class SimTeam:
+    """A team's view into a TeamStatePool.
+
+    Static fields are copied once per run; the mutable record reads through
+    to the pool's arrays, so views are never rebuilt between simulations.
+    """
+
+    __slots__ = (
+        "_pool", "_i", "roster_db_id", "division", "points_against",
+        "max_potential_points", "avg_ppg", "rating",
+    )
+
+    def __init__(self, pool: "TeamStatePool", i: int, team: TeamState, rating: float):
+        self._pool = pool
+        self._i = i
+        self.roster_db_id = team.roster_db_id
+        self.division = team.division
+        self.points_against = team.points_against
+        self.max_potential_points = team.max_potential_points
+        self.avg_ppg = team.avg_ppg
+        self.rating = rating
+
+    @property
+    def wins(self) -> int:
+        return self._pool.wins[self._i]
+
+    @property
+    def losses(self) -> int:
+        return self._pool.losses[self._i]
+
+    @property
+    def median_wins(self) -> int:
+        return self._pool.median_wins[self._i]
+
+    @property
+    def median_losses(self) -> int:
+        return self._pool.median_losses[self._i]
+
+    @property
+    def points_for(self) -> float:
+        return self._pool.points_for[self._i]
+
+    def total_wins(self) -> int:
+        pool, i = self._pool, self._i
+        return pool.wins[i] + pool.median_wins[i]
+
+    def total_losses(self) -> int:
+        pool, i = self._pool, self._i
+        return pool.losses[i] + pool.median_losses[i]
+
+    def tiebreaker_key(self) -> Tuple:
+        """Sort key for tiebreaking: (total wins desc, PF desc, PA desc)."""
+        pool, i = self._pool, self._i
+        return (
+            -(pool.wins[i] + pool.median_wins[i]),
+            -pool.points_for[i],
+            -self.points_against,
+        )
+
+
+class TeamStatePool:
+    """Flat, preallocated simulation state for every team in a season.
+
+    Index i in each counter array belongs to roster_db_ids[i].  reset()
+    restores the starting record in place at the top of each simulation.
+    """
+
+    __slots__ = (
+        "roster_db_ids", "index", "views", "team_at",
+        "wins", "losses", "median_wins", "median_losses", "points_for",
+        "_start",
+    )
+
+    def __init__(self, teams: Dict[int, TeamState], rating_overrides: Dict[int, float]):
+        self.roster_db_ids = list(teams)
+        self.index = {rid: i for i, rid in enumerate(self.roster_db_ids)}
+        self._start = tuple(
+            [getattr(teams[rid], field) for rid in self.roster_db_ids]
+            for field in ("wins", "losses", "median_wins", "median_losses", "points_for")
+        )
+        self.wins, self.losses, self.median_wins, self.median_losses, self.points_for = (
+            list(start) for start in self._start
+        )
+        self.team_at = [
+            SimTeam(self, i, teams[rid], rating_overrides.get(rid, teams[rid].rating))
+            for i, rid in enumerate(self.roster_db_ids)
+        ]
+        self.views = dict(zip(self.roster_db_ids, self.team_at))
+
+    def reset(self) -> None:
+        start = self._start
+        self.wins[:] = start[0]
+        self.losses[:] = start[1]
+        self.median_wins[:] = start[2]
+        self.median_losses[:] = start[3]
+        self.points_for[:] = start[4]
+
+
 def _compute_team_rating(team: TeamState, games_played: int) -> float:
     """Compute a composite team rating scaled to ~600-1000."""
     if games_played == 0:
@@ -63,26 +173,15 @@ def _compute_team_rating(team: TeamState, games_played: int) -> float:
     return round(600 + composite * 400)
 
 
-def _win_probability(rating_a: float, rating_b: float) -> float:
-    """Logistic win probability based on rating difference."""
-    diff = rating_a - rating_b
-    return 1.0 / (1.0 + math.exp(-diff / 60.0))
-
-
-def _simulate_score(team: TeamState, rng: random.Random) -> float:
-    """Simulate a game score for a team based on their average and variance."""
-    # Use normal distribution centered on avg_ppg with reasonable spread
-    std_dev = max(team.avg_ppg * 0.15, 10.0)
-    return max(rng.gauss(team.avg_ppg, std_dev), 30.0)
-
-
 def _determine_playoff_teams(
     teams: Dict[int, TeamState],
-) -> Tuple[List[int], Dict[int, int]]:
+    plan: BracketPlan,
+) -> Tuple[List[int], Dict[int, int], int]:
     """Determine which teams make playoffs and their seeds.
 
-    Returns (playoff_roster_db_ids, seed_map: {roster_db_id: seed}).
-    Seeds: 1-2 = division winners (bye), 3-6 = wild cards.
+    Returns (playoff_roster_db_ids, seed_map: {roster_db_id: seed},
+    num_division_winners).  Division winners take the top seeds and the
+    remaining spots go to wild cards by overall record.
     """
     # Find division winners
     division_teams: Dict[int, List[TeamState]] = defaultdict(list)
@@ -90,83 +189,85 @@ def _determine_playoff_teams(
         division_teams[t.division].append(t)
 
     division_winners = []
-    for div in sorted(division_teams.keys()):
+    for div in sorted(division_teams.keys(), key=lambda d: (d is None, d)):
         div_sorted = sorted(division_teams[div], key=lambda t: t.tiebreaker_key())
         division_winners.append(div_sorted[0])
 
-    div_winner_ids = {t.roster_db_id for t in division_winners}
-
-    # Sort division winners between themselves for seeds 1-2
+    # Sort division winners between themselves for the top seeds
     division_winners.sort(key=lambda t: t.tiebreaker_key())
+    division_winners = division_winners[:plan.num_teams]
+    div_winner_ids = {t.roster_db_id for t in division_winners}
 
-    # Wild cards: top 4 non-division-winners by overall record
+    # Wild cards: best non-division-winners by overall record
     non_winners = [t for t in teams.values() if t.roster_db_id not in div_winner_ids]
     non_winners.sort(key=lambda t: t.tiebreaker_key())
-    wild_cards = non_winners[:4]
+    wild_cards = non_winners[:plan.num_teams - len(division_winners)]
 
-    # Build seed map
-    seed_map = {}
-    for i, t in enumerate(division_winners):
-        seed_map[t.roster_db_id] = i + 1  # Seeds 1-2
-    for i, t in enumerate(wild_cards):
-        seed_map[t.roster_db_id] = i + 3  # Seeds 3-6
-
-    playoff_ids = [t.roster_db_id for t in division_winners + wild_cards]
-    return playoff_ids, seed_map
+    playoff_teams = division_winners + wild_cards
+    seed_map = {t.roster_db_id: i + 1 for i, t in enumerate(playoff_teams)}
+    playoff_ids = [t.roster_db_id for t in playoff_teams]
+    return playoff_ids, seed_map, len(division_winners)
 
 
 def _simulate_playoff_bracket(
+    plan: BracketPlan,
     seed_map: Dict[int, int],
     teams: Dict[int, TeamState],
     rng: random.Random,
+    score_model: ScoreModel,
 ) -> Tuple[int, Dict[int, int]]:
-    """Simulate a single-elimination playoff bracket.
-
-    Bracket: Seeds 1-2 get byes. Round 1: 3v6, 4v5.
-    Semis: 1 vs winner(4v5), 2 vs winner(3v6).
-    Finals: semi winners.
+    """Simulate the league's playoff bracket.
 
     Returns (champion_roster_db_id, finish_map: {roster_db_id: finish_position}).
-    Finish positions: 1=champion, 2=runner-up, 3-4=semi losers, 5-6=round1 losers.
     """
     by_seed = {seed: rid for rid, seed in seed_map.items()}
 
-    def play_game(rid_a, rid_b):
-        prob = _win_probability(teams[rid_a].rating, teams[rid_b].rating)
-        return rid_a if rng.random() < prob else rid_b
-
-    # Round 1
-    r1_winner_a = play_game(by_seed[3], by_seed[6])
-    r1_loser_a = by_seed[6] if r1_winner_a == by_seed[3] else by_seed[3]
-    r1_winner_b = play_game(by_seed[4], by_seed[5])
-    r1_loser_b = by_seed[5] if r1_winner_b == by_seed[4] else by_seed[4]
-
-    # Semis
-    semi_winner_a = play_game(by_seed[1], r1_winner_b)
-    semi_loser_a = r1_winner_b if semi_winner_a == by_seed[1] else by_seed[1]
-    semi_winner_b = play_game(by_seed[2], r1_winner_a)
-    semi_loser_b = r1_winner_a if semi_winner_b == by_seed[2] else by_seed[2]
-
-    # Finals
-    champion = play_game(semi_winner_a, semi_winner_b)
-    runner_up = semi_winner_b if champion == semi_winner_a else semi_winner_a
-
-    finish = {
-        champion: 1,
-        runner_up: 2,
-        semi_loser_a: 3,
-        semi_loser_b: 4,
-        r1_loser_a: 5,
-        r1_loser_b: 6,
+    def play_game(seed_a, seed_b, weeks):
+        team_a = teams[by_seed[seed_a]]
+        team_b = teams[by_seed[seed_b]]
+        return seed_a if score_model.play_game(team_a, team_b, rng, weeks) else seed_b
+
+    champion_seed, finish_by_seed = simulate_bracket(plan, play_game)
+    finish = {by_seed[seed]: pos for seed, pos in finish_by_seed.items()}
+    return by_seed[champion_seed], finish
+
+
+class SeasonState:
+    """Precomputed inputs for a season's simulation.
+
+    Built once per request and shared between the baseline run and any
+    what-if scenarios so the database is only read once.
+    """
+
+    __slots__ = (
+        "season_year", "current_week", "regular_season_weeks",
+        "division_names", "teams", "remaining_by_week", "remaining_games",
+        "bracket", "fingerprint",
+    )
+
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+
+def _not_started_response(season: Season) -> Dict[str, Any]:
+    return {
+        "season": season.year,
+        "season_started": False,
+        "current_week": 0,
+        "regular_season_weeks": season.regular_season_weeks,
+        "playoff_odds": [],
+        "draft_order": [],
+        "draft_probabilities": [],
     }
-    return champion, finish
 
 
-async def calculate_playoff_odds(
-    db: AsyncSession, season_year: int
-) -> Dict[str, Any]:
-    """Run Monte Carlo simulation for playoff odds."""
+async def _load_season_inputs(db: AsyncSession, season_year: int):
+    """Read the season, division names, rosters and regular season matchups.
 
+    Returns (season, division_names, rosters_with_users, matchups, bracket,
+    scores), or None if the season does not exist.
+    """
     # Get season
     result = await db.execute(
         select(Season).where(Season.year == season_year)
@@ -195,74 +296,112 @@ async def calculate_playoff_odds(
     )
     rosters_with_users = result.all()
 
-    if not rosters_with_users:
-        return {
-            "season": season_year,
-            "season_started": False,
-            "current_week": 0,
-            "regular_season_weeks": season.regular_season_weeks,
-            "playoff_odds": [],
-            "draft_order": [],
-        }
-
     # Get all regular season matchups
-    result = await db.execute(
-        select(Matchup).where(
-            Matchup.season_id == season.id,
-            Matchup.match_type == "regular",
+    all_matchups = []
+    if rosters_with_users:
+        result = await db.execute(
+            select(Matchup).where(
+                Matchup.season_id == season.id,
+                Matchup.match_type == "regular",
+            )
         )
+        all_matchups = result.scalars().all()
+
+    # Playoff format, capped at the number of teams in the league
+    plan = bracket_plan_from_settings(
+        league.settings if league else None, season.num_divisions
     )
-    all_matchups = result.scalars().all()
+    if rosters_with_users and len(rosters_with_users) < plan.num_teams:
+        plan = compile_bracket(len(rosters_with_users), *plan.key[1:])
 
-    # Determine current week from played matchups
-    played_weeks = {m.week for m in all_matchups if m.winner_roster_id is not None}
-    current_week = max(played_weeks) if played_weeks else 0
+    scores = (await load_weekly_scores(db, [season.id]))[season.id]
+
+    return season, division_names, rosters_with_users, all_matchups, plan, scores
+
+
+def _build_season_state(
+    season: Season,
+    division_names: Dict[str, str],
+    rosters_with_users: List,
+    all_matchups: List[Matchup],
+    bracket: BracketPlan,
+    scores: SeasonScores,
+    through_week: Optional[int] = None,
+) -> Optional[SeasonState]:
+    """Build the simulation state from loaded rows.
+
+    With through_week set, the state is reconstructed as it stood after that
+    week: records come from the matchups played up to then and every later
+    game is treated as remaining.  Returns None if no games had been played.
+    """
+    if not rosters_with_users:
+        return None
+
+    def is_played(m: Matchup) -> bool:
+        if not is_decided(m.winner_roster_id, m.home_points, m.away_points):
+            return False
+        return through_week is None or m.week <= through_week
 
+    played = [m for m in all_matchups if is_played(m)]
+
+    # Determine current week from played matchups
+    current_week = max((m.week for m in played), default=0)
     if current_week == 0:
-        return {
-            "season": season_year,
-            "season_started": False,
-            "current_week": 0,
-            "regular_season_weeks": season.regular_season_weeks,
-            "playoff_odds": [],
-            "draft_order": [],
-        }
+        return None
 
     # Calculate median records from played matchups
-    week_scores: Dict[int, list] = defaultdict(list)
-    for m in all_matchups:
-        if m.winner_roster_id is not None:
-            week_scores[m.week].append((m.home_roster_id, m.home_points or 0))
-            week_scores[m.week].append((m.away_roster_id, m.away_points or 0))
-
-    median_records: Dict[int, Dict[str, int]] = defaultdict(
-        lambda: {"wins": 0, "losses": 0}
+    median_records = scores.median_records(
+        through_week=through_week, played_only=True
     )
-    for scores in week_scores.values():
-        if len(scores) < 2:
-            continue
-        all_points = [s[1] for s in scores]
-        week_median = calc_median(all_points)
-        for roster_id, pts in scores:
-            if pts > week_median:
-                median_records[roster_id]["wins"] += 1
-            elif pts < week_median:
-                median_records[roster_id]["losses"] += 1
 
     # Calculate max potential points from played matchups
     max_potential_stats: Dict[int, float] = defaultdict(float)
-    for m in all_matchups:
-        if m.winner_roster_id is not None:
-            if m.home_max_potential_points is not None:
-                max_potential_stats[m.home_roster_id] += m.home_max_potential_points
-            if m.away_max_potential_points is not None:
-                max_potential_stats[m.away_roster_id] += m.away_max_potential_points
+    for m in played:
+        if m.home_max_potential_points is not None:
+            max_potential_stats[m.home_roster_id] += m.home_max_potential_points
+        if m.away_max_potential_points is not None:
+            max_potential_stats[m.away_roster_id] += m.away_max_potential_points
+
+    # Records as of through_week are rebuilt from the matchups themselves;
+    # otherwise the synced roster totals are authoritative.
+    records: Dict[int, Dict[str, float]] = {}
+    if through_week is not None:
+        records = defaultdict(
+            lambda: {"wins": 0, "losses": 0, "ties": 0, "points_for": 0.0, "points_against": 0.0}
+        )
+        for m in played:
+            home, away = records[m.home_roster_id], records[m.away_roster_id]
+            if m.winner_roster_id is None:
+                home["ties"] += 1
+                away["ties"] += 1
+            elif m.winner_roster_id == m.home_roster_id:
+                home["wins"] += 1
+                away["losses"] += 1
+            else:
+                away["wins"] += 1
+                home["losses"] += 1
+            home["points_for"] += m.home_points or 0
+            home["points_against"] += m.away_points or 0
+            away["points_for"] += m.away_points or 0
+            away["points_against"] += m.home_points or 0
 
     # Build team states
     teams: Dict[int, TeamState] = {}
     for roster, user in rosters_with_users:
-        games_played = roster.wins + roster.losses + roster.ties
-        avg_ppg = roster.points_for / max(games_played, 1) if games_played > 0 else 100.0
+        if through_week is None:
+            wins, losses, ties = roster.wins, roster.losses, roster.ties
+            points_for = roster.points_for or 0
+            points_against = roster.points_against or 0
+        else:
+            rec = records.get(
+                roster.id, {"wins": 0, "losses": 0, "ties": 0, "points_for": 0, "points_against": 0}
+            )
+            wins, losses, ties = rec["wins"], rec["losses"], rec["ties"]
+            points_for = round(rec["points_for"], 2)
+            points_against = round(rec["points_against"], 2)
+
+        games_played = wins + losses + ties
+        avg_ppg = points_for / max(games_played, 1) if games_played > 0 else 100.0
         med = median_records.get(roster.id, {"wins": 0, "losses": 0})
 
         team = TeamState(
@@ -274,12 +413,12 @@ async def calculate_playoff_odds(
             team_name=roster.team_name,
             avatar=user.avatar,
             division=roster.division,
-            wins=roster.wins,
-            losses=roster.losses,
+            wins=wins,
+            losses=losses,
             median_wins=med["wins"],
             median_losses=med["losses"],
-            points_for=roster.points_for or 0,
-            points_against=roster.points_against or 0,
+            points_for=points_for,
+            points_against=points_against,
             max_potential_points=max_potential_stats.get(roster.id, 0.0),
             avg_ppg=avg_ppg,
             rating=0.0,
@@ -287,15 +426,81 @@ async def calculate_playoff_odds(
         team.rating = _compute_team_rating(team, games_played)
         teams[roster.id] = team
 
-    # Identify remaining matchups (unplayed regular season games)
-    remaining_matchups = [
-        m for m in all_matchups if m.winner_roster_id is None
-    ]
+    # Group remaining (unplayed) games by week for the weekly median
+    remaining_by_week: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+    for m in sorted(all_matchups, key=lambda m: (m.week, m.id)):
+        if not is_played(m):
+            remaining_by_week[m.week].append(
+                (m.id, m.home_roster_id, m.away_roster_id)
+            )
 
-    remaining_weeks = season.regular_season_weeks - current_week
+    remaining_games = {
+        game[0]: game for games in remaining_by_week.values() for game in games
+    }
+
+    fingerprint = hash((
+        season.id,
+        current_week,
+        tuple(
+            (t.roster_db_id, t.division, t.wins, t.losses, t.median_wins,
+             t.median_losses, t.points_for, t.points_against,
+             t.max_potential_points, t.rating)
+            for t in teams.values()
+        ),
+        tuple(sorted(remaining_games.items())),
+        bracket.key,
+    ))
+
+    return SeasonState(
+        season_year=season.year,
+        current_week=current_week,
+        regular_season_weeks=season.regular_season_weeks,
+        division_names=division_names,
+        teams=teams,
+        remaining_by_week=dict(remaining_by_week),
+        remaining_games=remaining_games,
+        bracket=bracket,
+        fingerprint=fingerprint,
+    )
 
-    # Run Monte Carlo simulations
-    rng = random.Random(42)  # Deterministic seed for consistency
+
+async def _load_season_state(
+    db: AsyncSession, season_year: int
+) -> Tuple[Optional[Season], Optional[SeasonState]]:
+    """Load everything the simulation needs for a season.
+
+    Returns (season, state).  season is None when the season does not exist;
+    state is None when the season has not started yet.
+    """
+    inputs = await _load_season_inputs(db, season_year)
+    if inputs is None:
+        return None, None
+    season = inputs[0]
+    return season, _build_season_state(*inputs)
+
+
+def _run_simulations(
+    state: SeasonState,
+    forced_results: Optional[Dict[int, int]] = None,
+    rating_overrides: Optional[Dict[int, float]] = None,
+    score_model: Optional[ScoreModel] = None,
+) -> Dict[str, Dict[int, float]]:
+    """Run the Monte Carlo loop over a precomputed season state.
+
+    forced_results maps matchup db id -> winning roster db id for games whose
+    outcome is locked.  rating_overrides maps roster db id -> team rating.
+    score_model defaults to the normal model.  Returns the per-team counters
+    accumulated across all simulations.
+    """
+    forced_results = forced_results or {}
+    rating_overrides = rating_overrides or {}
+    score_model = score_model or NormalScoreModel()
+    teams = state.teams
+    plan = state.bracket
+
+    # Deterministic seed for consistency.  Scenarios reuse the baseline seed
+    # so their deltas reflect the locked outcomes rather than sampling noise.
+    rng = random.Random(42)
 
     # Counters
     made_playoffs = defaultdict(int)
@@ -306,127 +511,223 @@ async def calculate_playoff_odds(
     projected_losses = defaultdict(float)
     projected_median_wins = defaultdict(float)
     projected_median_losses = defaultdict(float)
+    # draft_slots[rid][i] counts simulations where the team picks i + 1
+    draft_slots = {rid: [0] * len(teams) for rid in teams}
+
+    # Max potential points grow with simulated points at the team's current
+    # max-potential-to-actual ratio
+    mpp_ratio = {
+        rid: (t.max_potential_points / t.points_for) if t.points_for else 1.0
+        for rid, t in teams.items()
+    }
+
+    # Per-simulation state lives in flat arrays that are reset in place
+    # (scripts/benchmark_playoff_simulations.py times this loop)
+    pool = TeamStatePool(teams, rating_overrides)
+    sim_teams = pool.views
+    wins, losses = pool.wins, pool.losses
+    median_wins, median_losses = pool.median_wins, pool.median_losses
+    points_for = pool.points_for
+    index = pool.index
+    team_at = pool.team_at
+
+    # Remaining schedule resolved to pool indexes once
+    schedule = [
+        [
+            (matchup_id, home_rid, index[home_rid], index[away_rid])
+            for matchup_id, home_rid, away_rid in matchups
+            if home_rid in index and away_rid in index
+        ]
+        for matchups in state.remaining_by_week.values()
+    ]
 
     for _ in range(NUM_SIMULATIONS):
-        # Clone team states for this simulation
-        sim_teams: Dict[int, TeamState] = {}
-        for rid, t in teams.items():
-            sim_teams[rid] = TeamState(
-                roster_db_id=t.roster_db_id,
-                roster_id=t.roster_id,
-                user_id=t.user_id,
-                display_name=t.display_name,
-                username=t.username,
-                team_name=t.team_name,
-                avatar=t.avatar,
-                division=t.division,
-                wins=t.wins,
-                losses=t.losses,
-                median_wins=t.median_wins,
-                median_losses=t.median_losses,
-                points_for=t.points_for,
-                points_against=t.points_against,
-                max_potential_points=t.max_potential_points,
-                avg_ppg=t.avg_ppg,
-                rating=t.rating,
-            )
+        pool.reset()
 
         # Simulate remaining games
-        # Group remaining matchups by week for median calculation
-        remaining_by_week: Dict[int, List[Matchup]] = defaultdict(list)
-        for m in remaining_matchups:
-            remaining_by_week[m.week].append(m)
-
-        for week, matchups in remaining_by_week.items():
+        for matchups in schedule:
             week_sim_scores = []
 
-            for m in matchups:
-                home = sim_teams.get(m.home_roster_id)
-                away = sim_teams.get(m.away_roster_id)
-                if not home or not away:
-                    continue
+            for matchup_id, home_rid, hi, ai in matchups:
+                home = team_at[hi]
+                away = team_at[ai]
+
+                home_score = score_model.sample(home, rng)
+                away_score = score_model.sample(away, rng)
 
-                home_score = _simulate_score(home, rng)
-                away_score = _simulate_score(away, rng)
+                # Let the score model pick the winner unless the outcome is locked
+                home_wins = score_model.first_team_wins(
+                    home, away, home_score, away_score, rng
+                )
+                if matchup_id in forced_results:
+                    home_wins = forced_results[matchup_id] == home_rid
 
-                # Apply rating-based adjustment
-                prob = _win_probability(home.rating, away.rating)
-                if rng.random() < prob:
+                if home_wins:
                     # Home wins - ensure score reflects it
                     if home_score <= away_score:
                         home_score, away_score = away_score, home_score
-                    home.wins += 1
-                    away.losses += 1
+                    wins[hi] += 1
+                    losses[ai] += 1
                 else:
                     # Away wins
                     if away_score <= home_score:
                         home_score, away_score = away_score, home_score
-                    away.wins += 1
-                    home.losses += 1
+                    wins[ai] += 1
+                    losses[hi] += 1
 
-                home.points_for += home_score
-                away.points_for += away_score
-                week_sim_scores.append((m.home_roster_id, home_score))
-                week_sim_scores.append((m.away_roster_id, away_score))
+                points_for[hi] += home_score
+                points_for[ai] += away_score
+                week_sim_scores.append((hi, home_score))
+                week_sim_scores.append((ai, away_score))
 
             # Simulate median for this week
             if len(week_sim_scores) >= 2:
-                all_pts = [s[1] for s in week_sim_scores]
-                week_med = calc_median(all_pts)
-                for rid, pts in week_sim_scores:
-                    st = sim_teams.get(rid)
-                    if st:
-                        if pts > week_med:
-                            st.median_wins += 1
-                        elif pts < week_med:
-                            st.median_losses += 1
+                week_med = calc_median([pts for _, pts in week_sim_scores])
+                for i, pts in week_sim_scores:
+                    if pts > week_med:
+                        median_wins[i] += 1
+                    elif pts < week_med:
+                        median_losses[i] += 1
 
         # Determine playoff teams
-        playoff_ids, seed_map = _determine_playoff_teams(sim_teams)
+        playoff_ids, seed_map, num_div_winners = _determine_playoff_teams(
+            sim_teams, plan
+        )
 
         for rid in playoff_ids:
             made_playoffs[rid] += 1
         for rid, seed in seed_map.items():
-            if seed <= NUM_DIVISIONS:
+            if seed <= num_div_winners:
                 won_division[rid] += 1
+            if seed in plan.bye_seeds:
                 got_bye[rid] += 1
 
         # Simulate playoff bracket
-        if len(seed_map) >= NUM_PLAYOFF_TEAMS:
+        finish_map = None
+        if len(seed_map) >= plan.num_teams:
             champion, finish_map = _simulate_playoff_bracket(
-                seed_map, sim_teams, rng
+                plan, seed_map, sim_teams, rng, score_model
             )
             won_finals[champion] += 1
 
+        # Draft slots: non-playoff teams by lowest max potential points,
+        # then playoff teams by finish (champion picks last)
+        non_playoff = [rid for rid in sim_teams if rid not in seed_map]
+        non_playoff.sort(key=lambda rid: teams[rid].max_potential_points + (
+            points_for[index[rid]] - teams[rid].points_for
+        ) * mpp_ratio[rid])
+        playoff_rank = finish_map or seed_map
+        playoff_order = sorted(seed_map, key=lambda rid: -playoff_rank[rid])
+        for pick, rid in enumerate(non_playoff + playoff_order):
+            draft_slots[rid][pick] += 1
+
         # Accumulate projected records
-        for rid, st in sim_teams.items():
-            projected_wins[rid] += st.wins
-            projected_losses[rid] += st.losses
-            projected_median_wins[rid] += st.median_wins
-            projected_median_losses[rid] += st.median_losses
+        for i, rid in enumerate(pool.roster_db_ids):
+            projected_wins[rid] += wins[i]
+            projected_losses[rid] += losses[i]
+            projected_median_wins[rid] += median_wins[i]
+            projected_median_losses[rid] += median_losses[i]
+
+    return {
+        "made_playoffs": made_playoffs,
+        "won_division": won_division,
+        "got_bye": got_bye,
+        "won_finals": won_finals,
+        "projected_wins": projected_wins,
+        "projected_losses": projected_losses,
+        "projected_median_wins": projected_median_wins,
+        "projected_median_losses": projected_median_losses,
+        "draft_slots": draft_slots,
+    }
+
+
+def _scenario_hash(
+    forced_results: Optional[Dict[int, int]],
+    rating_overrides: Optional[Dict[int, float]],
+) -> str:
+    """Stable hash of a scenario's locked outcomes and rating overrides."""
+    payload = json.dumps(
+        {
+            "forced": sorted((forced_results or {}).items()),
+            "ratings": sorted((rating_overrides or {}).items()),
+        },
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _cached_simulation(
+    state: SeasonState,
+    forced_results: Optional[Dict[int, int]] = None,
+    rating_overrides: Optional[Dict[int, float]] = None,
+    score_model: Optional[ScoreModel] = None,
+) -> Dict[str, Dict[int, float]]:
+    """Run (or reuse) a simulation keyed by season state, score model and
+    scenario hash.
+
+    The state fingerprint changes whenever the underlying records or
+    schedule change, so stale entries simply age out of the LRU.
+    """
+    score_model = score_model or NormalScoreModel()
+    key = (
+        state.fingerprint,
+        score_model.cache_key(),
+        _scenario_hash(forced_results, rating_overrides),
+    )
+    counters = _SIMULATION_CACHE.get(key)
+    if counters is not None:
+        _SIMULATION_CACHE.move_to_end(key)
+        return counters
+
+    counters = _run_simulations(state, forced_results, rating_overrides, score_model)
+    _SIMULATION_CACHE[key] = counters
+    if len(_SIMULATION_CACHE) > SIMULATION_CACHE_SIZE:
+        _SIMULATION_CACHE.popitem(last=False)
+    return counters
+
+
+def _pct(count: float) -> float:
+    return round(count / NUM_SIMULATIONS * 100, 0)
+
+
+def _fmt_pct(val: float) -> str:
+    """Format percentages nicely."""
+    if val >= 99.5:
+        return ">99%"
+    elif val <= 0.5 and val > 0:
+        return "<1%"
+    else:
+        return f"{int(val)}%"
+
+
+async def calculate_playoff_odds(
+    db: AsyncSession, season_year: int, score_model: str = "normal"
+) -> Dict[str, Any]:
+    """Run Monte Carlo simulation for playoff odds.
+
+    score_model selects how weekly scores are simulated (see score_models).
+    """
+    season, state = await _load_season_state(db, season_year)
+    if not season:
+        return None
+    if state is None:
+        return _not_started_response(season)
+
+    teams = state.teams
+    model = await build_score_model(db, score_model, season, teams)
+    counters = _cached_simulation(state, score_model=model)
+    made_playoffs = counters["made_playoffs"]
 
     # Build results
     playoff_odds = []
     for rid, team in teams.items():
-        games_played = team.wins + team.losses
-        proj_w = round(projected_wins[rid] / NUM_SIMULATIONS)
-        proj_l = round(projected_losses[rid] / NUM_SIMULATIONS)
-        proj_mw = round(projected_median_wins[rid] / NUM_SIMULATIONS)
-        proj_ml = round(projected_median_losses[rid] / NUM_SIMULATIONS)
-
-        make_pct = round(made_playoffs[rid] / NUM_SIMULATIONS * 100, 0)
-        div_pct = round(won_division[rid] / NUM_SIMULATIONS * 100, 0)
-        bye_pct = round(got_bye[rid] / NUM_SIMULATIONS * 100, 0)
-        finals_pct = round(won_finals[rid] / NUM_SIMULATIONS * 100, 0)
-
-        # Format percentages nicely
-        def fmt_pct(val):
-            if val >= 99.5:
-                return ">99%"
-            elif val <= 0.5 and val > 0:
-                return "<1%"
-            else:
-                return f"{int(val)}%"
+        proj_w = round(counters["projected_wins"][rid] / NUM_SIMULATIONS)
+        proj_l = round(counters["projected_losses"][rid] / NUM_SIMULATIONS)
+
+        make_pct = _pct(made_playoffs[rid])
+        div_pct = _pct(counters["won_division"][rid])
+        bye_pct = _pct(counters["got_bye"][rid])
+        finals_pct = _pct(counters["won_finals"][rid])
 
         playoff_odds.append({
             "roster_id": team.roster_id,
@@ -436,19 +737,19 @@ async def calculate_playoff_odds(
             "team_name": team.team_name,
             "avatar": team.avatar,
             "division": team.division,
-            "division_name": division_names.get(str(team.division), f"Division {team.division}"),
+            "division_name": state.division_names.get(str(team.division), f"Division {team.division}"),
             "current_record": f"{team.wins} - {team.losses}",
             "projected_record": f"{proj_w} - {proj_l}",
             "team_rating": team.rating,
             "rating_change": 0,  # Will be computed when we have historical data
             "make_playoffs_pct": make_pct,
-            "make_playoffs_display": fmt_pct(make_pct),
+            "make_playoffs_display": _fmt_pct(make_pct),
             "win_division_pct": div_pct,
-            "win_division_display": fmt_pct(div_pct),
+            "win_division_display": _fmt_pct(div_pct),
             "first_round_bye_pct": bye_pct,
-            "first_round_bye_display": fmt_pct(bye_pct),
+            "first_round_bye_display": _fmt_pct(bye_pct),
             "win_finals_pct": finals_pct,
-            "win_finals_display": fmt_pct(finals_pct),
+            "win_finals_display": _fmt_pct(finals_pct),
             "points_for": team.points_for,
             "points_against": team.points_against,
             "median_wins": team.median_wins,
@@ -461,17 +762,138 @@ async def calculate_playoff_odds(
 
     # Compute draft order
     draft_order = _compute_draft_order(playoff_odds, teams, NUM_SIMULATIONS, made_playoffs)
+    draft_probabilities = _draft_probabilities(teams, counters["draft_slots"])
 
     return {
         "season": season_year,
         "season_started": True,
-        "current_week": current_week,
-        "regular_season_weeks": season.regular_season_weeks,
+        "current_week": state.current_week,
+        "regular_season_weeks": state.regular_season_weeks,
+        "score_model": model.name,
         "playoff_odds": playoff_odds,
         "draft_order": draft_order,
+        "draft_probabilities": draft_probabilities,
     }
 
 
+async def calculate_playoff_scenario(
+    db: AsyncSession,
+    season_year: int,
+    forced_results: Dict[int, int],
+    rating_overrides: Dict[int, float],
+) -> Optional[Dict[str, Any]]:
+    """Re-run the simulation with locked outcomes and compare to baseline.
+
+    forced_results maps matchup db id -> winning Sleeper roster_id and
+    rating_overrides maps Sleeper roster_id -> team rating.  Raises
+    ValueError if the scenario references games or teams that cannot be
+    simulated.
+    """
+    season, state = await _load_season_state(db, season_year)
+    if not season:
+        return None
+    if state is None:
+        raise ValueError(f"Season {season_year} has not started")
+
+    db_id_by_roster_id = {t.roster_id: rid for rid, t in state.teams.items()}
+
+    # Translate Sleeper roster ids to roster db ids and validate
+    forced_db: Dict[int, int] = {}
+    for matchup_id, winner_roster_id in forced_results.items():
+        game = state.remaining_games.get(matchup_id)
+        if game is None:
+            raise ValueError(
+                f"Matchup {matchup_id} is not a remaining regular season game"
+            )
+        winner_db_id = db_id_by_roster_id.get(winner_roster_id)
+        if winner_db_id not in (game[1], game[2]):
+            raise ValueError(
+                f"Roster {winner_roster_id} is not playing in matchup {matchup_id}"
+            )
+        forced_db[matchup_id] = winner_db_id
+
+    overrides_db: Dict[int, float] = {}
+    for roster_id, rating in rating_overrides.items():
+        if roster_id not in db_id_by_roster_id:
+            raise ValueError(f"Roster {roster_id} not found for season {season_year}")
+        overrides_db[db_id_by_roster_id[roster_id]] = float(rating)
+
+    baseline = _cached_simulation(state)
+    scenario = _cached_simulation(state, forced_db, overrides_db)
+
+    metrics = [
+        ("make_playoffs_pct", "made_playoffs"),
+        ("win_division_pct", "won_division"),
+        ("first_round_bye_pct", "got_bye"),
+        ("win_finals_pct", "won_finals"),
+    ]
+
+    teams_out = []
+    for rid, team in state.teams.items():
+        base_vals = {name: _pct(baseline[key][rid]) for name, key in metrics}
+        scen_vals = {name: _pct(scenario[key][rid]) for name, key in metrics}
+        base_vals["projected_wins"] = round(baseline["projected_wins"][rid] / NUM_SIMULATIONS, 1)
+        scen_vals["projected_wins"] = round(scenario["projected_wins"][rid] / NUM_SIMULATIONS, 1)
+
+        teams_out.append({
+            "roster_id": team.roster_id,
+            "user_id": team.user_id,
+            "display_name": team.display_name,
+            "team_name": team.team_name,
+            "avatar": team.avatar,
+            "team_rating": overrides_db.get(rid, team.rating),
+            "baseline": base_vals,
+            "scenario": scen_vals,
+            "delta": {k: round(scen_vals[k] - base_vals[k], 1) for k in base_vals},
+        })
+
+    # Biggest movers first
+    teams_out.sort(key=lambda t: -abs(t["delta"]["make_playoffs_pct"]))
+
+    return {
+        "season": season_year,
+        "current_week": state.current_week,
+        "regular_season_weeks": state.regular_season_weeks,
+        "forced_results": [
+            {"matchup_id": mid, "winner_roster_id": state.teams[wid].roster_id}
+            for mid, wid in sorted(forced_db.items())
+        ],
+        "rating_overrides": {
+            str(state.teams[rid].roster_id): rating
+            for rid, rating in sorted(overrides_db.items())
+        },
+        "teams": teams_out,
+    }
+
+
+def _draft_probabilities(
+    teams: Dict[int, TeamState],
+    draft_slots: Dict[int, List[int]],
+) -> List[Dict]:
+    """Teams x picks probability matrix from the simulated draft slots.
+
+    pick_probabilities[i] is the percent chance of holding pick i + 1.
+    Sorted by expected pick.
+    """
+    rows = []
+    for rid, counts in draft_slots.items():
+        t = teams[rid]
+        expected = sum((i + 1) * c for i, c in enumerate(counts)) / NUM_SIMULATIONS
+        rows.append({
+            "roster_id": t.roster_id,
+            "user_id": t.user_id,
+            "display_name": t.display_name,
+            "team_name": t.team_name,
+            "avatar": t.avatar,
+            "expected_pick": round(expected, 2),
+            "pick_probabilities": [
+                round(c / NUM_SIMULATIONS * 100, 1) for c in counts
+            ],
+        })
+    rows.sort(key=lambda r: (r["expected_pick"], r["roster_id"]))
+    return rows
+
+
 def _compute_draft_order(
     playoff_odds: List[Dict],
     teams: Dict[int, TeamState],
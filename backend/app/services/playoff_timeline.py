@@ -0,0 +1,227 @@
+"""Week-by-week playoff odds timeline.
+
+Each completed regular season week is reconstructed from the Matchup rows
+as it stood after that week, simulated, and persisted as
+PlayoffOddsSnapshot rows.  Weeks that already have snapshots are skipped,
+so the backfill is cheap to re-run after every sync.
+
+Sync records a winner as soon as two point totals differ, including on
+mid-week syncs, so a played week is not necessarily final.  Weeks from the
+league's current week on are never snapshotted, and the most recent
+snapshotted week is always recomputed in case it was taken before its
+results were final.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import PlayoffOddsSnapshot, Roster, Season, User
+from app.services.playoff_odds import (
+    NUM_SIMULATIONS,
+    SeasonState,
+    _build_season_state,
+    _load_season_inputs,
+    _pct,
+    _run_simulations,
+)
+from app.services.weekly_scores import is_decided
+
+logger = logging.getLogger(__name__)
+
+
+# Shared by every backfill; created on first use, sized from settings
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _timeline_workers() -> int:
+    """Number of worker processes used to simulate weeks (0 = all cores)."""
+    workers = get_settings().PLAYOFF_TIMELINE_WORKERS
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=_timeline_workers())
+    return _pool
+
+
+async def _simulate_weeks(states: List[SeasonState]) -> List[Dict[str, Dict[int, float]]]:
+    """Simulate each week's state in the worker processes, so even a
+    single-worker backfill never runs the simulations on the event loop."""
+    global _pool
+    loop = asyncio.get_running_loop()
+    pool = _executor()
+    try:
+        return await asyncio.gather(*(
+            loop.run_in_executor(pool, _run_simulations, state)
+            for state in states
+        ))
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool on the next backfill
+        if _pool is pool:
+            _pool = None
+        raise
+
+
+async def backfill_playoff_timeline(
+    db: AsyncSession,
+    season_year: int,
+    force: bool = False,
+    current_week: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """Compute and persist playoff odds for every completed regular season week.
+
+    Only weeks without snapshots, plus the most recent snapshotted week, are
+    simulated unless force is set, in which case the season's timeline is
+    rebuilt from scratch.  current_week is the week in progress, if known;
+    it and later weeks are left out (and their snapshots dropped).  Returns
+    None if the season does not exist.  The caller bumps the data version.
+    """
+    inputs = await _load_season_inputs(db, season_year)
+    if inputs is None:
+        return None
+    season, division_names, rosters_with_users, all_matchups, bracket, scores = inputs
+
+    played_weeks = sorted({
+        m.week for m in all_matchups
+        if is_decided(m.winner_roster_id, m.home_points, m.away_points)
+        and m.week <= season.regular_season_weeks
+        and (current_week is None or m.week < current_week)
+    })
+
+    provisional = set()
+    if force:
+        await db.execute(
+            delete(PlayoffOddsSnapshot).where(PlayoffOddsSnapshot.season_id == season.id)
+        )
+        existing_weeks = set()
+    else:
+        result = await db.execute(
+            select(PlayoffOddsSnapshot.week)
+            .where(PlayoffOddsSnapshot.season_id == season.id)
+            .distinct()
+        )
+        existing_weeks = {week for (week,) in result.all()}
+
+        # The latest snapshot may predate final results, and weeks still in
+        # progress must not have one
+        if current_week is not None:
+            provisional.update(w for w in existing_weeks if w >= current_week)
+        if existing_weeks:
+            provisional.add(max(existing_weeks))
+        await db.execute(
+            delete(PlayoffOddsSnapshot).where(
+                PlayoffOddsSnapshot.season_id == season.id,
+                PlayoffOddsSnapshot.week.in_(provisional),
+            )
+        )
+        existing_weeks -= provisional
+
+    pending = []
+    for week in played_weeks:
+        if week in existing_weeks:
+            continue
+        state = _build_season_state(
+            season, division_names, rosters_with_users, all_matchups, bracket, scores,
+            through_week=week,
+        )
+        if state is not None:
+            pending.append((week, state))
+
+    results = await _simulate_weeks([state for _, state in pending])
+
+    for (week, state), counters in zip(pending, results):
+        for rid, team in state.teams.items():
+            db.add(PlayoffOddsSnapshot(
+                season_id=season.id,
+                week=week,
+                roster_id=rid,
+                wins=team.wins,
+                losses=team.losses,
+                team_rating=team.rating,
+                make_playoffs_pct=_pct(counters["made_playoffs"][rid]),
+                win_division_pct=_pct(counters["won_division"][rid]),
+                first_round_bye_pct=_pct(counters["got_bye"][rid]),
+                win_finals_pct=_pct(counters["won_finals"][rid]),
+                projected_wins=round(counters["projected_wins"][rid] / NUM_SIMULATIONS, 2),
+                projected_losses=round(counters["projected_losses"][rid] / NUM_SIMULATIONS, 2),
+            ))
+
+    await db.commit()
+
+    computed = [week for week, _ in pending]
+    logger.info(f"Playoff timeline for {season_year}: computed weeks {computed}")
+    return {
+        "season": season_year,
+        "weeks_computed": computed,
+        "weeks_skipped": sorted(existing_weeks & set(played_weeks)),
+    }
+
+
+async def get_playoff_timeline(
+    db: AsyncSession, season_year: int
+) -> Optional[Dict[str, Any]]:
+    """Read the persisted week-by-week odds for a season, grouped by team."""
+    result = await db.execute(
+        select(Season).where(Season.year == season_year)
+    )
+    season = result.scalar_one_or_none()
+    if not season:
+        return None
+
+    result = await db.execute(
+        select(PlayoffOddsSnapshot, Roster, User)
+        .join(Roster, PlayoffOddsSnapshot.roster_id == Roster.id)
+        .join(User, Roster.user_id == User.id)
+        .where(PlayoffOddsSnapshot.season_id == season.id)
+        .order_by(PlayoffOddsSnapshot.week)
+    )
+
+    weeks = set()
+    teams: Dict[int, Dict[str, Any]] = {}
+    series: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for snap, roster, user in result.all():
+        weeks.add(snap.week)
+        if roster.id not in teams:
+            teams[roster.id] = {
+                "roster_id": roster.roster_id,
+                "user_id": user.id,
+                "display_name": user.display_name or user.username,
+                "team_name": roster.team_name,
+                "avatar": user.avatar,
+                "division": roster.division,
+            }
+        series[roster.id].append({
+            "week": snap.week,
+            "record": f"{snap.wins} - {snap.losses}",
+            "team_rating": snap.team_rating,
+            "make_playoffs_pct": snap.make_playoffs_pct,
+            "win_division_pct": snap.win_division_pct,
+            "first_round_bye_pct": snap.first_round_bye_pct,
+            "win_finals_pct": snap.win_finals_pct,
+            "projected_wins": snap.projected_wins,
+            "projected_losses": snap.projected_losses,
+        })
+
+    timeline = [
+        {**team, "weeks": series[rid]}
+        for rid, team in teams.items()
+    ]
+    timeline.sort(key=lambda t: t["roster_id"])
+
+    return {
+        "season": season_year,
+        "regular_season_weeks": season.regular_season_weeks,
+        "weeks": sorted(weeks),
+        "teams": timeline,
+    }
@@ -0,0 +1,785 @@
+"""Power rankings scoring and weekly snapshots.
+
+Rankings combine current form (40 pts), roster value (40 pts) and
+history (20 pts); see POWER_RANKINGS.md for the formula.  After each sync
+the rankings are materialized as PowerRankingSnapshot rows for the
+season's latest played week, which serve reads; the snapshots kept from
+earlier syncs make up the rank-movement history.  A season is only
+recomputed when the fingerprint of its inputs changes.
+"""
+
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import supports_window_functions
+from app.models import (
+    Matchup,
+    MatchupPlayerPoint,
+    Player,
+    PowerRankingSnapshot,
+    Roster,
+    Season,
+    SeasonAward,
+    User,
+)
+from app.services.data_version import VersionedCache
+
+logger = logging.getLogger(__name__)
+
+# Games in the rolling team form window
+RECENT_GAMES = 15
+
+# Games in the rolling player production window
+PLAYER_STATS_GAMES = 15
+
+# Rolling player averages keyed by (player_id, games), reset on every sync
+_player_stats_cache = VersionedCache()
+
+
+async def compute_power_rankings(
+    db: AsyncSession, season: Season
+) -> List[Dict[str, Any]]:
+    """Score and rank every team in a season as its data stands now.
+
+    Returns ranking dicts sorted by rank, each carrying the roster's db id
+    as roster_db_id.
+    """
+    # Get all rosters for this season with user info
+    result = await db.execute(
+        select(Roster, User)
+        .join(User, Roster.user_id == User.id)
+        .where(Roster.season_id == season.id)
+    )
+    rosters_with_users = result.all()
+    if not rosters_with_users:
+        return []
+
+    # Get all players for roster value calculations
+    all_player_ids = set()
+    for roster, _ in rosters_with_users:
+        if roster.players:
+            all_player_ids.update(roster.players)
+
+    players_dict = {}
+    if all_player_ids:
+        result = await db.execute(select(Player).where(Player.id.in_(all_player_ids)))
+        players = result.scalars().all()
+        players_dict = {player.id: player for player in players}
+
+    # Load every scoring input up front in a fixed number of queries
+    all_rosters = [roster for roster, _ in rosters_with_users]
+    user_ids = {roster.user_id for roster in all_rosters}
+    user_roster_ids, recent_games = await _load_recent_games(user_ids, db)
+    awards_by_user = await _load_awards_by_user(user_ids, db)
+    player_stats = await calculate_player_stats(list(all_player_ids), db)
+    recent_avgs = _recent_points_averages(user_roster_ids, recent_games)
+
+    # Calculate power rankings for each team
+    rankings = []
+
+    for roster, user in rosters_with_users:
+        # Current Season Score (40 pts)
+        current_score = _calculate_current_season_score(
+            roster, user_roster_ids, recent_games, recent_avgs
+        )
+
+        # Roster Value Score (40 pts)
+        roster_score = _calculate_roster_value_score(roster, players_dict, player_stats)
+
+        # Historical Score (20 pts)
+        historical_score = _calculate_historical_score(
+            awards_by_user.get(roster.user_id, [])
+        )
+
+        total_score = current_score + roster_score + historical_score
+
+        # Calculate avg roster age
+        avg_age = _calculate_avg_roster_age(roster, players_dict)
+
+        rankings.append({
+            "rank": 0,  # Will be assigned after sorting
+            "roster_db_id": roster.id,
+            "roster_id": roster.roster_id,
+            "user_id": user.id,
+            "username": user.username,
+            "display_name": user.display_name or user.username,
+            "team_name": roster.team_name,
+            "total_score": round(total_score, 2),
+            "current_season_score": round(current_score, 2),
+            "roster_value_score": round(roster_score, 2),
+            "historical_score": round(historical_score, 2),
+            "wins": roster.wins,
+            "losses": roster.losses,
+            "ties": roster.ties,
+            "points_for": roster.points_for,
+            "avg_roster_age": round(avg_age, 1),
+        })
+
+    # Sort by total_score descending and assign ranks
+    rankings.sort(key=lambda x: x["total_score"], reverse=True)
+    for idx, ranking in enumerate(rankings):
+        ranking["rank"] = idx + 1
+
+    return rankings
+
+
+async def _load_recent_games(
+    user_ids: Set[str],
+    db: AsyncSession,
+    limit: int = RECENT_GAMES,
+) -> Tuple[Dict[str, Set[int]], Dict[str, List[Matchup]]]:
+    """Load each owner's roster ids and last N games across all seasons.
+
+    Returns (user_roster_ids, recent_games), both keyed by user id.  Games
+    are ordered chronologically newest first by (season year, week).
+    """
+    user_roster_ids: Dict[str, Set[int]] = defaultdict(set)
+    if not user_ids:
+        return user_roster_ids, {}
+
+    result = await db.execute(
+        select(Roster.id, Roster.user_id).where(Roster.user_id.in_(user_ids))
+    )
+    owner_by_roster = {}
+    for roster_db_id, user_id in result:
+        user_roster_ids[user_id].add(roster_db_id)
+        owner_by_roster[roster_db_id] = user_id
+
+    if not owner_by_roster:
+        return user_roster_ids, {}
+
+    roster_ids = list(owner_by_roster)
+    query = (
+        select(Matchup)
+        .join(Season, Matchup.season_id == Season.id)
+        .where(
+            (Matchup.home_roster_id.in_(roster_ids))
+            | (Matchup.away_roster_id.in_(roster_ids))
+        )
+        .order_by(desc(Season.year), desc(Matchup.week), Matchup.id)
+    )
+    result = await db.execute(query)
+
+    recent_games: Dict[str, List[Matchup]] = defaultdict(list)
+    for matchup in result.scalars():
+        owners = {
+            owner_by_roster.get(matchup.home_roster_id),
+            owner_by_roster.get(matchup.away_roster_id),
+        }
+        owners.discard(None)
+        for user_id in owners:
+            if len(recent_games[user_id]) < limit:
+                recent_games[user_id].append(matchup)
+
+    return user_roster_ids, recent_games
+
+
+async def _load_awards_by_user(
+    user_ids: Set[str], db: AsyncSession
+) -> Dict[str, List[SeasonAward]]:
+    """Load all season awards for the given owners, grouped by user id."""
+    awards_by_user: Dict[str, List[SeasonAward]] = defaultdict(list)
+    if not user_ids:
+        return awards_by_user
+
+    result = await db.execute(
+        select(SeasonAward).where(SeasonAward.user_id.in_(user_ids))
+    )
+    for award in result.scalars():
+        awards_by_user[award.user_id].append(award)
+    return awards_by_user
+
+
+def _recent_points_averages(
+    user_roster_ids: Dict[str, Set[int]],
+    recent_games: Dict[str, List[Matchup]],
+) -> Dict[str, float]:
+    """Average points per game over each owner's recent games."""
+    averages = {}
+    for user_id, matchups in recent_games.items():
+        if not matchups:
+            continue
+        roster_ids = user_roster_ids[user_id]
+        total_points = 0.0
+        for m in matchups:
+            if m.home_roster_id in roster_ids:
+                total_points += m.home_points or 0.0
+            elif m.away_roster_id in roster_ids:
+                total_points += m.away_points or 0.0
+        averages[user_id] = total_points / len(matchups)
+    return averages
+
+
+def _calculate_current_season_score(
+    roster: Roster,
+    user_roster_ids: Dict[str, Set[int]],
+    recent_games: Dict[str, List[Matchup]],
+    recent_avgs: Dict[str, float],
+) -> float:
+    """Calculate current season performance score (40 points max) using rolling 15-game averages."""
+    score = 0.0
+
+    roster_ids = user_roster_ids.get(roster.user_id)
+    if not roster_ids:
+        return 0.0
+
+    recent_matchups = recent_games.get(roster.user_id, [])
+    if not recent_matchups:
+        # No historical data
+        return 0.0
+
+    # Calculate rolling averages from last 15 games
+    wins = 0
+    total_points = 0.0
+    opponent_points = 0.0
+
+    for matchup in recent_matchups:
+        is_home = matchup.home_roster_id in roster_ids
+        is_away = matchup.away_roster_id in roster_ids
+
+        # Count wins (check if this user's roster won)
+        if matchup.winner_roster_id in roster_ids:
+            wins += 1
+
+        # Track points
+        if is_home:
+            total_points += matchup.home_points or 0.0
+            opponent_points += matchup.away_points or 0.0
+        elif is_away:
+            total_points += matchup.away_points or 0.0
+            opponent_points += matchup.home_points or 0.0
+
+    games_played = len(recent_matchups)
+
+    # 1. Win Percentage (15 pts)
+    if games_played > 0:
+        win_pct = wins / games_played
+        score += win_pct * 15
+
+    # 2. Points For Percentile (12 pts)
+    # Compare against the rolling averages of every team in the league
+    all_roster_avgs = list(recent_avgs.values())
+
+    if all_roster_avgs:
+        roster_avg = total_points / games_played
+        # Count how many rosters have a lower average (proper percentile ranking)
+        teams_below = sum(1 for avg in all_roster_avgs if avg < roster_avg)
+        percentile = teams_below / (len(all_roster_avgs) - 1) if len(all_roster_avgs) > 1 else 0.5
+        score += percentile * 12
+
+    # 3. Point Differential (8 pts)
+    if games_played > 0:
+        avg_points = total_points / games_played
+        avg_opponent_points = opponent_points / games_played
+        point_diff = avg_points - avg_opponent_points
+        # Map -20 to +20 range to 0-8 (capped)
+        normalized_diff = max(0, min(8, (point_diff + 20) / 5))
+        score += normalized_diff
+
+    # 4. Recent Form - last 3 weeks (5 pts)
+    # Use only last 3 games instead of 15 for recent form
+    recent_3_matchups = recent_matchups[:3]
+    recent_wins = sum(1 for m in recent_3_matchups if m.winner_roster_id in roster_ids)
+    if len(recent_3_matchups) > 0:
+        recent_form_pct = recent_wins / len(recent_3_matchups)
+        score += recent_form_pct * 5
+
+    return score
+
+
+def _calculate_roster_value_score(
+    roster: Roster, players_dict: Dict[str, Player], player_stats: Dict[str, float]
+) -> float:
+    """Calculate roster value score (40 points max)."""
+    score = 0.0
+
+    if not roster.players:
+        return 0.0
+
+    # Get roster players
+    roster_players = [players_dict.get(pid) for pid in roster.players]
+    roster_players = [p for p in roster_players if p is not None]
+
+    if not roster_players:
+        return 0.0
+
+    # 1. Average Roster Age (15 pts)
+    avg_age = _calculate_avg_roster_age(roster, players_dict)
+    age_score = _age_to_score(avg_age)
+    score += age_score * 15
+
+    # 2. Player Production Value (15 pts)
+    # Sum up production scores for all players and normalize
+    total_production = 0.0
+    for player in roster_players:
+        avg_points = player_stats.get(player.id, 0.0)
+        # Scale: 0 pts/game = 0, 20+ pts/game = 1.0
+        player_production = min(1.0, avg_points / 20.0)
+        total_production += player_production
+
+    # Normalize: 0-15 players with high production -> 0-15 pts
+    score += min(15, total_production)
+
+    # 3. Roster Depth (10 pts)
+    startable_count = sum(1 for p in roster_players if _is_startable(p))
+    # Normalize: 0-20 startable players -> 0-10 pts
+    score += min(10, startable_count * 0.5)
+
+    return score
+
+
+def _calculate_historical_score(awards: List[SeasonAward]) -> float:
+    """Calculate historical performance score (20 points max)."""
+    score = 0.0
+
+    # Count championships and playoff appearances in last 3 seasons
+    championships = sum(1 for award in awards if award.award_type == "champion")
+    playoff_appearances = len([a for a in awards if a.award_type in ["champion", "division_winner"]])
+
+    # 1. Championships (8 pts) - 5 pts per championship
+    score += min(8, championships * 5)
+
+    # 2. Playoff Appearances (8 pts) - ~2.67 pts per appearance
+    score += min(8, playoff_appearances * 2.67)
+
+    # 3. Consistency (4 pts) - TODO: requires historical season data
+    # For now, give average score of 2 pts
+    score += 2
+
+    return score
+
+
+async def _calculate_recent_form(
+    roster: Roster, season: Season, db: AsyncSession
+) -> float:
+    """Calculate recent form score based on last 3 weeks (5 points max)."""
+    # Get last 3 weeks of regular season matchups
+    if not season.regular_season_weeks or season.regular_season_weeks < 3:
+        return 0.0
+
+    # Determine which weeks to check (last 3 completed weeks)
+    # For simplicity, check last 3 weeks of regular season
+    weeks_to_check = range(
+        max(1, season.regular_season_weeks - 2), season.regular_season_weeks + 1
+    )
+
+    result = await db.execute(
+        select(Matchup)
+        .where(
+            Matchup.season_id == season.id,
+            Matchup.week.in_(weeks_to_check),
+            Matchup.match_type == "regular",
+        )
+        .where(
+            (Matchup.home_roster_id == roster.id)
+            | (Matchup.away_roster_id == roster.id)
+        )
+    )
+    recent_matchups = result.scalars().all()
+
+    if not recent_matchups:
+        return 0.0
+
+    # Calculate win percentage in recent games
+    wins = 0
+    for matchup in recent_matchups:
+        if matchup.winner_roster_id == roster.id:
+            wins += 1
+
+    win_pct = wins / len(recent_matchups)
+    return win_pct * 5
+
+
+def _calculate_avg_roster_age(roster: Roster, players_dict: Dict[str, Player]) -> float:
+    """Calculate average age of players on roster."""
+    if not roster.players:
+        return 0.0
+
+    ages = []
+    for player_id in roster.players:
+        player = players_dict.get(player_id)
+        if player and player.age:
+            ages.append(player.age)
+        elif player and player.years_exp:
+            # Estimate age from years_exp
+            estimated_age = 22 + player.years_exp
+            ages.append(estimated_age)
+
+    return sum(ages) / len(ages) if ages else 27.0  # Default to 27 if no ages
+
+
+def _age_to_score(avg_age: float) -> float:
+    """Convert average roster age to 0-1 score (1 = best for dynasty)."""
+    # Ages 22-25: 1.0 (dynasty sweet spot)
+    # Ages 26-28: 0.7
+    # Ages 29+: 0.3
+    if avg_age <= 25:
+        return 1.0
+    elif avg_age <= 28:
+        # Linear interpolation from 1.0 to 0.7
+        return 1.0 - (avg_age - 25) * 0.1
+    else:
+        # Linear interpolation from 0.7 to 0.3
+        return max(0.3, 0.7 - (avg_age - 28) * 0.1)
+
+
+def _is_elite_player(player: Player) -> bool:
+    """Check if a player is considered 'elite' for dynasty purposes."""
+    # Elite criteria:
+    # - Age < 28 AND position in QB, RB, WR, TE
+    # - Has active status
+    if not player.age or player.age >= 28:
+        return False
+
+    if player.status not in ["Active", None]:  # None means no status set (assume active)
+        return False
+
+    return player.position in ["QB", "RB", "WR", "TE"]
+
+
+def _is_startable(player: Player) -> bool:
+    """Check if a player is considered startable."""
+    # Startable criteria:
+    # - Age < 30
+    # - Active status
+    # - Position in QB, RB, WR, TE
+    if player.age and player.age >= 30:
+        return False
+
+    if player.status not in ["Active", None]:
+        return False
+
+    return player.position in ["QB", "RB", "WR", "TE"]
+
+
+async def calculate_player_stats(
+    player_ids: List[str], db: AsyncSession, limit: int = PLAYER_STATS_GAMES
+) -> Dict[str, float]:
+    """Calculate rolling average points per game for players (last N games).
+
+    Games are ordered by (season year, week), newest first.  Results are
+    cached per data version, so only players not seen since the last sync
+    hit the database, in a single query.
+    """
+    if not player_ids:
+        return {}
+
+    keys = [(player_id, limit) for player_id in player_ids]
+    cached = _player_stats_cache.get_many(keys)
+    missing = [player_id for player_id, n in keys if (player_id, n) not in cached]
+
+    if missing:
+        if supports_window_functions(db):
+            fresh = await _rolling_averages_windowed(missing, db, limit)
+        else:
+            fresh = await _rolling_averages_ordered(missing, db, limit)
+        # Players without any games average 0 and are cached as such
+        _player_stats_cache.set_many({
+            (player_id, limit): fresh.get(player_id, 0.0) for player_id in missing
+        })
+        cached = _player_stats_cache.get_many(keys)
+
+    return {player_id: cached[(player_id, n)] for player_id, n in keys}
+
+
+def _recent_points_query(player_ids: List[str]):
+    """Player weekly points joined to their season year and week."""
+    return (
+        select(MatchupPlayerPoint.player_id, MatchupPlayerPoint.points)
+        .join(Matchup, MatchupPlayerPoint.matchup_id == Matchup.id)
+        .join(Season, Matchup.season_id == Season.id)
+        .where(MatchupPlayerPoint.player_id.in_(player_ids))
+    )
+
+
+_RECENT_ORDER = (desc(Season.year), desc(Matchup.week), desc(MatchupPlayerPoint.id))
+
+
+async def _rolling_averages_windowed(
+    player_ids: List[str], db: AsyncSession, limit: int
+) -> Dict[str, float]:
+    """Last-N averages with ROW_NUMBER() partitioned by player."""
+    ranked = _recent_points_query(player_ids).add_columns(
+        func.row_number().over(
+            partition_by=MatchupPlayerPoint.player_id,
+            order_by=_RECENT_ORDER,
+        ).label("game_rank")
+    ).subquery()
+
+    result = await db.execute(
+        select(ranked.c.player_id, func.avg(ranked.c.points).label("avg_points"))
+        .where(ranked.c.game_rank <= limit)
+        .group_by(ranked.c.player_id)
+    )
+    return {
+        row.player_id: float(row.avg_points) if row.avg_points else 0.0
+        for row in result
+    }
+
+
+async def _rolling_averages_ordered(
+    player_ids: List[str], db: AsyncSession, limit: int
+) -> Dict[str, float]:
+    """Last-N averages for databases without window functions."""
+    result = await db.execute(
+        _recent_points_query(player_ids).order_by(
+            MatchupPlayerPoint.player_id, *_RECENT_ORDER
+        )
+    )
+    recent: Dict[str, List[float]] = defaultdict(list)
+    for player_id, points in result:
+        games = recent[player_id]
+        if len(games) < limit:
+            games.append(points)
+
+    averages = {}
+    for player_id, games in recent.items():
+        scored = [p for p in games if p is not None]
+        averages[player_id] = sum(scored) / len(scored) if scored else 0.0
+    return averages
+
+
+# ================== SNAPSHOTS ==================
+
+
+async def _season_fingerprint(db: AsyncSession, season: Season) -> str:
+    """Hash of every input to the season's rankings: its matchups and
+    rosters, the rostered players and their production, and the owners'
+    awards."""
+    result = await db.execute(
+        select(
+            Matchup.id, Matchup.week, Matchup.home_points,
+            Matchup.away_points, Matchup.winner_roster_id,
+        )
+        .where(Matchup.season_id == season.id)
+        .order_by(Matchup.id)
+    )
+    matchups = [list(row) for row in result.all()]
+
+    result = await db.execute(
+        select(
+            Roster.id, Roster.user_id, Roster.team_name, Roster.players,
+            Roster.wins, Roster.losses, Roster.ties, Roster.points_for,
+        )
+        .where(Roster.season_id == season.id)
+        .order_by(Roster.id)
+    )
+    rosters = [list(row) for row in result.all()]
+
+    player_ids = sorted({pid for row in rosters for pid in (row[3] or [])})
+    players = []
+    if player_ids:
+        result = await db.execute(
+            select(
+                Player.id, Player.age, Player.years_exp, Player.status, Player.position,
+            )
+            .where(Player.id.in_(player_ids))
+            .order_by(Player.id)
+        )
+        players = [list(row) for row in result.all()]
+    stats = await calculate_player_stats(player_ids, db)
+    production = [[pid, round(stats[pid], 4)] for pid in player_ids]
+
+    user_ids = sorted({row[1] for row in rosters if row[1]})
+    awards = []
+    if user_ids:
+        result = await db.execute(
+            select(SeasonAward.user_id, SeasonAward.season_id, SeasonAward.award_type)
+            .where(SeasonAward.user_id.in_(user_ids))
+            .order_by(SeasonAward.user_id, SeasonAward.season_id, SeasonAward.award_type)
+        )
+        awards = [list(row) for row in result.all()]
+
+    payload = json.dumps(
+        [matchups, rosters, players, production, awards], sort_keys=True, default=str
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+async def _latest_played_week(db: AsyncSession, season: Season) -> int:
+    """Latest week with a decided game (see weekly_scores.is_decided)."""
+    result = await db.execute(
+        select(func.max(Matchup.week)).where(
+            Matchup.season_id == season.id,
+            Matchup.winner_roster_id.isnot(None)
+            | ((Matchup.home_points == Matchup.away_points) & (Matchup.home_points != 0)),
+        )
+    )
+    return result.scalar() or 0
+
+
+async def refresh_power_rankings(
+    db: AsyncSession, season_year: int, force: bool = False
+) -> Optional[Dict[str, Any]]:
+    """Materialize power rankings for a season's latest played week.
+
+    The week is recomputed only when the season's inputs changed since it
+    was stored, or when force is set.  Earlier weeks are not backfilled:
+    rosters, player stats and awards are only known as they stand now, so
+    each week's snapshot is the one taken while it was the latest, and
+    the history only holds weeks a refresh saw.  The data version is not
+    bumped here: sync bumps it once for all of its refreshes.  Returns
+    None if the season does not exist.
+    """
+    result = await db.execute(select(Season).where(Season.year == season_year))
+    season = result.scalar_one_or_none()
+    if not season:
+        return None
+
+    fingerprint = await _season_fingerprint(db, season)
+    latest_week = await _latest_played_week(db, season)
+
+    result = await db.execute(
+        select(PowerRankingSnapshot.source_fingerprint)
+        .where(
+            PowerRankingSnapshot.season_id == season.id,
+            PowerRankingSnapshot.week == latest_week,
+        )
+        .limit(1)
+    )
+    stored = result.first()
+
+    computed = []
+    if force or stored is None or stored[0] != fingerprint:
+        await db.execute(
+            delete(PowerRankingSnapshot).where(
+                PowerRankingSnapshot.season_id == season.id,
+                PowerRankingSnapshot.week == latest_week,
+            )
+        )
+        for ranking in await compute_power_rankings(db, season):
+            db.add(PowerRankingSnapshot(
+                season_id=season.id,
+                week=latest_week,
+                roster_id=ranking["roster_db_id"],
+                rank=ranking["rank"],
+                total_score=ranking["total_score"],
+                current_season_score=ranking["current_season_score"],
+                roster_value_score=ranking["roster_value_score"],
+                historical_score=ranking["historical_score"],
+                wins=ranking["wins"],
+                losses=ranking["losses"],
+                ties=ranking["ties"],
+                points_for=ranking["points_for"],
+                avg_roster_age=ranking["avg_roster_age"],
+                source_fingerprint=fingerprint,
+            ))
+        computed.append(latest_week)
+
+    await db.commit()
+
+    logger.info(f"Power rankings for {season_year}: computed weeks {computed}")
+    return {
+        "season": season_year,
+        "weeks_computed": computed,
+        "weeks_skipped": [] if computed else [latest_week],
+    }
+
+
+async def get_power_rankings(
+    db: AsyncSession, season_year: int
+) -> Optional[Dict[str, Any]]:
+    """Power rankings for a season from its latest snapshot.
+
+    Seasons that have not been materialized yet are computed live.  Returns
+    None if the season does not exist.
+    """
+    result = await db.execute(select(Season).where(Season.year == season_year))
+    season = result.scalar_one_or_none()
+    if not season:
+        return None
+
+    result = await db.execute(
+        select(func.max(PowerRankingSnapshot.week))
+        .where(PowerRankingSnapshot.season_id == season.id)
+    )
+    week = result.scalar()
+    if week is None:
+        return {
+            "season": season_year,
+            "week": None,
+            "rankings": await compute_power_rankings(db, season),
+        }
+
+    result = await db.execute(
+        select(PowerRankingSnapshot, Roster, User)
+        .join(Roster, PowerRankingSnapshot.roster_id == Roster.id)
+        .join(User, Roster.user_id == User.id)
+        .where(
+            PowerRankingSnapshot.season_id == season.id,
+            PowerRankingSnapshot.week == week,
+        )
+        .order_by(PowerRankingSnapshot.rank)
+    )
+    rankings = [
+        {
+            "rank": snap.rank,
+            "roster_db_id": roster.id,
+            "roster_id": roster.roster_id,
+            "user_id": user.id,
+            "username": user.username,
+            "display_name": user.display_name or user.username,
+            "team_name": roster.team_name,
+            "total_score": snap.total_score,
+            "current_season_score": snap.current_season_score,
+            "roster_value_score": snap.roster_value_score,
+            "historical_score": snap.historical_score,
+            "wins": snap.wins,
+            "losses": snap.losses,
+            "ties": snap.ties,
+            "points_for": snap.points_for,
+            "avg_roster_age": snap.avg_roster_age,
+        }
+        for snap, roster, user in result.all()
+    ]
+    return {"season": season_year, "week": week, "rankings": rankings}
+
+
+async def get_power_rankings_history(
+    db: AsyncSession, season_year: int
+) -> Optional[Dict[str, Any]]:
+    """Week-by-week ranks and scores for a season, grouped by team."""
+    result = await db.execute(select(Season).where(Season.year == season_year))
+    season = result.scalar_one_or_none()
+    if not season:
+        return None
+
+    result = await db.execute(
+        select(PowerRankingSnapshot, Roster, User)
+        .join(Roster, PowerRankingSnapshot.roster_id == Roster.id)
+        .join(User, Roster.user_id == User.id)
+        .where(PowerRankingSnapshot.season_id == season.id)
+        .order_by(PowerRankingSnapshot.week)
+    )
+
+    weeks = set()
+    teams: Dict[int, Dict[str, Any]] = {}
+    series: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for snap, roster, user in result.all():
+        weeks.add(snap.week)
+        if roster.id not in teams:
+            teams[roster.id] = {
+                "roster_id": roster.roster_id,
+                "user_id": user.id,
+                "display_name": user.display_name or user.username,
+                "team_name": roster.team_name,
+            }
+        series[roster.id].append({
+            "week": snap.week,
+            "rank": snap.rank,
+            "total_score": snap.total_score,
+            "current_season_score": snap.current_season_score,
+            "roster_value_score": snap.roster_value_score,
+            "historical_score": snap.historical_score,
+        })
+
+    history = [{**team, "weeks": series[rid]} for rid, team in teams.items()]
+    history.sort(key=lambda t: t["roster_id"])
+
+    return {"season": season_year, "weeks": sorted(weeks), "teams": history}
@@ -0,0 +1,230 @@
+"""Score models for the playoff odds simulation.
+
+A score model decides how a simulated team scores in a week and who wins a
+simulated game.  Models are built once per request (any database work and
+table precomputation happens up front) and then sampled inside the Monte
+Carlo loop, so sampling must stay cheap.
+
+- "normal": the original model.  Scores are drawn from a normal
+  distribution around the team's points per game and the winner comes
+  from a separate rating-based logistic draw.
+- "empirical": scores are resampled from the team's actual regular season
+  weekly scores, topped up with weeks bootstrapped from its rostered players'
+  MatchupPlayerPoint history.  The higher score wins, so scores and
+  results are always consistent.
+"""
+
+import math
+import random
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import League, Matchup, MatchupPlayerPoint, Roster, Season
+
+# Teams with fewer real games than this get bootstrapped weeks mixed in
+MIN_TEAM_GAMES = 6
+
+# Number of synthetic weeks generated per bootstrapped team
+BOOTSTRAP_WEEKS = 200
+
+# Seasons of player history used for bootstrapping (current + previous)
+BOOTSTRAP_SEASONS = 2
+
+# Starting slots assumed when the league has no roster_positions
+DEFAULT_STARTER_SLOTS = 10
+NON_STARTER_SLOTS = {"BN", "IR", "TAXI"}
+
+# Floor applied to simulated scores
+MIN_SCORE = 30.0
+
+
+def _win_probability(rating_a: float, rating_b: float) -> float:
+    """Logistic win probability based on rating difference."""
+    diff = rating_a - rating_b
+    return 1.0 / (1.0 + math.exp(-diff / 60.0))
+
+
+def _simulate_score(team, rng: random.Random) -> float:
+    """Simulate a game score for a team based on their average and variance."""
+    # Use normal distribution centered on avg_ppg with reasonable spread
+    std_dev = max(team.avg_ppg * 0.15, 10.0)
+    return max(rng.gauss(team.avg_ppg, std_dev), MIN_SCORE)
+
+
+class ScoreModel(ABC):
+    """Interface for simulation score models."""
+
+    name = "base"
+
+    def cache_key(self):
+        """Identifies the model (and its tables) in the simulation cache."""
+        return self.name
+
+    @abstractmethod
+    def sample(self, team, rng: random.Random) -> float:
+        """Draw one weekly score for a team."""
+
+    @abstractmethod
+    def first_team_wins(self, team_a, team_b, score_a: float, score_b: float,
+                        rng: random.Random) -> bool:
+        """Decide a regular season game given both simulated scores."""
+
+    @abstractmethod
+    def play_game(self, team_a, team_b, rng: random.Random, weeks: int = 1) -> bool:
+        """Decide a playoff game over `weeks` combined weeks; returns True if
+        team_a advances."""
+
+
+class NormalScoreModel(ScoreModel):
+    """Normal scores around avg_ppg, winner from the rating logistic."""
+
+    name = "normal"
+
+    def sample(self, team, rng: random.Random) -> float:
+        return _simulate_score(team, rng)
+
+    def first_team_wins(self, team_a, team_b, score_a, score_b, rng) -> bool:
+        return rng.random() < _win_probability(team_a.rating, team_b.rating)
+
+    def play_game(self, team_a, team_b, rng, weeks: int = 1) -> bool:
+        # Summing n weeks scales the expected margin by n but its spread only
+        # by sqrt(n), so the rating gap counts sqrt(n) times as much
+        diff = (team_a.rating - team_b.rating) * math.sqrt(weeks)
+        return rng.random() < _win_probability(diff, 0.0)
+
+
+class EmpiricalScoreModel(ScoreModel):
+    """Resamples each team's observed (or bootstrapped) weekly scores."""
+
+    name = "empirical"
+
+    def __init__(self, tables: Dict[int, List[float]]):
+        # roster db id -> weekly score sampling table
+        self.tables = tables
+        self._key = (self.name, hash(tuple(
+            (rid, tuple(table)) for rid, table in sorted(tables.items())
+        )))
+
+    def cache_key(self):
+        return self._key
+
+    def sample(self, team, rng: random.Random) -> float:
+        table = self.tables.get(team.roster_db_id)
+        if not table:
+            return _simulate_score(team, rng)
+        return table[int(rng.random() * len(table))]
+
+    def first_team_wins(self, team_a, team_b, score_a, score_b, rng) -> bool:
+        if score_a == score_b:
+            return rng.random() < 0.5
+        return score_a > score_b
+
+    def play_game(self, team_a, team_b, rng, weeks: int = 1) -> bool:
+        score_a = sum(self.sample(team_a, rng) for _ in range(weeks))
+        score_b = sum(self.sample(team_b, rng) for _ in range(weeks))
+        return self.first_team_wins(team_a, team_b, score_a, score_b, rng)
+
+
+SCORE_MODELS = ("normal", "empirical")
+
+
+async def build_score_model(
+    db: AsyncSession, name: str, season: Season, teams: Dict
+) -> ScoreModel:
+    """Build the named score model for a season's teams."""
+    if name == "empirical":
+        return await _build_empirical_model(db, season, teams)
+    return NormalScoreModel()
+
+
+async def _build_empirical_model(
+    db: AsyncSession, season: Season, teams: Dict
+) -> EmpiricalScoreModel:
+    """Precompute per-team weekly score tables for the empirical model."""
+    # Actual weekly scores from this season's played regular season games;
+    # playoff and consolation weeks are not what the simulation samples for
+    result = await db.execute(
+        select(Matchup).where(
+            Matchup.season_id == season.id,
+            Matchup.match_type == "regular",
+            Matchup.winner_roster_id.isnot(None),
+        )
+    )
+    tables: Dict[int, List[float]] = defaultdict(list)
+    for m in result.scalars().all():
+        if m.home_points:
+            tables[m.home_roster_id].append(float(m.home_points))
+        if m.away_points:
+            tables[m.away_roster_id].append(float(m.away_points))
+
+    thin_teams = [rid for rid in teams if len(tables.get(rid, [])) < MIN_TEAM_GAMES]
+    if thin_teams:
+        bootstrapped = await _bootstrap_team_scores(db, season, thin_teams)
+        for rid, boot in bootstrapped.items():
+            real = tables[rid]
+            # Real games keep a share of the table proportional to how close
+            # the team is to MIN_TEAM_GAMES; bootstrapped weeks fill the rest.
+            share = len(real) / MIN_TEAM_GAMES
+            repeats = round(share * len(boot) / (1 - share) / len(real)) if real else 0
+            tables[rid] = real * max(repeats, 1) + boot
+
+    return EmpiricalScoreModel({
+        rid: sorted(tables[rid]) for rid in teams if tables.get(rid)
+    })
+
+
+async def _bootstrap_team_scores(
+    db: AsyncSession, season: Season, roster_db_ids: List[int]
+) -> Dict[int, List[float]]:
+    """Synthesize weekly team scores from rostered players' history.
+
+    Each synthetic week draws one historical weekly score per rostered
+    player and keeps the best `starter slots` of them, approximating a
+    well-set lineup.
+    """
+    result = await db.execute(
+        select(Roster.id, Roster.players).where(Roster.id.in_(roster_db_ids))
+    )
+    roster_players = {rid: [str(p) for p in (players or [])] for rid, players in result.all()}
+
+    all_player_ids = {pid for players in roster_players.values() for pid in players}
+    if not all_player_ids:
+        return {}
+
+    result = await db.execute(
+        select(League.roster_positions).where(League.id == season.league_id)
+    )
+    positions = result.scalar_one_or_none() or []
+    starter_slots = sum(1 for p in positions if p not in NON_STARTER_SLOTS) or DEFAULT_STARTER_SLOTS
+
+    result = await db.execute(
+        select(MatchupPlayerPoint.player_id, MatchupPlayerPoint.points)
+        .join(Matchup, MatchupPlayerPoint.matchup_id == Matchup.id)
+        .join(Season, Matchup.season_id == Season.id)
+        .where(
+            MatchupPlayerPoint.player_id.in_(list(all_player_ids)),
+            Season.year > season.year - BOOTSTRAP_SEASONS,
+            Season.year <= season.year,
+        )
+    )
+    history: Dict[str, List[float]] = defaultdict(list)
+    for pid, pts in result.all():
+        history[pid].append(pts or 0.0)
+
+    # Seeded so the tables (and the simulation cache key) are stable
+    rng = random.Random(season.id)
+    bootstrapped: Dict[int, List[float]] = {}
+    for rid in roster_db_ids:
+        player_histories = [history[pid] for pid in roster_players.get(rid, []) if history.get(pid)]
+        if not player_histories:
+            continue
+        weeks = []
+        for _ in range(BOOTSTRAP_WEEKS):
+            draws = sorted((rng.choice(h) for h in player_histories), reverse=True)
+            weeks.append(round(max(sum(draws[:starter_slots]), MIN_SCORE), 2))
+        bootstrapped[rid] = weeks
+    return bootstrapped
@@ -0,0 +1,226 @@
+"""Start/sit analysis: the lineup a team played against its optimal one.
+
+For every roster in every synced matchup, sync runs analyze_lineup() on the
+Sleeper payload it already has in memory (player points, starters in slot
+order) and stores the result as a LineupDecision row: both lineups, the
+single bench-for-starter swaps that would have turned the result into a
+win, and whether the optimal lineup would have won.  Owner pages read the
+stored rows; the optimizer never runs on read.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import League, LineupDecision, Matchup, Player, Roster, Season, User
+from app.services.lineup_optimizer import LineupOptimizer, compile_plan
+
+# Winning swaps kept per roster-week, best first
+MAX_SWAPS = 5
+
+
+def _result(points: float, opponent_points: float) -> str:
+    if points > opponent_points:
+        return "W"
+    if points < opponent_points:
+        return "L"
+    return "T"
+
+
+async def load_player_positions(
+    db: AsyncSession, player_ids: Optional[Iterable[str]] = None
+) -> Dict[str, Tuple[str, ...]]:
+    """player_id -> every position the player is eligible at, primary
+    position first, for the given players (every player when None)."""
+    query = select(Player.id, Player.position, Player.fantasy_positions).where(
+        Player.position.isnot(None)
+    )
+    if player_ids is not None:
+        player_ids = list(player_ids)
+        if not player_ids:
+            return {}
+        query = query.where(Player.id.in_(player_ids))
+    result = await db.execute(query)
+    return {
+        pid: (position, *(p for p in fantasy_positions or [] if p != position))
+        for pid, position, fantasy_positions in result.all()
+        if position
+    }
+
+
+def lineup_candidates(
+    player_points: Dict[str, float], positions: Dict[str, Tuple[str, ...]]
+) -> List[Dict[str, Any]]:
+    """LineupOptimizer input for the players with a known position."""
+    return [
+        {
+            "player_id": pid,
+            "position": positions[pid][0],
+            "positions": positions[pid],
+            "points": pts,
+        }
+        for pid, pts in player_points.items()
+        if positions.get(pid)
+    ]
+
+
+def analyze_lineup(
+    optimizer: LineupOptimizer,
+    player_points: Dict[str, float],
+    starters: List[str],
+    positions: Dict[str, Tuple[str, ...]],
+    actual_points: float,
+    opponent_points: float,
+) -> dict:
+    """Start/sit analysis for one roster-week, as LineupDecision fields.
+
+    Args:
+        player_points: Sleeper players_points, player_id -> points
+        starters: Sleeper starters, aligned with the starting slots
+                  ("0" marks an empty slot)
+        positions: player_id -> eligible positions, primary first (see
+                   load_player_positions)
+    """
+    plan = optimizer.plan
+    points = {str(pid): pts or 0.0 for pid, pts in player_points.items()}
+
+    actual: List[Optional[str]] = [None] * len(plan.starters)
+    for i, pid in enumerate((starters or [])[:len(plan.starters)]):
+        if pid and str(pid) != "0":
+            actual[i] = str(pid)
+
+    optimal = optimizer.optimal_lineup(lineup_candidates(points, positions))
+    optimal_lineup = [entry["player_id"] for entry in optimal["lineup"]]
+
+    result = _result(actual_points, opponent_points)
+    swaps = []
+    if result != "W":
+        started = set(actual)
+        bench = [pid for pid in points if pid not in started and positions.get(pid)]
+        for i, starter in enumerate(actual):
+            starter_points = points.get(starter, 0.0) if starter else 0.0
+            for pid in bench:
+                gain = points[pid] - starter_points
+                if actual_points + gain > opponent_points and any(
+                    plan.can_start(i, position) for position in positions[pid]
+                ):
+                    swaps.append([i, pid, starter, round(gain, 2)])
+        swaps.sort(key=lambda swap: swap[3], reverse=True)
+        swaps = swaps[:MAX_SWAPS]
+
+    referenced = {pid for pid in actual + optimal_lineup if pid}
+    referenced.update(swap[1] for swap in swaps)
+    return {
+        "actual_points": actual_points,
+        "optimal_points": optimal["total"],
+        "opponent_points": opponent_points,
+        "result": result,
+        "lost_to_lineup": result == "L" and optimal["total"] > opponent_points,
+        "actual_lineup": actual,
+        "optimal_lineup": optimal_lineup,
+        "swaps": swaps,
+        "player_points": {pid: points.get(pid, 0.0) for pid in sorted(referenced)},
+    }
+
+
+class StartSitService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_owner_start_sit(
+        self, user_id: str, season: Optional[int] = None
+    ) -> Optional[dict]:
+        """Stored start/sit analysis for an owner's matchups, newest season
+        first.  Returns None for an unknown owner."""
+        result = await self.db.execute(select(User.id).where(User.id == user_id))
+        if result.scalar_one_or_none() is None:
+            return None
+
+        query = (
+            select(LineupDecision, Season.year, Matchup.match_type, League.roster_positions)
+            .join(Roster, LineupDecision.roster_id == Roster.id)
+            .join(Season, LineupDecision.season_id == Season.id)
+            .join(Matchup, LineupDecision.matchup_id == Matchup.id)
+            .outerjoin(League, Season.league_id == League.id)
+            .where(Roster.user_id == user_id)
+            .order_by(Season.year.desc(), LineupDecision.week)
+        )
+        if season is not None:
+            query = query.where(Season.year == season)
+        rows = (await self.db.execute(query)).all()
+
+        player_ids = set()
+        for decision, _, _, _ in rows:
+            player_ids.update((decision.player_points or {}).keys())
+        players: Dict[str, Player] = {}
+        if player_ids:
+            result = await self.db.execute(select(Player).where(Player.id.in_(list(player_ids))))
+            players = {p.id: p for p in result.scalars().all()}
+
+        weeks = []
+        seasons: Dict[int, dict] = defaultdict(
+            lambda: {"weeks": 0, "games_lost_to_lineup": 0, "points_left_on_bench": 0.0}
+        )
+        for decision, year, match_type, roster_positions in rows:
+            slots = compile_plan(tuple(roster_positions or [])).starters
+            pts = decision.player_points or {}
+
+            entry = self._entry_builder(slots, pts, players)
+            points_left = round(max((decision.optimal_points or 0.0) - (decision.actual_points or 0.0), 0.0), 2)
+            weeks.append({
+                "year": year,
+                "week": decision.week,
+                "match_type": match_type,
+                "result": decision.result,
+                "actual_points": decision.actual_points,
+                "optimal_points": decision.optimal_points,
+                "opponent_points": decision.opponent_points,
+                "points_left_on_bench": points_left,
+                "lost_to_lineup": bool(decision.lost_to_lineup),
+                "actual_lineup": [entry(i, pid) for i, pid in enumerate(decision.actual_lineup or [])],
+                "optimal_lineup": [entry(i, pid) for i, pid in enumerate(decision.optimal_lineup or [])],
+                "swaps": [
+                    {
+                        "slot": slots[i] if i < len(slots) else None,
+                        "bench": entry(i, bench_id),
+                        "starter": entry(i, starter_id),
+                        "gain": gain,
+                    }
+                    for i, bench_id, starter_id, gain in decision.swaps or []
+                ],
+            })
+            summary = seasons[year]
+            summary["weeks"] += 1
+            summary["games_lost_to_lineup"] += 1 if decision.lost_to_lineup else 0
+            summary["points_left_on_bench"] += points_left
+
+        season_summaries = [
+            {"year": year, **{**s, "points_left_on_bench": round(s["points_left_on_bench"], 2)}}
+            for year, s in sorted(seasons.items(), reverse=True)
+        ]
+        return {
+            "user_id": user_id,
+            "games_lost_to_lineup": sum(s["games_lost_to_lineup"] for s in season_summaries),
+            "points_left_on_bench": round(sum(w["points_left_on_bench"] for w in weeks), 2),
+            "seasons": season_summaries,
+            "weeks": weeks,
+        }
+
+    @staticmethod
+    def _entry_builder(slots: List[str], points: Dict[str, float], players: Dict[str, Player]):
+        """Function turning (lineup index, player id) into a response entry."""
+
+        def entry(slot_index: int, pid: Optional[str]) -> dict:
+            player = players.get(pid) if pid else None
+            name = player.full_name if player else None
+            return {
+                "slot": slots[slot_index] if slot_index < len(slots) else None,
+                "player_id": pid,
+                "player_name": name or (f"Player {pid}" if pid else None),
+                "position": player.position if player else None,
+                "points": points.get(pid, 0.0) if pid else 0.0,
+            }
+
+        return entry
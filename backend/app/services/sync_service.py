@@ -2,9 +2,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.services.sleeper_client import sleeper_client
 from app.services.lineup_optimizer import LineupOptimizer
+from app.services.start_sit import analyze_lineup, load_player_positions
+from app.services.data_version import bump_version, invalidate_caches
+from app.services.playoff_timeline import backfill_playoff_timeline
+from app.services.power_rankings import refresh_power_rankings
+from app.services.draft_grading import DraftGradingService
+from app.services.trade_grading import TradeGradingService
+from app.services.owner_stats import OwnerStatsService
 from app.models import (
     League, User, Season, Roster, Matchup, Player, Transaction, Draft, DraftPick,
-    SeasonAward, MatchupPlayerPoint
+    SeasonAward, MatchupPlayerPoint, LineupDecision
 )
 from typing import Dict, Any, List
 from datetime import datetime
@@ -19,6 +26,8 @@ class SyncService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.client = sleeper_client
+        # season_id -> league roster_positions
+        self._roster_positions: Dict[int, List[str]] = {}
 
     @staticmethod
     def _safe_int(value):
@@ -105,7 +114,15 @@ class SyncService:
                 synced_seasons.append(year)
                 await self.db.flush()
 
+            # Derived tables are rebuilt from the new data before it is
+            # published with the sync's one version bump
             await self.db.commit()
+            invalidate_caches()
+
+            # Re-materialize power rankings for seasons whose data changed
+            for year in synced_seasons:
+                await self._refresh_power_rankings(year)
+            await self._publish()
 
             return {
                 "status": "success",
@@ -165,7 +182,24 @@ class SyncService:
             # Sync players (this is a large dataset)
             await self._sync_players(int(current_season))
 
+            # Derived tables first, then the one version bump (see sync_all_history)
             await self.db.commit()
+            invalidate_caches()
+
+            # Add newly completed weeks to the playoff odds timeline
+            try:
+                in_season = nfl_state.get("season_type") == "regular"
+                await backfill_playoff_timeline(
+                    self.db,
+                    int(current_season),
+                    current_week=nfl_state.get("week") if in_season else None,
+                )
+            except Exception as e:
+                await self.db.rollback()
+                logger.warning(f"Could not backfill playoff timeline for {current_season}: {e}")
+
+            await self._refresh_power_rankings(int(current_season))
+            await self._publish()
 
             return {
                 "status": "success",
@@ -177,6 +211,55 @@ class SyncService:
             logger.error(f"Error syncing league data: {e}")
             raise
 
+    async def _publish(self):
+        """Bump the data version once the snapshot tables are committed.
+
+        Responses cached while the snapshots were rewritten are keyed to
+        the old version, so none outlive the sync.  Grades and owner stats
+        are rebuilt once per version under the lock reads take, so they
+        are refreshed right after the bump and a read meanwhile waits for
+        them instead of seeing old rows.
+        """
+        bump_version()
+        await self._refresh_trade_grades()
+        await self._refresh_draft_grades()
+        await self._refresh_owner_stats()
+
+    async def _refresh_power_rankings(self, year: int):
+        """Snapshot power rankings after a sync; failures only log."""
+        try:
+            await refresh_power_rankings(self.db, year)
+        except Exception as e:
+            await self.db.rollback()
+            logger.warning(f"Could not refresh power rankings for {year}: {e}")
+
+    async def _refresh_trade_grades(self):
+        """Regrade trades whose inputs changed in a sync, under the same lock
+        as reads; failures only log."""
+        try:
+            await TradeGradingService(self.db).ensure_fresh()
+        except Exception as e:
+            await self.db.rollback()
+            logger.warning(f"Could not refresh trade grades: {e}")
+
+    async def _refresh_draft_grades(self):
+        """Add newly scored weeks to stored draft grades, under the same lock
+        as reads; failures only log."""
+        try:
+            await DraftGradingService(self.db).ensure_fresh()
+        except Exception as e:
+            await self.db.rollback()
+            logger.warning(f"Could not refresh draft grades: {e}")
+
+    async def _refresh_owner_stats(self):
+        """Rebuild owner-season stats, under the same lock as reads; failures
+        only log."""
+        try:
+            await OwnerStatsService(self.db).ensure_fresh()
+        except Exception as e:
+            await self.db.rollback()
+            logger.warning(f"Could not refresh owner stats: {e}")
+
     async def _sync_league_data(self, league_data: Dict[str, Any]):
         """Sync league configuration."""
         league_id = league_data.get("league_id")
@@ -486,8 +569,8 @@ class SyncService:
             await self._sync_player_points(matchup, roster1, team1)
             await self._sync_player_points(matchup, roster2, team2)
 
-            # Calculate max potential points for both teams
-            await self._calculate_max_potential(matchup, roster1, roster2, season_id)
+            # Max potential points and start/sit analysis for both teams
+            await self._analyze_lineups(matchup, roster1, team1, roster2, team2, season_id)
 
     async def _get_roster_by_roster_id(self, season_id: int, roster_id: int):
         """Get roster by season and roster_id."""
@@ -531,61 +614,65 @@ class SyncService:
                     is_starter=str(player_id) in starters,
                 ))
 
-    async def _calculate_max_potential(self, matchup: Matchup, home_roster: Roster,
-                                        away_roster: Roster, season_id: int):
-        """Calculate max potential points for both teams in a matchup."""
-        # Get league roster positions
-        result = await self.db.execute(
-            select(Season).where(Season.id == season_id)
-        )
-        season = result.scalar_one_or_none()
-        if not season:
+    async def _analyze_lineups(self, matchup: Matchup,
+                               home_roster: Roster, home_data: Dict[str, Any],
+                               away_roster: Roster, away_data: Dict[str, Any],
+                               season_id: int):
+        """Set max potential points for both teams and store their start/sit
+        analysis, from the matchup payload already in memory."""
+        roster_positions = await self._get_roster_positions(season_id)
+        if not roster_positions:
             return
 
+        optimizer = LineupOptimizer(roster_positions)
+        player_ids = {
+            str(pid)
+            for team in (home_data, away_data)
+            for pid in (team.get("players_points") or {})
+        }
+        positions = await load_player_positions(self.db, player_ids)
+
         result = await self.db.execute(
-            select(League).where(League.id == season.league_id)
+            select(LineupDecision).where(LineupDecision.matchup_id == matchup.id)
         )
-        league = result.scalar_one_or_none()
-        if not league or not league.roster_positions:
-            return
-
-        optimizer = LineupOptimizer(league.roster_positions)
-
-        # Calculate max potential for home team
-        home_max = await self._get_roster_max_potential(matchup, home_roster, optimizer)
-        matchup.home_max_potential_points = home_max
-
-        # Calculate max potential for away team
-        away_max = await self._get_roster_max_potential(matchup, away_roster, optimizer)
-        matchup.away_max_potential_points = away_max
+        existing = {d.roster_id: d for d in result.scalars().all()}
+
+        teams = [
+            ("home", home_roster, home_data, away_data),
+            ("away", away_roster, away_data, home_data),
+        ]
+        for side, roster, team, opponent in teams:
+            analysis = analyze_lineup(
+                optimizer,
+                team.get("players_points") or {},
+                team.get("starters") or [],
+                positions,
+                team.get("points", 0) or 0,
+                opponent.get("points", 0) or 0,
+            )
+            setattr(matchup, f"{side}_max_potential_points", analysis["optimal_points"])
+            if not team.get("players_points"):
+                continue
 
-    async def _get_roster_max_potential(self, matchup: Matchup, roster: Roster,
-                                         optimizer: LineupOptimizer) -> float:
-        """Get max potential points for a single roster in a matchup."""
-        # Get all player points for this roster in this matchup
-        result = await self.db.execute(
-            select(MatchupPlayerPoint, Player)
-            .outerjoin(Player, MatchupPlayerPoint.player_id == Player.id)
-            .where(
-                MatchupPlayerPoint.matchup_id == matchup.id,
-                MatchupPlayerPoint.roster_id == roster.id
+            decision = existing.get(roster.id)
+            if decision is None:
+                decision = LineupDecision(matchup_id=matchup.id, roster_id=roster.id)
+                self.db.add(decision)
+            decision.season_id = season_id
+            decision.week = matchup.week
+            for field, value in analysis.items():
+                setattr(decision, field, value)
+
+    async def _get_roster_positions(self, season_id: int) -> List[str]:
+        """League roster positions for a season, looked up once per sync."""
+        if season_id not in self._roster_positions:
+            result = await self.db.execute(
+                select(League.roster_positions)
+                .join(Season, Season.league_id == League.id)
+                .where(Season.id == season_id)
             )
-        )
-        player_data = result.all()
-
-        # Build list of player points with positions
-        player_points = []
-        for mpp, player in player_data:
-            # Use player position if available, otherwise skip this player
-            position = player.position if player else None
-            if position:
-                player_points.append({
-                    "player_id": mpp.player_id,
-                    "position": position,
-                    "points": mpp.points
-                })
-
-        return optimizer.calculate_optimal_lineup(player_points)
+            self._roster_positions[season_id] = result.scalar_one_or_none() or []
+        return self._roster_positions[season_id]
 
     async def _sync_drafts(self, drafts_data: List[Dict[str, Any]], year: int):
         """Sync draft data."""
@@ -694,6 +781,7 @@ class SyncService:
                     player.last_name = player_data.get("last_name")
                     player.full_name = full_name
                     player.position = player_data.get("position")
+                    player.fantasy_positions = player_data.get("fantasy_positions")
                     player.team = player_data.get("team")
                     player.number = player_data.get("number")
                     player.age = player_data.get("age")
@@ -708,6 +796,7 @@ class SyncService:
                         last_name=player_data.get("last_name"),
                         full_name=full_name,
                         position=player_data.get("position"),
+                        fantasy_positions=player_data.get("fantasy_positions"),
                         team=player_data.get("team"),
                         number=self._safe_int(player_data.get("number")),
                         age=self._safe_int(player_data.get("age")),
@@ -4,12 +4,17 @@ player performance, draft-pick resolution, and position replacement.
 For detailed algorithm documentation, see: backend/docs/TRADE_GRADING.md
 """
 
+import asyncio
+import hashlib
+import json
 from collections import defaultdict
 from typing import Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import case, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from app.database import supports_window_functions
 from app.models import (
     Draft,
     DraftPick,
@@ -18,20 +23,95 @@ from app.models import (
     Player,
     Roster,
     Season,
+    TradeGrade,
+    TradeGradeOwner,
     Transaction,
     User,
 )
-
-# Weights
-STARTER_WEIGHT = 1.5
-BENCH_WEIGHT = 0.1
+from app.services.data_version import VersionedCache, current_version
+from app.services.pick_values import PickValueCurve, load_pick_value_curve
+from app.services.player_weeks import (
+    BENCH_WEIGHT,
+    STARTER_WEIGHT,
+    PlayerWeekStore,
+    load_player_week_store,
+    load_scoped_player_week_store,
+)
 
 # Discount applied to projected (unused) draft pick values
 FUTURE_PICK_DISCOUNT = 0.7
+# Traded future picks are always in rookie drafts
+FUTURE_PICK_DRAFT_TYPE = "rookie"
 
 # Replacement-factor window (weeks before/after trade)
 REPLACEMENT_WINDOW = 4
 
+# League-wide starter points by (roster, year, week, position), reset on sync
+POSITION_POINTS_KEY = "position_starter_points"
+_position_points_cache = VersionedCache(max_entries=1)
+
+
+# Proposed-trade evaluation: recent player-weeks used for each player's
+# weekly value, and the number of weeks a deal is projected over
+EVALUATION_RECENT_WEEKS = 17
+EVALUATION_HORIZON_WEEKS = 17
+PRODUCTION_MODEL_KEY = "production_model"
+_production_cache = VersionedCache(max_entries=1)
+
+# Stored-grade ordering per sort option; ties fall back to most recent
+SORT_ORDERS = {
+    "lopsided": (TradeGrade.lopsidedness.desc(),),
+    "recent": (),
+    "even": (TradeGrade.lopsidedness.asc(),),
+}
+
+# Data version the stored grades were last refreshed at
+_graded_version: Optional[int] = None
+_refresh_lock = asyncio.Lock()
+
+
+class ProductionModel:
+    """In-memory snapshot for evaluating proposed trades.
+
+    Holds each player's recent weighted points per week, player names and
+    positions, the current season's rosters and the league pick value
+    curve.  Built once per data version.
+    """
+
+    def __init__(
+        self,
+        weekly_value: Dict[str, float],
+        players: Dict[str, dict],
+        rosters: Dict[int, dict],
+        pick_curve: PickValueCurve,
+    ):
+        self.weekly_value = weekly_value  # player_id -> weighted points/week
+        self.players = players  # player_id -> {full_name, position}
+        self.rosters = rosters  # sleeper roster_id -> {user_id, username, players}
+        self.pick_curve = pick_curve
+
+    def replacement_factor(self, player_id: str, giving_roster_id: Optional[int]) -> float:
+        """Replacement factor (0.5 = replaced well, 1.0 = big hole) for the
+        side giving the player away: the best player left at the position
+        on their roster, against the player's own production."""
+        roster = self.rosters.get(giving_roster_id)
+        position = self.players.get(player_id, {}).get("position")
+        before = self.weekly_value.get(player_id, 0.0)
+        if not roster or not position or before <= 0:
+            return 1.0
+        after = max(
+            (
+                self.weekly_value.get(pid, 0.0)
+                for pid in roster["players"]
+                if pid != player_id
+                and self.players.get(pid, {}).get("position") == position
+            ),
+            default=0.0,
+        )
+        if after >= before:
+            return 0.5
+        return 1.0 - (after / before) * 0.5
+
 
 def _value_share_to_grade(share: float) -> str:
     """Map a 0.0-1.0 value share to a letter grade.
@@ -74,56 +154,249 @@ class TradeGradingService:
     # Public API
     # ------------------------------------------------------------------
 
-    async def grade_all_trades(
+    async def get_trade_grades(
         self,
         season: Optional[int] = None,
         owner_id: Optional[str] = None,
+        sort: str = "lopsided",
     ) -> List[dict]:
-        """Grade every completed trade.  Optionally filter by season/owner."""
-        trades = await self._fetch_trades(season, owner_id)
-        if not trades:
-            return []
+        """Stored grades for completed trades, refreshed first if a sync
+        happened since the last refresh.  Optionally filter by season/owner."""
+        await self.ensure_fresh()
 
-        # Collect player IDs from trades
-        all_player_ids: set = set()
-        for txn, season_obj in trades:
-            if txn.adds:
-                all_player_ids.update(txn.adds.keys())
-            if txn.drops:
-                all_player_ids.update(txn.drops.keys())
+        query = select(TradeGrade.grade)
+        if season is not None:
+            query = query.where(TradeGrade.season_year == season)
+        if owner_id is not None:
+            query = query.where(
+                TradeGrade.id.in_(
+                    select(TradeGradeOwner.trade_grade_id).where(
+                        TradeGradeOwner.user_id == owner_id
+                    )
+                )
+            )
+        order = SORT_ORDERS.get(sort, ()) + (TradeGrade.trade_date.desc(),)
+        result = await self.db.execute(query.order_by(*order))
+        return list(result.scalars().all())
+
+    async def refresh_grades(self, force: bool = False) -> dict:
+        """Bring the stored grades up to date now.  Holds the refresh lock,
+        so it never runs alongside a read's ensure_fresh()."""
+        async with _refresh_lock:
+            return await self._refresh_grades(force)
+
+    async def _refresh_grades(self, force: bool = False) -> dict:
+        """Bring the stored trade grades up to date.
+
+        A trade's grade depends only on its players' points for the owners
+        involved, its traded pick slots, and the position scoring around
+        the trade.  Those inputs are fingerprinted per trade and only trades
+        whose fingerprint changed are regraded; the rest just have
+        weeks_of_data moved forward.
+        """
+        global _graded_version
+        version = current_version()
 
-        # Build maps that span ALL seasons (not just trade seasons)
-        user_roster_map = await self._build_user_roster_map()
-        roster_to_user = await self._build_roster_to_user_map()
-        sleeper_roster_map = await self._build_sleeper_roster_map()
+        trades = await self._fetch_trades()
+        result = await self.db.execute(
+            select(TradeGrade).options(selectinload(TradeGrade.owners))
+        )
+        stored = {row.transaction_id: row for row in result.scalars().all()}
+
+        trade_ids = {txn.id for txn, _ in trades}
+        removed = [row for tid, row in stored.items() if tid not in trade_ids]
+        for row in removed:
+            await self.db.delete(row)
+
+        graded: List[str] = []
+        unchanged = 0
+        if trades:
+            all_player_ids: set = set()
+            for txn, _ in trades:
+                all_player_ids.update((txn.adds or {}).keys())
+                all_player_ids.update((txn.drops or {}).keys())
+
+            user_roster_map = await self._build_user_roster_map()
+            sleeper_roster_map = await self._build_sleeper_roster_map()
+            pick_curve = await load_pick_value_curve(self.db)
+            pick_index, draft_order_map = await self._resolve_picks()
+            all_player_ids.update(pick_index.values())
+
+            player_map = await self._build_player_map(all_player_ids)
+            points_index = await load_player_week_store(self.db)
+            latest = points_index.latest
+            position_points = await self._fetch_position_starter_points()
+
+            stale = []
+            for txn, season_obj in trades:
+                deps, player_ids, pick_slots = self._trade_dependencies(
+                    txn,
+                    season_obj,
+                    sleeper_roster_map,
+                    user_roster_map,
+                    player_map,
+                    points_index,
+                    position_points,
+                    pick_curve,
+                    pick_index,
+                    draft_order_map,
+                    latest,
+                )
+                fingerprint = hashlib.sha1(
+                    json.dumps(deps, sort_keys=True, default=str).encode()
+                ).hexdigest()
+                row = stored.get(txn.id)
+                if force or row is None or row.dependency_fingerprint != fingerprint:
+                    stale.append((txn, season_obj, player_ids, pick_slots, fingerprint))
+                    continue
+
+                unchanged += 1
+                weeks = self._weeks_since_trade(season_obj.year, txn.week or 0, latest)
+                if row.weeks_of_data != weeks:
+                    row.weeks_of_data = weeks
+                    row.grade = {**row.grade, "weeks_of_data": weeks}
+
+            if stale:
+                for txn, season_obj, player_ids, pick_slots, fingerprint in stale:
+                    g = self._grade_trade(
+                        txn,
+                        season_obj,
+                        sleeper_roster_map,
+                        user_roster_map,
+                        player_map,
+                        points_index,
+                        position_points,
+                        pick_curve,
+                        pick_index,
+                        draft_order_map,
+                    )
+                    row = stored.get(txn.id)
+                    if row is None:
+                        row = TradeGrade(transaction_id=txn.id)
+                        self.db.add(row)
+                    row.season_id = season_obj.id
+                    row.season_year = season_obj.year
+                    row.week = g["week"]
+                    row.trade_date = txn.status_updated
+                    row.lopsidedness = g["lopsidedness"]
+                    row.weeks_of_data = g["weeks_of_data"]
+                    row.grade = g
+                    row.player_ids = sorted(player_ids)
+                    row.pick_slots = pick_slots
+                    row.dependency_fingerprint = fingerprint
+                    row.owners = [
+                        TradeGradeOwner(user_id=uid)
+                        for uid in sorted({s["user_id"] for s in g["sides"] if s["user_id"]})
+                    ]
+                    graded.append(txn.id)
+
+        await self.db.commit()
+        _graded_version = version
+        return {
+            "graded": graded,
+            "unchanged": unchanged,
+            "removed": len(removed),
+        }
 
-        pick_baselines = await self._calculate_pick_baselines()
-        pick_index, draft_order_map = await self._resolve_picks()
+    async def ensure_fresh(self) -> None:
+        """Refresh stored grades once per data version."""
+        if _graded_version == current_version():
+            return
+        async with _refresh_lock:
+            if _graded_version != current_version():
+                await self._refresh_grades()
+
+    async def evaluate_trade(self, sides: List[dict]) -> dict:
+        """Project a proposed trade from current production.
+
+        Each side is {roster_id, players, picks} listing what that roster
+        (a current-season Sleeper roster id) would receive; picks are
+        {season, round}.  Players are valued at their recent weighted
+        points per week over EVALUATION_HORIZON_WEEKS, adjusted by the
+        replacement factor of the roster currently holding them; picks at
+        the pick value curve's round average with FUTURE_PICK_DISCOUNT.  Raises ValueError
+        for unknown or repeated rosters.
+        """
+        model = await self._load_production_model()
 
-        # Include resolved draft pick player IDs
-        all_player_ids.update(pick_index.values())
+        roster_ids = [int(side["roster_id"]) for side in sides]
+        if len(set(roster_ids)) != len(roster_ids):
+            raise ValueError("Each roster can only appear on one side")
+        for rid in roster_ids:
+            if rid not in model.rosters:
+                raise ValueError(f"Roster {rid} not found in the current season")
 
-        player_map = await self._build_player_map(all_player_ids)
-        points_index = await self._fetch_all_player_points(all_player_ids)
-        position_points = await self._fetch_position_starter_points()
-
-        graded: List[dict] = []
-        for txn, season_obj in trades:
-            g = self._grade_trade(
-                txn,
-                season_obj,
-                sleeper_roster_map,
-                user_roster_map,
-                roster_to_user,
-                player_map,
-                points_index,
-                position_points,
-                pick_baselines,
-                pick_index,
-                draft_order_map,
-            )
-            graded.append(g)
-        return graded
+        sides_output: List[dict] = []
+        for side in sides:
+            rid = int(side["roster_id"])
+            roster_info = model.rosters[rid]
+            total_value = 0.0
+
+            player_details = []
+            for pid in side.get("players", []):
+                pid = str(pid)
+                pinfo = model.players.get(pid, {})
+                giving_rid = next(
+                    (
+                        other for other in roster_ids
+                        if other != rid and pid in model.rosters[other]["players"]
+                    ),
+                    None,
+                )
+                weekly = model.weekly_value.get(pid, 0.0)
+                projected = weekly * EVALUATION_HORIZON_WEEKS
+                repl_factor = model.replacement_factor(pid, giving_rid)
+                adjusted_value = projected * repl_factor
+                total_value += adjusted_value
+                player_details.append({
+                    "player_id": pid,
+                    "player_name": pinfo.get("full_name", f"Player {pid}"),
+                    "position": pinfo.get("position"),
+                    "weekly_value": round(weekly, 2),
+                    "projected_points": round(projected, 2),
+                    "adjusted_points": round(adjusted_value, 2),
+                    "replacement_factor": round(repl_factor, 2),
+                })
+
+            pick_details = []
+            for pick in side.get("picks", []):
+                ppw = model.pick_curve.value(FUTURE_PICK_DRAFT_TYPE, pick["round"])
+                pick_value = ppw * EVALUATION_HORIZON_WEEKS * FUTURE_PICK_DISCOUNT
+                total_value += pick_value
+                pick_details.append({
+                    "season": pick["season"],
+                    "round": pick["round"],
+                    "status": "projected",
+                    "value": round(pick_value, 2),
+                })
+
+            sides_output.append({
+                "roster_id": rid,
+                "owner_name": roster_info["username"],
+                "user_id": roster_info["user_id"],
+                "total_value": round(total_value, 2),
+                "assets_received": {
+                    "players": player_details,
+                    "draft_picks": pick_details,
+                },
+            })
+
+        total_trade_value = sum(s["total_value"] for s in sides_output)
+        for side in sides_output:
+            if total_trade_value > 0:
+                share = side["total_value"] / total_trade_value
+            else:
+                share = 1.0 / max(len(sides_output), 1)
+            side["value_share"] = round(share, 4)
+            side["grade"] = _value_share_to_grade(share)
+
+        sides_output.sort(key=lambda s: s["value_share"], reverse=True)
+        shares = [s["value_share"] for s in sides_output]
+        return {
+            "horizon_weeks": EVALUATION_HORIZON_WEEKS,
+            "lopsidedness": round(max(shares) - min(shares), 4) if shares else 0.0,
+            "sides": sides_output,
+        }
 
     async def grade_single_trade(self, trade_id: str) -> Optional[dict]:
         """Grade a single trade by its transaction id."""
@@ -141,33 +414,57 @@ class TradeGradingService:
             return None
         txn, season_obj = row
 
+        # Load only what this trade touches: its owners' rosters, its
+        # players and picks, and the replacement window around it.
+        sides_data = self._build_sides(txn)
+        sleeper_roster_map = await self._build_sleeper_roster_map(
+            season_obj.id, list(sides_data)
+        )
+        user_ids = {info["user_id"] for info in sleeper_roster_map.values()}
+        user_roster_map = await self._build_user_roster_map(user_ids)
+        owner_roster_ids = {
+            db_id for db_ids in user_roster_map.values() for db_id in db_ids
+        }
+
+        traded_picks = [
+            pick for data in sides_data.values() for pick in data["picks_received"]
+        ]
+        pick_index, draft_order_map = await self._resolve_picks(traded_picks)
+        unresolved = [
+            pick for pick in traded_picks
+            if not self._resolve_pick(pick, pick_index, draft_order_map)[3]
+        ]
+        pick_curve = (
+            await load_pick_value_curve(self.db) if unresolved else None
+        )
+
         all_player_ids: set = set()
         if txn.adds:
             all_player_ids.update(txn.adds.keys())
         if txn.drops:
             all_player_ids.update(txn.drops.keys())
-
-        user_roster_map = await self._build_user_roster_map()
-        roster_to_user = await self._build_roster_to_user_map()
-        sleeper_roster_map = await self._build_sleeper_roster_map()
-        pick_baselines = await self._calculate_pick_baselines()
-        pick_index, draft_order_map = await self._resolve_picks()
-
         all_player_ids.update(pick_index.values())
         player_map = await self._build_player_map(all_player_ids)
-        points_index = await self._fetch_all_player_points(all_player_ids)
-        position_points = await self._fetch_position_starter_points()
+        points_index = await load_scoped_player_week_store(
+            self.db, all_player_ids, owner_roster_ids
+        )
+
+        trade_week = txn.week or 0
+        position_points = await self._fetch_position_starter_points(
+            owner_roster_ids,
+            season_obj.year,
+            (trade_week - REPLACEMENT_WINDOW + 1, trade_week + REPLACEMENT_WINDOW),
+        )
 
         return self._grade_trade(
             txn,
             season_obj,
             sleeper_roster_map,
             user_roster_map,
-            roster_to_user,
             player_map,
             points_index,
             position_points,
-            pick_baselines,
+            pick_curve,
             pick_index,
             draft_order_map,
         )
@@ -220,12 +517,18 @@ class TradeGradingService:
 
     async def _build_sleeper_roster_map(
         self,
+        season_id: Optional[int] = None,
+        roster_ids: Optional[List[int]] = None,
     ) -> Dict[Tuple[int, int], dict]:
         """(season_id, sleeper_roster_id) -> {user_id, username, team_name,
-        db_roster_id}"""
-        result = await self.db.execute(
-            select(Roster, User).join(User, Roster.user_id == User.id)
-        )
+        db_roster_id}, optionally for one season's given rosters only."""
+        query = select(Roster, User).join(User, Roster.user_id == User.id)
+        if season_id is not None:
+            query = query.where(
+                Roster.season_id == season_id,
+                Roster.roster_id.in_(roster_ids or []),
+            )
+        result = await self.db.execute(query)
         mapping: Dict[Tuple[int, int], dict] = {}
         for roster, user in result.all():
             mapping[(roster.season_id, roster.roster_id)] = {
@@ -236,20 +539,21 @@ class TradeGradingService:
             }
         return mapping
 
-    async def _build_user_roster_map(self) -> Dict[str, Set[int]]:
-        """user_id -> set of all db_roster_ids across all seasons."""
-        result = await self.db.execute(select(Roster.user_id, Roster.id))
+    async def _build_user_roster_map(
+        self, user_ids: Optional[Set[str]] = None
+    ) -> Dict[str, Set[int]]:
+        """user_id -> set of all db_roster_ids across all seasons,
+        optionally for the given users only."""
+        query = select(Roster.user_id, Roster.id)
+        if user_ids is not None:
+            query = query.where(Roster.user_id.in_(list(user_ids)))
+        result = await self.db.execute(query)
         mapping: Dict[str, Set[int]] = defaultdict(set)
         for user_id, db_id in result.all():
             if user_id:
                 mapping[user_id].add(db_id)
         return dict(mapping)
 
-    async def _build_roster_to_user_map(self) -> Dict[int, str]:
-        """db_roster_id -> user_id."""
-        result = await self.db.execute(select(Roster.id, Roster.user_id))
-        return {db_id: uid for db_id, uid in result.all() if uid}
-
     async def _build_player_map(
         self, player_ids: set
     ) -> Dict[str, dict]:
@@ -270,136 +574,65 @@ class TradeGradingService:
             }
         return mapping
 
-    async def _fetch_all_player_points(
-        self, player_ids: set
+    async def _fetch_position_starter_points(
+        self,
+        roster_ids: Optional[Set[int]] = None,
+        season_year: Optional[int] = None,
+        weeks: Optional[Tuple[int, int]] = None,
     ) -> Dict:
-        """Returns index keyed by (player_id, db_roster_id, season_year, week)
-        -> (points, is_starter).  We keep db_roster_id so we can translate
-        to user_id via roster_to_user at query time."""
-        if not player_ids:
-            return {}
-        result = await self.db.execute(
-            select(
-                MatchupPlayerPoint.player_id,
-                MatchupPlayerPoint.points,
-                MatchupPlayerPoint.is_starter,
-                MatchupPlayerPoint.roster_id,  # DB PK of roster
-                Matchup.week,
-                Season.year.label("season_year"),
-            )
-            .join(Matchup, MatchupPlayerPoint.matchup_id == Matchup.id)
-            .join(Season, Matchup.season_id == Season.id)
-            .where(
-                MatchupPlayerPoint.player_id.in_(
-                    [str(pid) for pid in player_ids]
-                )
-            )
-        )
-        index: Dict[tuple, tuple] = {}
-        for row in result.all():
-            key = (
-                row.player_id,
-                row.roster_id,
-                row.season_year,
-                row.week,
-            )
-            index[key] = (row.points or 0.0, bool(row.is_starter))
-        return index
-
-    async def _fetch_position_starter_points(self) -> Dict:
         """Returns index:
         (db_roster_id, season_year, week, position)
           -> total_starter_points_at_position
+
+        Aggregated in SQL.  The league-wide index is cached until the next
+        sync; passing roster_ids, season_year and an inclusive week range
+        loads just that slice.
         """
-        result = await self.db.execute(
+        scoped = roster_ids is not None
+        if not scoped:
+            cached = _position_points_cache.get_many([POSITION_POINTS_KEY])
+            if cached:
+                return cached[POSITION_POINTS_KEY]
+
+        query = (
             select(
                 MatchupPlayerPoint.roster_id,
-                MatchupPlayerPoint.player_id,
-                MatchupPlayerPoint.points,
-                Matchup.week,
                 Season.year.label("season_year"),
+                Matchup.week,
+                Player.position,
+                func.sum(func.coalesce(MatchupPlayerPoint.points, 0.0)).label("points"),
             )
             .join(Matchup, MatchupPlayerPoint.matchup_id == Matchup.id)
             .join(Season, Matchup.season_id == Season.id)
-            .where(MatchupPlayerPoint.is_starter.is_(True))
-        )
-
-        rows = result.all()
-        player_ids_needed = {r.player_id for r in rows}
-        pos_map: Dict[str, str] = {}
-        if player_ids_needed:
-            p_result = await self.db.execute(
-                select(Player.id, Player.position).where(
-                    Player.id.in_(list(player_ids_needed))
-                )
-            )
-            for pid, pos in p_result.all():
-                pos_map[pid] = pos
-
-        index: Dict[tuple, float] = defaultdict(float)
-        for r in rows:
-            position = pos_map.get(r.player_id)
-            if not position:
-                continue
-            key = (r.roster_id, r.season_year, r.week, position)
-            index[key] += r.points or 0.0
-        return dict(index)
-
-    async def _calculate_pick_baselines(self) -> Dict[int, float]:
-        """Average weighted points-per-week for players drafted in each
-        round across all league drafts."""
-        result = await self.db.execute(
-            select(DraftPick.round, DraftPick.player_id).where(
-                DraftPick.player_id.isnot(None)
+            .join(Player, MatchupPlayerPoint.player_id == Player.id)
+            .where(
+                MatchupPlayerPoint.is_starter.is_(True),
+                Player.position.isnot(None),
+                Player.position != "",
             )
-        )
-        picks = result.all()
-        if not picks:
-            return {}
-
-        round_players: Dict[int, set] = defaultdict(set)
-        for rnd, pid in picks:
-            round_players[rnd].add(pid)
-
-        all_drafted_pids = set()
-        for pids in round_players.values():
-            all_drafted_pids.update(pids)
-
-        result = await self.db.execute(
-            select(
-                MatchupPlayerPoint.player_id,
-                MatchupPlayerPoint.points,
-                MatchupPlayerPoint.is_starter,
-            ).where(
-                MatchupPlayerPoint.player_id.in_(list(all_drafted_pids))
+            .group_by(
+                MatchupPlayerPoint.roster_id,
+                Season.year,
+                Matchup.week,
+                Player.position,
             )
         )
-
-        player_stats: Dict[str, dict] = defaultdict(
-            lambda: {"weighted_total": 0.0, "weeks": 0}
-        )
-        for row in result.all():
-            w = STARTER_WEIGHT if row.is_starter else BENCH_WEIGHT
-            player_stats[row.player_id]["weighted_total"] += (
-                row.points or 0.0
-            ) * w
-            player_stats[row.player_id]["weeks"] += 1
-
-        baselines: Dict[int, float] = {}
-        for rnd, pids in round_players.items():
-            ppw_values = []
-            for pid in pids:
-                stats = player_stats.get(pid)
-                if stats and stats["weeks"] > 0:
-                    ppw_values.append(
-                        stats["weighted_total"] / stats["weeks"]
-                    )
-            baselines[rnd] = (
-                sum(ppw_values) / len(ppw_values) if ppw_values else 0.0
+        if scoped:
+            query = query.where(
+                MatchupPlayerPoint.roster_id.in_(list(roster_ids)),
+                Season.year == season_year,
+                Matchup.week.between(*weeks),
             )
-        return baselines
+        result = await self.db.execute(query)
+        index = {
+            (r.roster_id, r.season_year, r.week, r.position): float(r.points or 0.0)
+            for r in result.all()
+        }
+        if not scoped:
+            _position_points_cache.set_many({POSITION_POINTS_KEY: index})
+        return index
 
-    async def _resolve_picks(self) -> Tuple[
+    async def _resolve_picks(self, picks: Optional[List[dict]] = None) -> Tuple[
         Dict[Tuple[int, int, int], str],
         Dict[int, Dict[int, int]],
     ]:
@@ -409,9 +642,38 @@ class TradeGradingService:
         2. draft_order_map: draft_year -> {sleeper_roster_id -> slot}
            Inverted draft order so we can map a roster's "original pick"
            to the slot it occupies.
+
+        Given traded picks, only their drafts and slots are loaded.
         """
+        years: Optional[Set[int]] = None
+        if picks is not None:
+            years = set()
+            for pick in picks:
+                try:
+                    years.add(int(pick.get("season")))
+                except (ValueError, TypeError):
+                    continue
+
+        # Build inverted draft order: year -> {roster_id -> slot}
+        # Upcoming drafts count too, so unused picks get their slot
+        order_query = select(Draft.year, Draft.draft_order).where(
+            Draft.draft_order.isnot(None),
+        )
+        if years is not None:
+            order_query = order_query.where(Draft.year.in_(list(years)))
+        draft_result = await self.db.execute(order_query)
+        draft_order_map: Dict[int, Dict[int, int]] = {}
+        for year, order in draft_result.all():
+            if order:
+                # draft_order is {slot_str: roster_id}, invert to
+                # {roster_id: slot_int}
+                inverted: Dict[int, int] = {}
+                for slot_str, rid in order.items():
+                    inverted[int(rid)] = int(slot_str)
+                draft_order_map[year] = inverted
+
         # Build pick index keyed on slot (pick_in_round) for uniqueness
-        result = await self.db.execute(
+        pick_query = (
             select(
                 Draft.year,
                 DraftPick.round,
@@ -421,28 +683,117 @@ class TradeGradingService:
             .join(DraftPick, Draft.id == DraftPick.draft_id)
             .where(Draft.status == "complete", DraftPick.player_id.isnot(None))
         )
+        wanted: Optional[Set[Tuple[int, int, int]]] = None
+        if picks is not None:
+            wanted = set()
+            for pick in picks:
+                try:
+                    year = int(pick.get("season"))
+                    slot = draft_order_map.get(year, {}).get(int(pick.get("roster_id")))
+                except (ValueError, TypeError):
+                    continue
+                if slot is not None:
+                    wanted.add((year, pick.get("round"), slot))
+            if not wanted:
+                return {}, draft_order_map
+            pick_query = pick_query.where(
+                Draft.year.in_(list({w[0] for w in wanted})),
+                DraftPick.round.in_(list({w[1] for w in wanted})),
+            )
+        result = await self.db.execute(pick_query)
         pick_index: Dict[Tuple[int, int, int], str] = {}
         for year, rnd, slot, player_id in result.all():
-            pick_index[(year, rnd, slot)] = player_id
+            if wanted is None or (year, rnd, slot) in wanted:
+                pick_index[(year, rnd, slot)] = player_id
 
-        # Build inverted draft order: year -> {roster_id -> slot}
-        draft_result = await self.db.execute(
-            select(Draft.year, Draft.draft_order).where(
-                Draft.status == "complete",
-                Draft.draft_order.isnot(None),
+        return pick_index, draft_order_map
+
+    async def _load_production_model(self) -> ProductionModel:
+        """The ProductionModel for the current data version."""
+        cached = _production_cache.get_many([PRODUCTION_MODEL_KEY])
+        if cached:
+            return cached[PRODUCTION_MODEL_KEY]
+
+        if supports_window_functions(self.db):
+            weekly_value = await self._recent_weekly_values_windowed()
+        else:
+            weekly_value = await self._recent_weekly_values_ordered()
+
+        rosters: Dict[int, dict] = {}
+        result = await self.db.execute(
+            select(Season).order_by(Season.year.desc()).limit(1)
+        )
+        season = result.scalar_one_or_none()
+        if season:
+            result = await self.db.execute(
+                select(Roster, User)
+                .join(User, Roster.user_id == User.id)
+                .where(Roster.season_id == season.id)
             )
+            for roster, user in result.all():
+                rosters[roster.roster_id] = {
+                    "user_id": user.id,
+                    "username": user.display_name or user.username,
+                    "players": {str(pid) for pid in roster.players or []},
+                }
+
+        player_ids = set(weekly_value)
+        for info in rosters.values():
+            player_ids.update(info["players"])
+        player_map = await self._build_player_map(player_ids)
+
+        model = ProductionModel(
+            weekly_value,
+            player_map,
+            rosters,
+            await load_pick_value_curve(self.db),
+        )
+        _production_cache.set_many({PRODUCTION_MODEL_KEY: model})
+        return model
+
+    def _weighted_points_query(self):
+        """Every player-week with its starter-weighted points."""
+        weight = case(
+            (MatchupPlayerPoint.is_starter.is_(True), STARTER_WEIGHT),
+            else_=BENCH_WEIGHT,
+        )
+        return (
+            select(
+                MatchupPlayerPoint.player_id,
+                (func.coalesce(MatchupPlayerPoint.points, 0.0) * weight).label("weighted"),
+            )
+            .join(Matchup, MatchupPlayerPoint.matchup_id == Matchup.id)
+            .join(Season, Matchup.season_id == Season.id)
         )
-        draft_order_map: Dict[int, Dict[int, int]] = {}
-        for year, order in draft_result.all():
-            if order:
-                # draft_order is {slot_str: roster_id}, invert to
-                # {roster_id: slot_int}
-                inverted: Dict[int, int] = {}
-                for slot_str, rid in order.items():
-                    inverted[int(rid)] = int(slot_str)
-                draft_order_map[year] = inverted
 
-        return pick_index, draft_order_map
+    async def _recent_weekly_values_windowed(self) -> Dict[str, float]:
+        """Average weighted points over each player's last
+        EVALUATION_RECENT_WEEKS weeks, ranked with ROW_NUMBER()."""
+        ranked = self._weighted_points_query().add_columns(
+            func.row_number().over(
+                partition_by=MatchupPlayerPoint.player_id,
+                order_by=(desc(Season.year), desc(Matchup.week)),
+            ).label("week_rank")
+        ).subquery()
+        result = await self.db.execute(
+            select(ranked.c.player_id, func.avg(ranked.c.weighted))
+            .where(ranked.c.week_rank <= EVALUATION_RECENT_WEEKS)
+            .group_by(ranked.c.player_id)
+        )
+        return {pid: float(avg or 0.0) for pid, avg in result.all()}
+
+    async def _recent_weekly_values_ordered(self) -> Dict[str, float]:
+        """Same as the windowed version, slicing newest-first rows in Python."""
+        result = await self.db.execute(
+            self._weighted_points_query().order_by(
+                MatchupPlayerPoint.player_id, desc(Season.year), desc(Matchup.week)
+            )
+        )
+        recent: Dict[str, List[float]] = defaultdict(list)
+        for pid, weighted in result.all():
+            if len(recent[pid]) < EVALUATION_RECENT_WEEKS:
+                recent[pid].append(float(weighted or 0.0))
+        return {pid: sum(vals) / len(vals) for pid, vals in recent.items()}
 
     # ------------------------------------------------------------------
     # Computation helpers
@@ -454,39 +805,14 @@ class TradeGradingService:
         user_id: str,
         trade_season_year: int,
         trade_week: int,
-        points_index: Dict,
-        roster_to_user: Dict[int, str],
-        user_roster_map: Dict[str, Set[int]],
+        points_index: PlayerWeekStore,
     ) -> Tuple[float, int, int]:
         """Sum weighted points for a player on ANY roster belonging to
         user_id after the trade.  Returns (total_value, starter_weeks,
         bench_weeks)."""
-        total = 0.0
-        starter_weeks = 0
-        bench_weeks = 0
-
-        # All db_roster_ids that belong to this user
-        user_rids = user_roster_map.get(user_id, set())
-
-        for key, (pts, is_starter) in points_index.items():
-            pid, rid, year, week = key
-            if pid != str(player_id):
-                continue
-            if rid not in user_rids:
-                continue
-            # Only count weeks after the trade
-            if year < trade_season_year:
-                continue
-            if year == trade_season_year and week <= trade_week:
-                continue
-            weight = STARTER_WEIGHT if is_starter else BENCH_WEIGHT
-            total += pts * weight
-            if is_starter:
-                starter_weeks += 1
-            else:
-                bench_weeks += 1
-
-        return total, starter_weeks, bench_weeks
+        return points_index.value_after(
+            player_id, user_id, trade_season_year, trade_week
+        )
 
     def _calculate_replacement_factor(
         self,
@@ -542,50 +868,24 @@ class TradeGradingService:
         self,
         trade_season_year: int,
         trade_week: int,
-        points_index: Dict,
+        latest: Optional[Tuple[int, int]],
     ) -> int:
-        """Approximate number of weeks of data after the trade."""
-        max_year = trade_season_year
-        max_week = trade_week
-        for (_, _, year, week) in points_index:
-            if year > max_year or (year == max_year and week > max_week):
-                max_year = year
-                max_week = week
+        """Approximate number of weeks of data after the trade, given the
+        latest (season_year, week) with points."""
+        max_year, max_week = max(
+            (trade_season_year, trade_week),
+            latest or (trade_season_year, trade_week),
+        )
         if max_year == trade_season_year:
             return max(0, max_week - trade_week)
         return (max_week) + (max_year - trade_season_year - 1) * 17 + (
             17 - trade_week
         )
 
-    # ------------------------------------------------------------------
-    # Core grade computation
-    # ------------------------------------------------------------------
-
-    def _grade_trade(
-        self,
-        txn: Transaction,
-        season_obj: Season,
-        sleeper_roster_map: Dict,
-        user_roster_map: Dict[str, Set[int]],
-        roster_to_user: Dict[int, str],
-        player_map: Dict,
-        points_index: Dict,
-        position_points: Dict,
-        pick_baselines: Dict,
-        pick_index: Dict,
-        draft_order_map: Dict,
-    ) -> dict:
-        trade_year = season_obj.year
-        trade_week = txn.week or 0
-
-        roster_ids = txn.roster_ids or []
-        adds = txn.adds or {}
-        drops = txn.drops or {}
-        picks = txn.picks or []
-
-        # Build per-side assets
+    def _build_sides(self, txn: Transaction) -> Dict[int, dict]:
+        """sleeper_roster_id -> assets that side received and gave up."""
         sides_data: Dict[int, dict] = {}
-        for rid in roster_ids:
+        for rid in txn.roster_ids or []:
             rid = int(rid)
             sides_data[rid] = {
                 "roster_id": rid,
@@ -594,21 +894,21 @@ class TradeGradingService:
                 "players_given": [],
             }
 
-        for player_id, target_rid in adds.items():
+        for player_id, target_rid in (txn.adds or {}).items():
             target_rid = int(target_rid)
             if target_rid in sides_data:
                 sides_data[target_rid]["players_received"].append(
                     str(player_id)
                 )
 
-        for player_id, source_rid in drops.items():
+        for player_id, source_rid in (txn.drops or {}).items():
             source_rid = int(source_rid)
             if source_rid in sides_data:
                 sides_data[source_rid]["players_given"].append(
                     str(player_id)
                 )
 
-        for pick in picks:
+        for pick in txn.picks or []:
             owner_id = pick.get("owner_id")
             prev_owner_id = pick.get("previous_owner_id")
             if owner_id is not None and prev_owner_id is not None:
@@ -616,6 +916,196 @@ class TradeGradingService:
                 prev_owner_id = int(prev_owner_id)
                 if owner_id != prev_owner_id and owner_id in sides_data:
                     sides_data[owner_id]["picks_received"].append(pick)
+        return sides_data
+
+    def _side_replacement_factor(
+        self,
+        player_id: str,
+        rid: int,
+        sides_data: Dict[int, dict],
+        season_obj: Season,
+        trade_week: int,
+        sleeper_roster_map: Dict,
+        user_roster_map: Dict[str, Set[int]],
+        player_map: Dict,
+        position_points: Dict,
+    ) -> float:
+        """Replacement factor for a player side rid received, measured on
+        the side that gave the player away."""
+        # Find which side gave this player away
+        giving_rid = None
+        for other_rid, other_data in sides_data.items():
+            if other_rid != rid and str(player_id) in [
+                str(p) for p in other_data.get("players_given", [])
+            ]:
+                giving_rid = other_rid
+                break
+        if giving_rid is None:
+            return 1.0
+
+        giving_info = sleeper_roster_map.get((season_obj.id, giving_rid), {})
+        giving_user_id = giving_info.get("user_id")
+        if not giving_user_id:
+            return 1.0
+        return self._calculate_replacement_factor(
+            player_map.get(str(player_id), {}).get("position"),
+            giving_user_id,
+            season_obj.year,
+            trade_week,
+            position_points,
+            user_roster_map,
+        )
+
+    def _resolve_pick(
+        self,
+        pick: dict,
+        pick_index: Dict,
+        draft_order_map: Dict,
+    ) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]:
+        """(season, round, original sleeper roster_id, drafted player_id or
+        None) for a traded pick."""
+        # Sleeper stores season as string in JSON; cast to int
+        pick_season_raw = pick.get("season")
+        try:
+            pick_season = int(pick_season_raw) if pick_season_raw is not None else None
+        except (ValueError, TypeError):
+            pick_season = pick_season_raw
+        pick_round = pick.get("round")
+        # roster_id = original owner's slot, owner_id = current
+        original_roster = pick.get("roster_id")
+
+        # Look up the draft slot for the original roster
+        resolved_player_id = None
+        if pick_season and original_roster is not None:
+            order = draft_order_map.get(pick_season, {})
+            slot = order.get(int(original_roster))
+            if slot is not None:
+                resolved_player_id = pick_index.get(
+                    (pick_season, pick_round, slot)
+                )
+        return pick_season, pick_round, original_roster, resolved_player_id
+
+    def _projected_pick_ppw(
+        self,
+        pick_curve: Optional[PickValueCurve],
+        pick_season: Optional[int],
+        pick_round: Optional[int],
+        original_roster: Optional[int],
+        draft_order_map: Dict,
+    ) -> float:
+        """Expected weighted points per week for an unused pick: its slot on
+        the value curve once the draft order is set, else the round
+        average."""
+        if pick_curve is None:
+            return 0.0
+        slot = None
+        if pick_season and original_roster is not None:
+            slot = draft_order_map.get(pick_season, {}).get(int(original_roster))
+        return pick_curve.value(FUTURE_PICK_DRAFT_TYPE, pick_round, slot)
+
+    def _trade_dependencies(
+        self,
+        txn: Transaction,
+        season_obj: Season,
+        sleeper_roster_map: Dict,
+        user_roster_map: Dict[str, Set[int]],
+        player_map: Dict,
+        points_index: PlayerWeekStore,
+        position_points: Dict,
+        pick_curve: Optional[PickValueCurve],
+        pick_index: Dict,
+        draft_order_map: Dict,
+        latest: Optional[Tuple[int, int]],
+    ) -> Tuple[dict, Set[str], List[list]]:
+        """Everything a trade's grade is computed from, for fingerprinting.
+
+        Returns (dependencies, player_ids, pick_slots) where player_ids are
+        the received and drafted players whose points feed the grade.
+        """
+        sides_data = self._build_sides(txn)
+        sides = {}
+        player_ids: Set[str] = set()
+        pick_slots: List[list] = []
+        replacement: Dict[str, float] = {}
+        projected: List[list] = []
+        owner_ids: Set[str] = set()
+
+        for rid, data in sides_data.items():
+            roster_info = sleeper_roster_map.get((season_obj.id, rid), {})
+            sides[str(rid)] = roster_info
+            if roster_info.get("user_id"):
+                owner_ids.add(roster_info["user_id"])
+
+            for pid in data["players_received"]:
+                player_ids.add(str(pid))
+                replacement[str(pid)] = self._side_replacement_factor(
+                    pid,
+                    rid,
+                    sides_data,
+                    season_obj,
+                    txn.week or 0,
+                    sleeper_roster_map,
+                    user_roster_map,
+                    player_map,
+                    position_points,
+                )
+
+            for pick in data["picks_received"]:
+                pick_season, pick_round, original_roster, resolved = (
+                    self._resolve_pick(pick, pick_index, draft_order_map)
+                )
+                pick_slots.append([pick_season, pick_round, original_roster])
+                if resolved:
+                    player_ids.add(resolved)
+                else:
+                    # Projected picks grow with every week of data
+                    ppw = self._projected_pick_ppw(
+                        pick_curve, pick_season, pick_round, original_roster, draft_order_map
+                    )
+                    projected.append([pick_round, ppw, latest])
+
+        # Only weeks on the involved owners' rosters count toward a grade
+        points = {
+            pid: {
+                uid: points_index.owner_summary(pid, uid)
+                for uid in sorted(owner_ids)
+            }
+            for pid in player_ids
+        }
+        deps = {
+            "trade": [
+                season_obj.year, txn.week, txn.roster_ids, txn.adds,
+                txn.drops, txn.picks, txn.status_updated,
+            ],
+            "sides": sides,
+            "players": {pid: player_map.get(pid) for pid in player_ids},
+            "points": points,
+            "replacement": replacement,
+            "picks": [pick_slots, projected],
+        }
+        return deps, player_ids, pick_slots
+
+    # ------------------------------------------------------------------
+    # Core grade computation
+    # ------------------------------------------------------------------
+
+    def _grade_trade(
+        self,
+        txn: Transaction,
+        season_obj: Season,
+        sleeper_roster_map: Dict,
+        user_roster_map: Dict[str, Set[int]],
+        player_map: Dict,
+        points_index: PlayerWeekStore,
+        position_points: Dict,
+        pick_curve: Optional[PickValueCurve],
+        pick_index: Dict,
+        draft_order_map: Dict,
+    ) -> dict:
+        trade_year = season_obj.year
+        trade_week = txn.week or 0
+
+        sides_data = self._build_sides(txn)
 
         # Calculate values for each side
         sides_output: List[dict] = []
@@ -637,36 +1127,21 @@ class TradeGradingService:
                         trade_year,
                         trade_week,
                         points_index,
-                        roster_to_user,
-                        user_roster_map,
                     )
                 else:
                     val, s_wks, b_wks = 0.0, 0, 0
 
-                # Find which side gave this player away
-                giving_rid = None
-                for other_rid, other_data in sides_data.items():
-                    if other_rid != rid and str(pid) in [
-                        str(p) for p in other_data.get("players_given", [])
-                    ]:
-                        giving_rid = other_rid
-                        break
-
-                repl_factor = 1.0
-                if giving_rid is not None:
-                    giving_info = sleeper_roster_map.get(
-                        (season_obj.id, giving_rid), {}
-                    )
-                    giving_user_id = giving_info.get("user_id")
-                    if giving_user_id:
-                        repl_factor = self._calculate_replacement_factor(
-                            pinfo.get("position"),
-                            giving_user_id,
-                            trade_year,
-                            trade_week,
-                            position_points,
-                            user_roster_map,
-                        )
+                repl_factor = self._side_replacement_factor(
+                    pid,
+                    rid,
+                    sides_data,
+                    season_obj,
+                    txn.week or 0,
+                    sleeper_roster_map,
+                    user_roster_map,
+                    player_map,
+                    position_points,
+                )
 
                 adjusted_value = val * repl_factor
                 total_value += adjusted_value
@@ -687,25 +1162,9 @@ class TradeGradingService:
             # Draft picks
             pick_details = []
             for pick in data["picks_received"]:
-                # Sleeper stores season as string in JSON; cast to int
-                pick_season_raw = pick.get("season")
-                try:
-                    pick_season = int(pick_season_raw) if pick_season_raw is not None else None
-                except (ValueError, TypeError):
-                    pick_season = pick_season_raw
-                pick_round = pick.get("round")
-                # roster_id = original owner's slot, owner_id = current
-                original_roster = pick.get("roster_id")
-
-                # Look up the draft slot for the original roster
-                resolved_player_id = None
-                if pick_season and original_roster is not None:
-                    order = draft_order_map.get(pick_season, {})
-                    slot = order.get(int(original_roster))
-                    if slot is not None:
-                        resolved_player_id = pick_index.get(
-                            (pick_season, pick_round, slot)
-                        )
+                pick_season, pick_round, original_roster, resolved_player_id = (
+                    self._resolve_pick(pick, pick_index, draft_order_map)
+                )
 
                 if resolved_player_id and user_id:
                     # Pick was used — use actual player's points
@@ -715,8 +1174,6 @@ class TradeGradingService:
                         trade_year,
                         trade_week,
                         points_index,
-                        roster_to_user,
-                        user_roster_map,
                     )
                     pick_value = p_val
                     status = "actual"
@@ -725,9 +1182,11 @@ class TradeGradingService:
                     ).get("full_name", f"Player {resolved_player_id}")
                 else:
                     # Pick not yet used — project with discount
-                    ppw = pick_baselines.get(pick_round, 0.0)
+                    ppw = self._projected_pick_ppw(
+                        pick_curve, pick_season, pick_round, original_roster, draft_order_map
+                    )
                     weeks_est = self._weeks_since_trade(
-                        trade_year, trade_week, points_index
+                        trade_year, trade_week, points_index.latest
                     )
                     pick_value = ppw * max(weeks_est, 1) * FUTURE_PICK_DISCOUNT
                     status = "projected"
@@ -769,7 +1228,7 @@ class TradeGradingService:
         lopsidedness = (max(shares) - min(shares)) if shares else 0.0
 
         weeks_of_data = self._weeks_since_trade(
-            trade_year, trade_week, points_index
+            trade_year, trade_week, points_index.latest
         )
 
         return {
@@ -0,0 +1,187 @@
+"""Weekly score index: every roster's score in every week of a season.
+
+Records against the weekly median (standings, owner stats, the head-to-head
+matrix and playoff odds) all come from the same roster x week scores.  Each
+season's scores are loaded in one query and cached per data version, and
+each week's median is computed once, the first time a view of that week is
+asked for: all games, one match_type, or only games already decided.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from statistics import median as calc_median
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Matchup
+from app.services.data_version import VersionedCache
+
+_index_cache = VersionedCache(max_entries=64)
+
+# Cache key for "every season is loaded"
+_ALL_SEASONS = "all"
+
+
+def is_decided(
+    winner_roster_id: Optional[int], home_points: Optional[float], away_points: Optional[float]
+) -> bool:
+    """Whether a game is over: it has a winner, or ended level after both
+    teams scored (a tie)."""
+    if winner_roster_id is not None:
+        return True
+    return bool(home_points) and home_points == away_points
+
+
+class WeekScore(NamedTuple):
+    roster_id: int
+    points: float
+    match_type: Optional[str]
+    played: bool  # the matchup is decided
+
+
+@dataclass(frozen=True)
+class WeekSlice:
+    """The scores in one view of a week, with their median."""
+
+    roster_ids: Tuple[int, ...]
+    points: Tuple[float, ...]
+    median: float
+
+    @classmethod
+    def build(cls, scores: List[WeekScore]) -> "WeekSlice":
+        points = tuple(s.points for s in scores)
+        return cls(
+            roster_ids=tuple(s.roster_id for s in scores),
+            points=points,
+            median=calc_median(points),
+        )
+
+
+def _empty_record() -> Dict[str, int]:
+    return {"wins": 0, "losses": 0, "ties": 0}
+
+
+class SeasonScores:
+    """Roster scores by week for one season."""
+
+    def __init__(self, season_id: int, weeks: Dict[int, List[WeekScore]]):
+        self.season_id = season_id
+        self._weeks = weeks
+        self._slices: Dict[
+            Tuple[int, Optional[str], bool, Optional[FrozenSet[int]]], Optional[WeekSlice]
+        ] = {}
+
+    @property
+    def weeks(self) -> List[int]:
+        return sorted(self._weeks)
+
+    def week_slice(
+        self,
+        week: int,
+        match_type: Optional[str] = "regular",
+        played_only: bool = False,
+        roster_ids: Optional[FrozenSet[int]] = None,
+    ) -> Optional[WeekSlice]:
+        """One view of a week: games of match_type (None for every game),
+        optionally only those already decided, and optionally only the
+        scores of roster_ids.  None if fewer than two scores are in it,
+        since there is no median to compare against."""
+        key = (week, match_type, played_only, roster_ids)
+        if key not in self._slices:
+            scores = [
+                s for s in self._weeks.get(week, [])
+                if (match_type is None or s.match_type == match_type)
+                and (s.played or not played_only)
+                and (roster_ids is None or s.roster_id in roster_ids)
+            ]
+            self._slices[key] = WeekSlice.build(scores) if len(scores) >= 2 else None
+        return self._slices[key]
+
+    def _slices_through(
+        self,
+        match_type: Optional[str],
+        through_week: Optional[int],
+        played_only: bool,
+        roster_ids: Optional[FrozenSet[int]] = None,
+    ) -> Iterable[WeekSlice]:
+        for week in self.weeks:
+            if through_week is not None and week > through_week:
+                continue
+            week_slice = self.week_slice(week, match_type, played_only, roster_ids)
+            if week_slice is not None:
+                yield week_slice
+
+    def median_records(
+        self,
+        match_type: Optional[str] = "regular",
+        through_week: Optional[int] = None,
+        played_only: bool = False,
+        roster_ids: Optional[FrozenSet[int]] = None,
+    ) -> Dict[int, Dict[str, int]]:
+        """Each roster's record against the weekly median.  With roster_ids,
+        the median is taken over those rosters' scores only."""
+        records: Dict[int, Dict[str, int]] = defaultdict(_empty_record)
+        for week_slice in self._slices_through(
+            match_type, through_week, played_only, roster_ids
+        ):
+            for rid, pts in zip(week_slice.roster_ids, week_slice.points):
+                if pts > week_slice.median:
+                    records[rid]["wins"] += 1
+                elif pts < week_slice.median:
+                    records[rid]["losses"] += 1
+                else:
+                    records[rid]["ties"] += 1
+        return dict(records)
+
+
+async def load_weekly_scores(
+    db: AsyncSession, season_ids: Optional[Iterable[int]] = None
+) -> Dict[int, SeasonScores]:
+    """SeasonScores for the given seasons (every season with matchups when
+    season_ids is None), cached per data version.  Seasons without
+    matchups get an empty index."""
+    if season_ids is None:
+        cached = _index_cache.get_many([_ALL_SEASONS])
+        if cached:
+            return cached[_ALL_SEASONS]
+        missing = None
+        found: Dict[int, SeasonScores] = {}
+    else:
+        season_ids = list(season_ids)
+        found = _index_cache.get_many(season_ids)
+        missing = [sid for sid in season_ids if sid not in found]
+        if not missing:
+            return found
+
+    query = select(
+        Matchup.season_id,
+        Matchup.week,
+        Matchup.match_type,
+        Matchup.home_roster_id,
+        Matchup.home_points,
+        Matchup.away_roster_id,
+        Matchup.away_points,
+        Matchup.winner_roster_id,
+    )
+    if missing is not None:
+        query = query.where(Matchup.season_id.in_(missing))
+    result = await db.execute(query)
+
+    weeks: Dict[int, Dict[int, List[WeekScore]]] = defaultdict(lambda: defaultdict(list))
+    for season_id, week, match_type, home_rid, home_pts, away_rid, away_pts, winner in result.all():
+        played = is_decided(winner, home_pts, away_pts)
+        weeks[season_id][week].append(WeekScore(home_rid, home_pts or 0, match_type, played))
+        weeks[season_id][week].append(WeekScore(away_rid, away_pts or 0, match_type, played))
+
+    # Seasons already indexed keep their instance, and the weeks it has built
+    loaded = _index_cache.get_many(list(weeks)) if missing is None else {}
+    for sid in (weeks if missing is None else missing):
+        if sid not in loaded:
+            loaded[sid] = SeasonScores(sid, dict(weeks.get(sid, {})))
+    _index_cache.set_many(loaded)
+    if missing is None:
+        _index_cache.set_many({_ALL_SEASONS: loaded})
+    found.update(loaded)
+    return found
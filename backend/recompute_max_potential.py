@@ -0,0 +1,71 @@
+"""Recompute matchup max potential points from stored data.
+
+Re-runs the lineup optimizer over every matchup without calling Sleeper,
+e.g. after the optimizer changes or player positions are corrected.  The
+work runs in the API server (POST /api/sync/max-potential) so its caches
+see the new values; this prints the server's progress per season.
+
+Usage:
+    python backend/recompute_max_potential.py [--season YEAR] [--url URL]  (from project root)
+    python recompute_max_potential.py [--season YEAR] [--url URL]          (from backend directory)
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+
+DEFAULT_URL = os.environ.get("API_URL", "http://localhost:8000")
+
+
+def report(summary: dict):
+    line = (
+        f"{summary['year']}: {summary['updated']}/{summary['matchups']} matchups updated "
+        f"({summary['rosters']} rosters solved, {summary['lineups']} lineups redone)"
+    )
+    if summary.get("skipped"):
+        line += f" - skipped: {summary['skipped']}"
+    print(line, flush=True)
+
+
+async def recompute(url: str, season: int = None) -> int:
+    params = {"season": season} if season is not None else {}
+    async with httpx.AsyncClient(timeout=None) as client:
+        async with client.stream(
+            "POST", f"{url.rstrip('/')}/api/sync/max-potential", params=params
+        ) as response:
+            if response.status_code == 404:
+                print(f"❌ Season {season} not found")
+                return 1
+            if response.status_code != 200:
+                await response.aread()
+                print(f"❌ Recompute failed ({response.status_code}): {response.text}")
+                return 1
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                message = json.loads(line)
+                if "year" in message:
+                    report(message)
+                elif message.get("status") == "error":
+                    print(f"❌ {message['detail']}")
+                    return 1
+                else:
+                    print(
+                        f"✅ Updated {message['updated']} matchups across "
+                        f"{message['seasons']} seasons"
+                    )
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--season", type=int, help="Only recompute this season year")
+    parser.add_argument(
+        "--url", default=DEFAULT_URL,
+        help="API server base URL, defaults to $API_URL (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(recompute(args.url, args.season)))
@@ -0,0 +1,148 @@
+"""Benchmark the playoff odds Monte Carlo loop.
+
+Times _run_simulations on a synthetic 12-team, two-division season with
+6 regular season weeks left to play (NUM_SIMULATIONS runs, normal score
+model), and counts TeamState objects built during a run.  No database is
+needed.  It prints a checksum of the counters too; the simulation is
+seeded, so two versions of playoff_odds.py that agree on results print
+the same checksum.
+
+To compare against an earlier version, run this script in a checkout of
+that commit (copy the script over if it predates it).
+
+Usage:
+    python backend/scripts/benchmark_playoff_simulations.py [--repeat N]  (from project root)
+    python scripts/benchmark_playoff_simulations.py [--repeat N]          (from backend directory)
+"""
+import argparse
+import hashlib
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+
+from app.services import playoff_odds  # noqa: E402
+from app.services.playoff_bracket import bracket_plan_from_settings  # noqa: E402
+from app.services.playoff_odds import (  # noqa: E402
+    NUM_SIMULATIONS,
+    SeasonState,
+    TeamState,
+    _compute_team_rating,
+    _run_simulations,
+)
+
+NUM_TEAMS = 12
+REGULAR_SEASON_WEEKS = 14
+WEEKS_PLAYED = 8
+
+
+def build_season() -> SeasonState:
+    """A seeded mid-season state: records after WEEKS_PLAYED round-robin weeks."""
+    rng = random.Random(2024)
+    teams = {}
+    for rid in range(1, NUM_TEAMS + 1):
+        wins = rng.randint(0, WEEKS_PLAYED)
+        median_wins = rng.randint(0, WEEKS_PLAYED)
+        points_for = round(rng.uniform(90, 140) * WEEKS_PLAYED, 2)
+        team = TeamState(
+            roster_db_id=rid,
+            roster_id=rid,
+            user_id=f"u{rid}",
+            display_name=f"Owner {rid}",
+            username=f"owner{rid}",
+            team_name=f"Team {rid}",
+            avatar=None,
+            division=1 if rid <= NUM_TEAMS // 2 else 2,
+            wins=wins,
+            losses=WEEKS_PLAYED - wins,
+            median_wins=median_wins,
+            median_losses=WEEKS_PLAYED - median_wins,
+            points_for=points_for,
+            points_against=round(rng.uniform(90, 140) * WEEKS_PLAYED, 2),
+            max_potential_points=round(points_for * rng.uniform(1.1, 1.3), 2),
+            avg_ppg=points_for / WEEKS_PLAYED,
+            rating=0.0,
+        )
+        team.rating = _compute_team_rating(team, WEEKS_PLAYED)
+        teams[rid] = team
+
+    # Circle-method round robin for the remaining weeks
+    remaining_by_week = {}
+    matchup_id = 0
+    order = list(teams)
+    for week in range(WEEKS_PLAYED + 1, REGULAR_SEASON_WEEKS + 1):
+        games = []
+        for i in range(NUM_TEAMS // 2):
+            matchup_id += 1
+            games.append((matchup_id, order[i], order[-1 - i]))
+        remaining_by_week[week] = games
+        order = [order[0], order[-1]] + order[1:-1]
+    remaining_games = {
+        game[0]: game for games in remaining_by_week.values() for game in games
+    }
+
+    return SeasonState(
+        season_year=2024,
+        current_week=WEEKS_PLAYED,
+        regular_season_weeks=REGULAR_SEASON_WEEKS,
+        division_names={"1": "Division 1", "2": "Division 2"},
+        teams=teams,
+        remaining_by_week=remaining_by_week,
+        remaining_games=remaining_games,
+        bracket=bracket_plan_from_settings({}, num_divisions=2),
+        fingerprint=None,
+    )
+
+
+def count_team_states(state: SeasonState) -> int:
+    """TeamState objects constructed during one _run_simulations call."""
+    built = 0
+    original = TeamState.__init__
+
+    def counting_init(self, **kwargs):
+        nonlocal built
+        built += 1
+        original(self, **kwargs)
+
+    TeamState.__init__ = counting_init
+    try:
+        _run_simulations(state)
+    finally:
+        TeamState.__init__ = original
+    return built
+
+
+def checksum(counters) -> str:
+    payload = repr(sorted(
+        (name, sorted(values.items())) for name, values in counters.items()
+    ))
+    return hashlib.sha1(payload.encode()).hexdigest()[:12]
+
+
+def main(repeat: int) -> int:
+    state = build_season()
+    print(
+        f"{NUM_TEAMS} teams, {REGULAR_SEASON_WEEKS - WEEKS_PLAYED} weeks remaining, "
+        f"{NUM_SIMULATIONS:,} simulations ({Path(playoff_odds.__file__).resolve()})"
+    )
+
+    timings = []
+    counters = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        counters = _run_simulations(state)
+        timings.append(time.perf_counter() - start)
+
+    print(f"TeamState objects built per run: {count_team_states(state):,}")
+    print(f"wall time, best of {repeat}: {min(timings):.2f} s")
+    print(f"counters checksum: {checksum(counters)}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs (best is reported)")
+    args = parser.parse_args()
+    sys.exit(main(args.repeat))
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from httpx import AsyncClient, ASGITransport
 
 from app.database import Base, get_db
+from app.services.data_version import bump_version
 from app.main import app
 from app.models import (
     League, User, Season, Roster, Matchup, Player,
@@ -37,6 +38,8 @@ async def tables(engine):
     """Create all tables before each test, drop after for isolation."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Each test starts from fresh data, so invalidate derived-data caches
+    bump_version()
     yield
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
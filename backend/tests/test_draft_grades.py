@@ -1,3 +1,8 @@
+from sqlalchemy import event, select, update
+
+from app.models import League, MatchupPlayerPoint
+from app.services.data_version import bump_version
+from app.services.draft_grading import DraftGradingService
 from tests.conftest import (
     create_league,
     create_season,
@@ -397,3 +402,159 @@ async def test_draft_grades_response_has_all_fields(client, db_session):
     assert "starter_weeks" in pick
     assert "bench_weeks" in pick
     assert "total_weeks" in pick
+
+
+async def test_draft_grades_query_count_is_constant(client, db_session, engine):
+    """The number of queries does not grow with the number of drafts."""
+
+    async def count_queries(num_drafts):
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+        try:
+            response = await client.get("/api/draft-grades")
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", before_execute)
+        assert response.json()["total"] == num_drafts
+        return len(statements)
+
+    draft, season, r1, r2, u1, u2 = await _setup_basic_draft(db_session, year=2020)
+    p1 = await create_player(db_session, id="p1", full_name="Player 1", position="WR")
+    await _add_draft_pick(db_session, draft, 1, 1, 1, p1)
+    await _add_player_points(db_session, season, r1, p1, 1, 10.0)
+    await db_session.flush()
+    one = await count_queries(1)
+
+    league = (await db_session.execute(select(League))).scalar_one()
+    for year in (2021, 2022, 2023):
+        later = await create_season(db_session, league, year=year)
+        await create_roster(db_session, later, u1, roster_id=1)
+        await create_roster(db_session, later, u2, roster_id=2)
+        rookie = await create_draft(
+            db_session, later, id=f"draft_{year}", year=year, rounds=3,
+            draft_order={"1": 1, "2": 2},
+        )
+        player = await create_player(db_session, id=f"r{year}", full_name=f"Rookie {year}")
+        await _add_draft_pick(db_session, rookie, 1, 2, 2, player)
+    await db_session.flush()
+    bump_version()
+    many = await count_queries(4)
+
+    assert many == one
+
+
+async def test_draft_grades_refresh_adds_only_new_weeks(client, db_session):
+    """After new weeks are synced, stored picks gain just those weeks and
+    match a full regrade."""
+    draft, season, r1, r2, u1, u2 = await _setup_basic_draft(db_session, year=2020)
+    p1 = await create_player(db_session, id="p1", full_name="Player 1", position="WR")
+    p2 = await create_player(db_session, id="p2", full_name="Player 2", position="RB")
+    await _add_draft_pick(db_session, draft, 1, 1, 1, p1)
+    await _add_draft_pick(db_session, draft, 1, 2, 2, p2)
+    for wk in [1, 2]:
+        await _add_player_points(db_session, season, r1, p1, wk, 10.0)
+        await _add_player_points(db_session, season, r2, p2, wk, 8.0, is_starter=False)
+    await db_session.flush()
+
+    service = DraftGradingService(db_session)
+    result = await service.refresh_grades()
+    assert result["graded"] == [draft.id]
+
+    # Nothing new: nothing to do
+    bump_version()
+    result = await service.refresh_grades()
+    assert result["unchanged"] == 1
+
+    # Week 3 arrives
+    await _add_player_points(db_session, season, r1, p1, 3, 20.0)
+    await db_session.flush()
+    bump_version()
+    result = await service.refresh_grades()
+    assert result["updated"] == [draft.id]
+    assert result["graded"] == []
+
+    grade = await service.get_draft_grade(draft.id)
+    assert grade["weeks_of_data"] == 3
+    owner1 = next(o for o in grade["owners"] if o["user_id"] == "user1")
+    assert owner1["picks"][0]["weighted_points"] == 60.0  # (10 + 10 + 20) * 1.5
+    assert owner1["picks"][0]["starter_weeks"] == 3
+
+    await service.refresh_grades(force=True)
+    assert await service.get_draft_grade(draft.id) == grade
+
+
+async def test_draft_grades_refresh_picks_up_resynced_week(client, db_session):
+    """A week synced mid-week and re-synced with final scores is not left
+    with its partial points."""
+    draft, season, r1, r2, u1, u2 = await _setup_basic_draft(db_session, year=2020)
+    p1 = await create_player(db_session, id="p1", full_name="Player 1", position="WR")
+    await _add_draft_pick(db_session, draft, 1, 1, 1, p1)
+    await _add_player_points(db_session, season, r1, p1, 1, 10.0)
+    await db_session.flush()
+
+    service = DraftGradingService(db_session)
+    await service.refresh_grades()
+
+    # Week 1 final scores replace the partial ones; no new week arrives
+    await db_session.execute(
+        update(MatchupPlayerPoint).where(MatchupPlayerPoint.player_id == "p1").values(points=16.0)
+    )
+    await db_session.flush()
+    bump_version()
+    result = await service.refresh_grades()
+    assert result["updated"] == [draft.id]
+
+    grade = await service.get_draft_grade(draft.id)
+    owner1 = next(o for o in grade["owners"] if o["user_id"] == "user1")
+    assert owner1["picks"][0]["weighted_points"] == 24.0  # 16 * 1.5
+
+    bump_version()
+    assert (await service.refresh_grades())["unchanged"] == 1
+
+
+async def test_draft_grades_value_curve(client, db_session):
+    """The value curve is smoothed per pick and never rises with pick number."""
+    draft, season, r1, r2, u1, u2 = await _setup_basic_draft(db_session, year=2020)
+    players = [
+        await create_player(db_session, id=f"p{i}", full_name=f"Player {i}")
+        for i in range(1, 5)
+    ]
+    await _add_draft_pick(db_session, draft, 1, 1, 1, players[0])
+    await _add_draft_pick(db_session, draft, 1, 2, 2, players[1])
+    await _add_draft_pick(db_session, draft, 2, 1, 1, players[2])
+    await _add_draft_pick(db_session, draft, 2, 2, 2, players[3])
+    for wk in [1, 2]:
+        await _add_player_points(db_session, season, r1, players[0], wk, 20.0)
+    await _add_player_points(db_session, season, r2, players[1], 1, 10.0)
+    await _add_player_points(db_session, season, r1, players[2], 3, 10.0, is_starter=False)
+    # players[3] never scored: counts as 0 per week
+    await db_session.flush()
+
+    response = await client.get("/api/draft-grades/value-curve?draft_type=rookie")
+    assert response.status_code == 200
+    curves = response.json()["curves"]
+    assert len(curves) == 1
+    curve = curves[0]
+    assert curve["draft_type"] == "rookie"
+    assert curve["teams"] == 2
+    assert curve["drafted_players"] == 4
+
+    picks = curve["picks"]
+    assert [p["observed_ppw"] for p in picks] == [30.0, 15.0, 1.0, 0.0]
+    assert [(p["round"], p["pick_in_round"]) for p in picks] == [(1, 1), (1, 2), (2, 1), (2, 2)]
+    expected = [p["expected_ppw"] for p in picks]
+    assert expected == sorted(expected, reverse=True)
+    # Triangular kernel over all four picks: (30*7 + 15*6 + 1*5 + 0*4) / 22
+    assert expected[0] == round(305 / 22, 2)
+    assert len(curve["rounds"]) == 2
+
+    response = await client.get("/api/draft-grades/value-curve")
+    by_type = {c["draft_type"]: c for c in response.json()["curves"]}
+    assert by_type["startup"]["picks"] == []
+
+    response = await client.get("/api/draft-grades/value-curve?draft_type=bogus")
+    assert response.status_code == 400
@@ -118,6 +118,31 @@ async def test_h2h_matrix_median_records(client, db_session):
     assert median["u4"]["wins"] == 1
 
 
+async def test_h2h_matrix_median_ignores_inactive_owners(client, db_session):
+    """Inactive owners' scores do not move the median active owners face."""
+    league = await create_league(db_session)
+    season = await create_season(db_session, league)
+    u1 = await create_user(db_session, id="u1", display_name="Alice")
+    u2 = await create_user(db_session, id="u2", display_name="Bob")
+    u3 = await create_user(db_session, id="u3", display_name="Charlie")
+    gone = await create_user(db_session, id="gone", display_name="Former", is_active=False)
+    r1 = await create_roster(db_session, season, u1, roster_id=1)
+    r2 = await create_roster(db_session, season, u2, roster_id=2)
+    r3 = await create_roster(db_session, season, u3, roster_id=3)
+    r4 = await create_roster(db_session, season, gone, roster_id=4)
+
+    # Active scores 80, 90, 110 -> median 90; with the inactive 200 it would be 100
+    await create_matchup(db_session, season, r1, r2, week=1, matchup_id=1, home_points=80.0, away_points=90.0)
+    await create_matchup(db_session, season, r3, r4, week=1, matchup_id=2, home_points=110.0, away_points=200.0)
+
+    response = await client.get("/api/matchups/head-to-head-matrix")
+    median = response.json()["median_records"]
+    assert median["u1"] == {"wins": 0, "losses": 1, "ties": 0}
+    assert median["u2"] == {"wins": 0, "losses": 0, "ties": 1}
+    assert median["u3"] == {"wins": 1, "losses": 0, "ties": 0}
+    assert "gone" not in median
+
+
 async def test_h2h_matrix_median_with_match_type_filter(client, db_session):
     """Median calculation only considers matchups of the filtered type."""
     league = await create_league(db_session)
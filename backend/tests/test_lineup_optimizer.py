@@ -0,0 +1,82 @@
+from app.services.lineup_optimizer import LineupOptimizer, compile_plan
+
+
+def _player(player_id, position, points, positions=None):
+    player = {"player_id": player_id, "position": position, "points": points}
+    if positions:
+        player["positions"] = positions
+    return player
+
+
+def test_standard_lineup_ignores_bench_slots():
+    optimizer = LineupOptimizer(["QB", "RB", "WR", "FLEX", "SUPER_FLEX", "BN", "BN", "IR"])
+    result = optimizer.optimal_lineup([
+        _player("qb1", "QB", 20.0),
+        _player("qb2", "QB", 18.0),
+        _player("rb1", "RB", 12.0),
+        _player("rb2", "RB", 9.0),
+        _player("wr1", "WR", 11.0),
+        _player("wr2", "WR", 4.0),
+    ])
+
+    assert result["total"] == 20.0 + 12.0 + 11.0 + 9.0 + 18.0
+    assert [(e["slot"], e["player_id"]) for e in result["lineup"]] == [
+        ("QB", "qb1"), ("RB", "rb1"), ("WR", "wr1"), ("FLEX", "rb2"), ("SUPER_FLEX", "qb2"),
+    ]
+    assert optimizer.calculate_optimal_lineup([]) == 0.0
+
+
+def test_overlapping_flex_slots_are_solved_exactly():
+    """Filling WRRB_FLEX first with the WR would leave only the TE for
+    REC_FLEX."""
+    optimizer = LineupOptimizer(["WRRB_FLEX", "REC_FLEX"])
+    result = optimizer.optimal_lineup([
+        _player("wr", "WR", 10.0),
+        _player("rb", "RB", 8.0),
+        _player("te", "TE", 3.0),
+    ])
+
+    assert result["total"] == 18.0
+    assert {e["slot"]: e["player_id"] for e in result["lineup"]} == {
+        "WRRB_FLEX": "rb", "REC_FLEX": "wr",
+    }
+
+
+def test_multi_position_players_and_idp_slots():
+    optimizer = LineupOptimizer(["DL", "LB", "DB", "IDP_FLEX", "TE", "WR"])
+    result = optimizer.optimal_lineup([
+        _player("de", "DE", 9.0),
+        _player("dt", "DT", 7.0),
+        _player("lb", "LB", 6.0),
+        _player("cb", "CB", 2.0),
+        _player("s", "S", 5.0),
+        # Only eligible for TE once his WR eligibility is known
+        _player("hybrid", "WR", 14.0, positions=["WR", "TE"]),
+        _player("wr", "WR", 12.0),
+        _player("k", "K", 10.0),
+    ])
+
+    assert result["total"] == 9.0 + 6.0 + 5.0 + 7.0 + 14.0 + 12.0
+    lineup = {e["slot"]: e["player_id"] for e in result["lineup"]}
+    assert lineup == {
+        "DL": "de", "LB": "lb", "DB": "s", "IDP_FLEX": "dt", "TE": "hybrid", "WR": "wr",
+    }
+
+
+def test_empty_slots_and_non_scoring_players():
+    optimizer = LineupOptimizer(["QB", "RB", "DEF"])
+    result = optimizer.optimal_lineup([
+        _player("qb", "QB", 15.5),
+        _player("def", "DEF", -3.0),
+    ])
+
+    assert result["total"] == 15.5
+    assert [e["player_id"] for e in result["lineup"]] == ["qb", None, None]
+
+
+def test_plans_are_compiled_once_per_roster_setting():
+    slots = ["QB", "FLEX", "BN"]
+    assert LineupOptimizer(slots).plan is LineupOptimizer(list(slots)).plan
+    plan = compile_plan(tuple(slots))
+    assert plan.starters == ["QB", "FLEX"]
+    assert plan.position_mask("WR") == 0b10
@@ -1,3 +1,8 @@
+from sqlalchemy import event, select
+
+from app.models import OwnerSeasonStats
+from app.services.data_version import bump_version
+from app.services.owner_stats import OwnerStatsService
 from tests.conftest import (
     create_league, create_season, create_user, create_roster, create_matchup,
     create_season_award,
@@ -341,3 +346,118 @@ async def test_owner_trophies_zero_when_no_awards(client, db_session):
     assert response.status_code == 200
     owner = response.json()["owners"][0]
     assert owner["trophies"] == {"champion": 0, "division_winner": 0, "most_points": 0, "consolation": 0}
+
+
+async def test_owner_details_query_count_is_constant(client, db_session, engine):
+    """The number of queries does not grow with the number of seasons."""
+
+    async def count_queries(num_seasons):
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+        try:
+            response = await client.get("/api/owners/u1")
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", before_execute)
+        assert len(response.json()["seasons"]) == num_seasons
+        return len(statements)
+
+    league = await create_league(db_session)
+    user1 = await create_user(db_session, id="u1", display_name="Owner One")
+    user2 = await create_user(db_session, id="u2", display_name="Owner Two")
+
+    async def add_season(year):
+        season = await create_season(db_session, league, year=year)
+        r1 = await create_roster(db_session, season, user1, roster_id=1)
+        r2 = await create_roster(db_session, season, user2, roster_id=2)
+        for week in (1, 2):
+            await create_matchup(db_session, season, r1, r2, week=week, matchup_id=1,
+                                 home_points=100, away_points=90, winner_roster_id=r1.id)
+        await create_matchup(db_session, season, r1, r2, week=15, matchup_id=1,
+                             match_type="playoff", home_points=80, away_points=95,
+                             winner_roster_id=r2.id)
+
+    await add_season(2020)
+    await db_session.flush()
+    one = await count_queries(1)
+
+    for year in (2021, 2022, 2023):
+        await add_season(year)
+    await db_session.flush()
+    bump_version()
+    many = await count_queries(4)
+
+    assert many == one
+    data = (await client.get("/api/owners/u1")).json()
+    assert data["career_stats"]["regular_season"]["wins"] == 8
+    assert data["career_stats"]["playoff"]["losses"] == 4
+    assert data["seasons"][0]["median_wins"] == 2
+
+
+async def test_owner_season_stats_table(client, db_session):
+    """Stats rows are rebuilt per data version and rolled up into careers."""
+    league = await create_league(db_session, league_metadata={"division_1": "East"})
+    s1 = await create_season(db_session, league, year=2022)
+    user1 = await create_user(db_session, id="u1", display_name="Owner One")
+    user2 = await create_user(db_session, id="u2", display_name="Owner Two")
+    r1 = await create_roster(db_session, s1, user1, roster_id=1, division=1)
+    r2 = await create_roster(db_session, s1, user2, roster_id=2, division=2)
+    await create_matchup(db_session, s1, r1, r2, week=1, matchup_id=1,
+                         home_points=110.25, away_points=90.5, winner_roster_id=r1.id,
+                         home_max_potential_points=120.0)
+    await create_season_award(db_session, s1, user1, award_type="champion")
+
+    summary = await OwnerStatsService(db_session).refresh_stats()
+    assert summary == {"seasons": 2, "removed": 0}
+    rows = (await db_session.execute(
+        select(OwnerSeasonStats).order_by(OwnerSeasonStats.roster_id)
+    )).scalars().all()
+    assert [(r.user_id, r.regular_wins, r.regular_losses) for r in rows] == [
+        ("u1", 1, 0), ("u2", 0, 1),
+    ]
+    assert rows[0].division_name == "East"
+    assert rows[0].median_wins == 1
+    assert rows[0].champion_awards == 1
+
+    s2 = await create_season(db_session, league, year=2023)
+    r3 = await create_roster(db_session, s2, user1, roster_id=1)
+    r4 = await create_roster(db_session, s2, user2, roster_id=2)
+    await create_matchup(db_session, s2, r3, r4, week=1, matchup_id=1,
+                         home_points=80, away_points=100, winner_roster_id=r4.id)
+    await create_matchup(db_session, s2, r3, r4, week=16, matchup_id=1,
+                         match_type="playoff", home_points=120, away_points=100,
+                         winner_roster_id=r3.id)
+    await db_session.flush()
+    bump_version()
+
+    response = await client.get("/api/owners")
+    owner = next(o for o in response.json()["owners"] if o["user_id"] == "u1")
+    assert owner["seasons_played"] == 2
+    assert owner["regular_season"]["wins"] == 1
+    assert owner["regular_season"]["losses"] == 1
+    assert owner["regular_season"]["points_for"] == 190.25
+    assert owner["regular_season"]["max_potential_points"] == 120.0
+    assert owner["playoff"]["wins"] == 1
+    assert owner["trophies"]["champion"] == 1
+
+    detail = (await client.get("/api/owners/u1")).json()
+    assert detail["career_stats"] == {k: owner[k] for k in detail["career_stats"]}
+    assert [s["year"] for s in detail["seasons"]] == [2023, 2022]
+
+
+async def test_refresh_stats_waits_for_a_read_refresh(client, db_session):
+    """A direct rebuild takes the lock reads rebuild under."""
+    import asyncio
+
+    from app.services import owner_stats
+
+    service = OwnerStatsService(db_session)
+    async with owner_stats._refresh_lock:
+        task = asyncio.create_task(service.refresh_stats())
+        await asyncio.sleep(0.01)
+        assert not task.done()
+    await task
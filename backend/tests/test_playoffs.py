@@ -1,3 +1,10 @@
+import pytest
+from sqlalchemy import select
+
+from app.models import Matchup, Season
+from app.services.playoff_bracket import bracket_plan_from_settings, compile_bracket, simulate_bracket
+from app.services.playoff_timeline import backfill_playoff_timeline, get_playoff_timeline
+from app.services.score_models import ScoreModel, build_score_model
 from tests.conftest import create_league, create_season, create_user, create_roster, create_matchup
 
 
@@ -272,3 +279,386 @@ async def test_playoffs_response_percentages_format(client, db_session):
             display = team[field]
             # Should be one of: ">99%", "<1%", or "N%" format
             assert display.endswith("%"), f"{field} = '{display}' should end with %"
+
+
+async def _setup_scenario_season(db_session):
+    """4 teams, week 1 played, week 2 still to play."""
+    league = await create_league(db_session)
+    season = await create_season(db_session, league, year=2024, regular_season_weeks=14)
+
+    rosters = []
+    for i in range(4):
+        u = await create_user(
+            db_session, id=f"u{i}", username=f"user{i}", display_name=f"Owner {i}"
+        )
+        r = await create_roster(
+            db_session, season, u,
+            roster_id=i + 1,
+            division=1 if i < 2 else 2,
+            wins=1 if i % 2 == 0 else 0,
+            losses=0 if i % 2 == 0 else 1,
+            points_for=120 - i * 10,
+            points_against=100,
+        )
+        rosters.append(r)
+
+    played = await create_matchup(
+        db_session, season, rosters[0], rosters[1],
+        week=1, matchup_id=1,
+        home_points=120.0, away_points=110.0,
+        winner_roster_id=rosters[0].id,
+    )
+    await create_matchup(
+        db_session, season, rosters[2], rosters[3],
+        week=1, matchup_id=2,
+        home_points=100.0, away_points=90.0,
+        winner_roster_id=rosters[2].id,
+    )
+    remaining = await create_matchup(
+        db_session, season, rosters[0], rosters[3],
+        week=2, matchup_id=1,
+        home_points=0.0, away_points=0.0,
+        winner_roster_id=None,
+    )
+    await create_matchup(
+        db_session, season, rosters[1], rosters[2],
+        week=2, matchup_id=2,
+        home_points=0.0, away_points=0.0,
+        winner_roster_id=None,
+    )
+    return rosters, played, remaining
+
+
+async def test_playoff_scenario_forced_result(client, db_session):
+    """Locking a game shifts the winner's projection and reports deltas."""
+    rosters, _, remaining = await _setup_scenario_season(db_session)
+
+    response = await client.post(
+        "/api/playoffs/2024/scenarios",
+        json={"forced_results": [{"matchup_id": remaining.id, "winner_roster_id": 4}]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["forced_results"] == [{"matchup_id": remaining.id, "winner_roster_id": 4}]
+    assert len(data["teams"]) == 4
+
+    by_roster = {t["roster_id"]: t for t in data["teams"]}
+    underdog = by_roster[4]
+    favorite = by_roster[1]
+    assert underdog["scenario"]["projected_wins"] == 1.0
+    assert underdog["delta"]["projected_wins"] > 0
+    assert favorite["scenario"]["projected_wins"] == 1.0
+    assert favorite["delta"]["projected_wins"] < 0
+    for team in data["teams"]:
+        for key in ("make_playoffs_pct", "win_division_pct", "first_round_bye_pct", "win_finals_pct"):
+            assert team["delta"][key] == team["scenario"][key] - team["baseline"][key]
+
+
+async def test_playoff_scenario_rating_override(client, db_session):
+    """Rating overrides are echoed back and applied to the team."""
+    await _setup_scenario_season(db_session)
+
+    response = await client.post(
+        "/api/playoffs/2024/scenarios",
+        json={"rating_overrides": {"4": 1000}},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["rating_overrides"] == {"4": 1000.0}
+    underdog = next(t for t in data["teams"] if t["roster_id"] == 4)
+    assert underdog["team_rating"] == 1000.0
+    assert underdog["delta"]["projected_wins"] > 0
+
+
+async def test_playoff_scenario_rejects_played_matchup(client, db_session):
+    """Games that have already been played cannot be locked."""
+    _, played, _ = await _setup_scenario_season(db_session)
+
+    response = await client.post(
+        "/api/playoffs/2024/scenarios",
+        json={"forced_results": [{"matchup_id": played.id, "winner_roster_id": 2}]},
+    )
+    assert response.status_code == 400
+    assert "not a remaining" in response.json()["detail"]
+
+
+async def test_playoff_scenario_rejects_team_not_in_matchup(client, db_session):
+    """The forced winner must be one of the two teams in the matchup."""
+    _, _, remaining = await _setup_scenario_season(db_session)
+
+    response = await client.post(
+        "/api/playoffs/2024/scenarios",
+        json={"forced_results": [{"matchup_id": remaining.id, "winner_roster_id": 2}]},
+    )
+    assert response.status_code == 400
+
+
+async def test_playoff_scenario_season_not_found(client):
+    """Returns 404 for a non-existent season."""
+    response = await client.post("/api/playoffs/2020/scenarios", json={})
+    assert response.status_code == 404
+
+
+async def test_playoff_timeline_backfill(client, db_session):
+    """Backfill simulates each played week once and the timeline reads it back."""
+    await _setup_scenario_season(db_session)
+
+    response = await client.post("/api/playoffs/2024/timeline/backfill")
+    assert response.status_code == 200
+    assert response.json()["weeks_computed"] == [1]
+
+    # Re-running recomputes only the latest snapshotted week, which may
+    # have been taken before its results were final
+    response = await client.post("/api/playoffs/2024/timeline/backfill")
+    data = response.json()
+    assert data["weeks_computed"] == [1]
+    assert data["weeks_skipped"] == []
+
+    response = await client.get("/api/playoffs/2024/timeline")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["weeks"] == [1]
+    assert len(data["teams"]) == 4
+    first = data["teams"][0]
+    assert first["roster_id"] == 1
+    assert first["weeks"][0]["week"] == 1
+    assert first["weeks"][0]["record"] == "1 - 0"
+    assert 0 <= first["weeks"][0]["make_playoffs_pct"] <= 100
+
+
+async def test_playoff_timeline_reconstructs_each_week(client, db_session):
+    """Records in the timeline come from matchups, not the final roster totals."""
+    rosters, _, remaining = await _setup_scenario_season(db_session)
+    remaining.home_points = 80.0
+    remaining.away_points = 95.0
+    remaining.winner_roster_id = rosters[3].id
+    await db_session.flush()
+
+    response = await client.post("/api/playoffs/2024/timeline/backfill")
+    assert response.json()["weeks_computed"] == [1, 2]
+
+    response = await client.get("/api/playoffs/2024/timeline")
+    data = response.json()
+    assert data["weeks"] == [1, 2]
+    by_roster = {t["roster_id"]: t for t in data["teams"]}
+    assert [w["record"] for w in by_roster[4]["weeks"]] == ["0 - 1", "1 - 1"]
+    assert [w["record"] for w in by_roster[1]["weeks"]] == ["1 - 0", "1 - 1"]
+
+
+async def test_playoff_timeline_skips_week_in_progress(client, db_session):
+    """The league's current week is not snapshotted even if some of its games
+    already have a winner, and a snapshot taken of it mid-week is replaced."""
+    rosters, _, remaining = await _setup_scenario_season(db_session)
+    remaining.home_points = 80.0
+    remaining.away_points = 95.0
+    remaining.winner_roster_id = rosters[3].id
+    await db_session.flush()
+
+    # Snapshotted mid-week 2, as a backfill without the current week does
+    data = await backfill_playoff_timeline(db_session, 2024)
+    assert data["weeks_computed"] == [1, 2]
+
+    data = await backfill_playoff_timeline(db_session, 2024, current_week=2)
+    assert data["weeks_computed"] == []
+    assert data["weeks_skipped"] == [1]
+    timeline = await get_playoff_timeline(db_session, 2024)
+    assert timeline["weeks"] == [1]
+
+    # Once week 3 starts, week 2 is snapshotted and week 1, the latest
+    # snapshot so far, is recomputed
+    data = await backfill_playoff_timeline(db_session, 2024, current_week=3)
+    assert data["weeks_computed"] == [1, 2]
+    assert data["weeks_skipped"] == []
+
+
+async def test_playoff_timeline_counts_ties_as_played(client, db_session):
+    """A tied week is complete, as in the power rankings records."""
+    await _setup_scenario_season(db_session)
+    result = await db_session.execute(
+        select(Matchup).where(Matchup.week == 2)
+    )
+    for m in result.scalars():
+        m.home_points = m.away_points = 100.0
+    await db_session.flush()
+
+    data = await backfill_playoff_timeline(db_session, 2024)
+    assert data["weeks_computed"] == [1, 2]
+
+
+async def test_playoff_timeline_simulates_off_the_event_loop(client, db_session, monkeypatch):
+    """Even a one-week backfill simulates in the shared worker pool, not on
+    the event loop, and later backfills reuse that pool."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.services import playoff_timeline
+
+    await _setup_scenario_season(db_session)
+    simulated_on = []
+    run_simulations = playoff_timeline._run_simulations
+
+    def recording_run(state):
+        simulated_on.append(threading.get_ident())
+        return run_simulations(state)
+
+    # A thread pool stands in for the process pool so the call is observable
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(playoff_timeline, "_pool", pool)
+    monkeypatch.setattr(playoff_timeline, "_run_simulations", recording_run)
+    try:
+        for _ in range(2):
+            data = await backfill_playoff_timeline(db_session, 2024)
+            assert data["weeks_computed"] == [1]
+    finally:
+        pool.shutdown()
+
+    assert len(simulated_on) == 2
+    assert threading.get_ident() not in simulated_on
+    assert playoff_timeline._pool is pool
+
+
+async def test_playoff_timeline_season_not_found(client):
+    """Returns 404 for a non-existent season."""
+    response = await client.get("/api/playoffs/2020/timeline")
+    assert response.status_code == 404
+
+
+async def test_playoffs_empirical_score_model(client, db_session):
+    """The empirical model runs and is reported in the response."""
+    await _setup_scenario_season(db_session)
+
+    default = (await client.get("/api/playoffs/2024")).json()
+    assert default["score_model"] == "normal"
+
+    response = await client.get("/api/playoffs/2024?score_model=empirical")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["score_model"] == "empirical"
+    assert len(data["playoff_odds"]) == 4
+    for team in data["playoff_odds"]:
+        assert 0 <= team["make_playoffs_pct"] <= 100
+
+
+async def test_empirical_tables_use_regular_season_scores(db_session):
+    """Playoff and consolation scores stay out of the sampling tables."""
+    rosters, _, _ = await _setup_scenario_season(db_session)
+    season = (await db_session.execute(select(Season))).scalar_one()
+    await create_matchup(
+        db_session, season, rosters[0], rosters[1],
+        week=15, matchup_id=1, match_type="playoff",
+        home_points=200.0, away_points=190.0,
+        winner_roster_id=rosters[0].id,
+    )
+
+    model = await build_score_model(
+        db_session, "empirical", season, {r.id: None for r in rosters}
+    )
+    assert 200.0 not in model.tables[rosters[0].id]
+    assert 120.0 in model.tables[rosters[0].id]
+
+
+def test_score_model_requires_sampling_methods():
+    """ScoreModel is abstract; subclasses must implement sampling."""
+    with pytest.raises(TypeError):
+        ScoreModel()
+
+
+async def test_playoffs_invalid_score_model(client, db_session):
+    """Unknown score models are rejected."""
+    await _setup_scenario_season(db_session)
+    response = await client.get("/api/playoffs/2024?score_model=poisson")
+    assert response.status_code == 422
+
+
+def test_bracket_default_six_team_layout():
+    """Default settings compile to seeds 1-2 on byes, 3v6 and 4v5."""
+    plan = bracket_plan_from_settings({})
+    assert plan.num_teams == 6
+    assert plan.bye_seeds == {1, 2}
+    assert plan.round_weeks == (1, 1, 1)
+
+    games = []
+
+    def higher_seed_wins(a, b, weeks):
+        games.append((a, b))
+        return min(a, b)
+
+    champion, finish = simulate_bracket(plan, higher_seed_wins)
+    assert champion == 1
+    assert games == [(4, 5), (3, 6), (1, 4), (2, 3), (1, 2)]
+    assert finish == {5: 5, 6: 6, 3: 3, 4: 4, 2: 2, 1: 1}
+
+
+def test_bracket_reseed_and_two_week_rounds():
+    """Reseeded brackets pair best vs worst each round; round types set length."""
+    plan = bracket_plan_from_settings(
+        {"playoff_teams": 7, "playoff_seed_type": 1, "playoff_round_type": 2}
+    )
+    assert plan.bye_seeds == {1}
+    assert plan.round_weeks == (2, 2, 2)
+
+    games = []
+
+    def lower_seed_wins(a, b, weeks):
+        games.append((a, b, weeks))
+        return max(a, b)
+
+    champion, finish = simulate_bracket(plan, lower_seed_wins)
+    assert games[:3] == [(2, 7, 2), (3, 6, 2), (4, 5, 2)]
+    # Round 2 reseeds: 1 hosts the worst remaining seed
+    assert games[3:5] == [(1, 7, 2), (5, 6, 2)]
+    assert champion == 7
+    assert finish[1] == 3 and finish[5] == 4
+
+    final_only = compile_bracket(4, 2, 1, False)
+    assert final_only.round_weeks == (1, 2)
+    assert final_only.bye_seeds == frozenset()
+
+
+async def test_playoffs_use_league_playoff_settings(client, db_session):
+    """Leagues with two playoff teams have no byes and a single final."""
+    league = await create_league(db_session, settings={"playoff_teams": 2})
+    season = await create_season(db_session, league, year=2024, regular_season_weeks=14)
+    rosters = []
+    for i in range(4):
+        u = await create_user(db_session, id=f"u{i}", username=f"user{i}")
+        rosters.append(await create_roster(
+            db_session, season, u, roster_id=i + 1, division=1,
+            wins=1 if i < 2 else 0, losses=0 if i < 2 else 1,
+        ))
+    await create_matchup(
+        db_session, season, rosters[0], rosters[2], week=1, matchup_id=1,
+        home_points=120.0, away_points=100.0, winner_roster_id=rosters[0].id,
+    )
+    await create_matchup(
+        db_session, season, rosters[1], rosters[3], week=1, matchup_id=2,
+        home_points=110.0, away_points=90.0, winner_roster_id=rosters[1].id,
+    )
+
+    response = await client.get("/api/playoffs/2024")
+    assert response.status_code == 200
+    odds = response.json()["playoff_odds"]
+    assert sum(t["make_playoffs_pct"] for t in odds) == 200
+    assert all(t["first_round_bye_pct"] == 0 for t in odds)
+    assert sum(t["win_finals_pct"] for t in odds) == 100
+
+
+async def test_playoffs_draft_probabilities(client, db_session):
+    """Each team gets a full pick distribution and an expected pick."""
+    rosters, _, _ = await _setup_scenario_season(db_session)
+
+    response = await client.get("/api/playoffs/2024")
+    data = response.json()
+    matrix = data["draft_probabilities"]
+    assert len(matrix) == 4
+
+    for row in matrix:
+        assert len(row["pick_probabilities"]) == 4
+        assert abs(sum(row["pick_probabilities"]) - 100) < 0.5
+        assert 1 <= row["expected_pick"] <= 4
+    # Every pick is held by exactly one team in each simulation
+    for pick in range(4):
+        assert abs(sum(r["pick_probabilities"][pick] for r in matrix) - 100) < 0.5
+    expected = [r["expected_pick"] for r in matrix]
+    assert expected == sorted(expected)
+    assert abs(sum(expected) - 10) < 0.01
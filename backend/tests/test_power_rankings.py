@@ -0,0 +1,237 @@
+from sqlalchemy import event, select
+
+from app.models import Season
+from app.services.data_version import bump_version
+
+from tests.conftest import (
+    create_league, create_season, create_user, create_roster, create_matchup,
+    create_player, create_matchup_player_point, create_season_award,
+)
+
+
+async def _setup_league(db_session, num_teams=4):
+    """Two seasons of history; even-numbered owners win every game."""
+    league = await create_league(db_session)
+    prev = await create_season(db_session, league, year=2023)
+    season = await create_season(db_session, league, year=2024)
+
+    player = await create_player(db_session, id="p1", age=24)
+    users, rosters = [], []
+    for i in range(num_teams):
+        u = await create_user(db_session, id=f"u{i}", username=f"user{i}")
+        await create_roster(db_session, prev, u, roster_id=i + 1)
+        r = await create_roster(
+            db_session, season, u, roster_id=i + 1,
+            players=["p1"] if i == 0 else [],
+        )
+        users.append(u)
+        rosters.append(r)
+
+    for week in range(1, 4):
+        for i in range(0, num_teams, 2):
+            winner, loser = rosters[i], rosters[i + 1]
+            m = await create_matchup(
+                db_session, season, winner, loser, week=week, matchup_id=i // 2 + 1,
+                home_points=130.0 + i, away_points=100.0,
+                winner_roster_id=winner.id,
+            )
+            if i == 0:
+                await create_matchup_player_point(
+                    db_session, m, winner, player, points=25.0
+                )
+
+    await create_season_award(db_session, prev, users[0], award_type="champion")
+    return users, rosters
+
+
+async def test_power_rankings_no_season(client):
+    """Returns 404 when no season exists."""
+    response = await client.get("/api/power-rankings")
+    assert response.status_code == 404
+
+
+async def test_power_rankings_scores(client, db_session):
+    """Winners, the champion and the productive roster rank highest."""
+    await _setup_league(db_session)
+
+    response = await client.get("/api/power-rankings/2024")
+    assert response.status_code == 200
+    rankings = response.json()["rankings"]
+    assert [r["rank"] for r in rankings] == [1, 2, 3, 4]
+
+    by_roster = {r["roster_id"]: r for r in rankings}
+    top = by_roster[1]
+    assert rankings[0]["roster_id"] == 1
+    # 3-0: win pct 15, 2 of 3 teams below (8), +30 diff capped (8), form 5
+    assert top["current_season_score"] == 36.0
+    # One title: 5 + 2.67 playoff credit + 2 consistency
+    assert top["historical_score"] == 9.67
+    assert top["roster_value_score"] > 0
+
+    loser = by_roster[2]
+    # 0-3, lowest average, -30 diff -> 0
+    assert loser["current_season_score"] == 0.0
+    assert loser["historical_score"] == 2.0
+
+
+async def test_power_rankings_query_count_is_constant(client, db_session, engine):
+    """The number of queries does not grow with the number of teams."""
+
+    async def count_queries(num_teams):
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+        try:
+            response = await client.get("/api/power-rankings/2024")
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", before_execute)
+        assert response.status_code == 200
+        assert len(response.json()["rankings"]) == num_teams
+        return len(statements)
+
+    await _setup_league(db_session, num_teams=2)
+    small = await count_queries(2)
+
+    season = (
+        await db_session.execute(select(Season).where(Season.year == 2024))
+    ).scalar_one()
+    for i in range(2, 8):
+        u = await create_user(db_session, id=f"extra{i}", username=f"extra{i}")
+        await create_roster(db_session, season, u, roster_id=i + 1)
+    bump_version()
+    large = await count_queries(8)
+
+    assert large == small
+
+
+async def _setup_player_history(db_session):
+    """One player with 20 games: 10 at 5 pts in 2023, then 10 at 20 pts in 2024."""
+    league = await create_league(db_session)
+    user = await create_user(db_session)
+    opp = await create_user(db_session, id="opp", username="opp")
+    player = await create_player(db_session, id="p1")
+    for year, points in ((2023, 5.0), (2024, 20.0)):
+        season = await create_season(db_session, league, year=year)
+        roster = await create_roster(db_session, season, user, players=["p1"])
+        other = await create_roster(db_session, season, opp, roster_id=2)
+        for week in range(1, 11):
+            m = await create_matchup(
+                db_session, season, roster, other, week=week, matchup_id=1
+            )
+            await create_matchup_player_point(
+                db_session, m, roster, player, points=points
+            )
+
+
+async def test_roster_breakdown_uses_last_15_games(client, db_session):
+    """Production reflects the 15 most recent games by season and week."""
+    await _setup_player_history(db_session)
+
+    response = await client.get("/api/power-rankings/2024/roster/1")
+    assert response.status_code == 200
+    player = response.json()["players"][0]
+    # (10 * 20 + 5 * 5) / 15 = 15 ppg -> 7.5 production
+    assert player["production_score"] == 7.5
+
+
+async def test_roster_breakdown_without_window_functions(client, db_session, monkeypatch):
+    """The ordered fallback matches the windowed query."""
+    from app.services import power_rankings
+
+    monkeypatch.setattr(power_rankings, "supports_window_functions", lambda db: False)
+    await _setup_player_history(db_session)
+
+    response = await client.get("/api/power-rankings/2024/roster/1")
+    assert response.json()["players"][0]["production_score"] == 7.5
+
+
+async def test_power_rankings_snapshots_and_history(client, db_session):
+    """Refreshing snapshots the latest played week and serves reads from
+    it; earlier weeks are kept, not backfilled."""
+    from app.services.power_rankings import refresh_power_rankings
+
+    users, rosters = await _setup_league(db_session)
+
+    live = (await client.get("/api/power-rankings/2024")).json()
+    assert live["week"] is None
+
+    result = await refresh_power_rankings(db_session, 2024)
+    assert result["weeks_computed"] == [3]
+    # Refreshing does not bump the data version (sync bumps it once)
+    bump_version()
+
+    stored = (await client.get("/api/power-rankings/2024")).json()
+    assert stored["week"] == 3
+    assert stored["rankings"] == live["rankings"]
+
+    # Week 4 is played: its snapshot joins week 3's in the history
+    season = (await db_session.execute(select(Season).where(Season.year == 2024))).scalar_one()
+    for i in range(0, 4, 2):
+        await create_matchup(
+            db_session, season, rosters[i], rosters[i + 1], week=4,
+            matchup_id=i // 2 + 1, home_points=130.0, away_points=100.0,
+            winner_roster_id=rosters[i].id,
+        )
+    await db_session.commit()
+    result = await refresh_power_rankings(db_session, 2024)
+    assert result["weeks_computed"] == [4]
+    bump_version()
+
+    response = await client.get("/api/power-rankings/2024/history")
+    assert response.status_code == 200
+    history = response.json()
+    assert history["weeks"] == [3, 4]
+    by_roster = {t["roster_id"]: t for t in history["teams"]}
+    assert [w["week"] for w in by_roster[1]["weeks"]] == [3, 4]
+    assert by_roster[1]["weeks"][-1]["rank"] == 1
+
+
+async def test_power_rankings_refresh_is_incremental(client, db_session):
+    """Unchanged seasons are skipped; changed ones recompute the latest week."""
+    from app.services.power_rankings import refresh_power_rankings
+
+    users, rosters = await _setup_league(db_session)
+    await refresh_power_rankings(db_session, 2024)
+
+    result = await refresh_power_rankings(db_session, 2024)
+    assert result["weeks_computed"] == []
+    assert result["weeks_skipped"] == [3]
+
+    rosters[0].team_name = "Renamed"
+    await db_session.commit()
+    result = await refresh_power_rankings(db_session, 2024)
+    assert result["weeks_computed"] == [3]
+
+
+async def test_power_rankings_refresh_tracks_players_and_awards(client, db_session):
+    """Roster value and history inputs also invalidate the latest week."""
+    from app.models import Player
+    from app.services.power_rankings import refresh_power_rankings
+
+    users, rosters = await _setup_league(db_session)
+    await refresh_power_rankings(db_session, 2024)
+
+    player = await db_session.get(Player, "p1")
+    player.age = 31
+    await db_session.commit()
+    result = await refresh_power_rankings(db_session, 2024)
+    assert result["weeks_computed"] == [3]
+
+    prev = (await db_session.execute(select(Season).where(Season.year == 2023))).scalar_one()
+    await create_season_award(db_session, prev, users[2], award_type="division_winner")
+    await db_session.commit()
+    result = await refresh_power_rankings(db_session, 2024)
+    assert result["weeks_computed"] == [3]
+
+    result = await refresh_power_rankings(db_session, 2024)
+    assert result["weeks_computed"] == []
+
+
+async def test_power_rankings_history_season_not_found(client):
+    """Returns 404 for a non-existent season."""
+    response = await client.get("/api/power-rankings/2020/history")
+    assert response.status_code == 404
@@ -0,0 +1,96 @@
+from app.api import response_cache
+from app.api.response_cache import ResponseCache, CachedResponse
+from app.services.data_version import bump_version
+from tests.conftest import create_league, create_season, create_user, create_roster
+
+
+async def _setup(db_session):
+    league = await create_league(db_session)
+    season = await create_season(db_session, league, year=2024)
+    user = await create_user(db_session)
+    return await create_roster(db_session, season, user)
+
+
+async def test_cached_route_hits_until_data_version_changes(client, db_session):
+    """Repeat GETs are served from cache until a sync bumps the version."""
+    roster = await _setup(db_session)
+
+    first = await client.get("/api/standings/2024")
+    assert first.status_code == 200
+    assert first.headers["x-cache"] == "MISS"
+
+    second = await client.get("/api/standings/2024")
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    assert second.headers["etag"] == first.headers["etag"]
+
+    roster.wins = 9
+    await db_session.commit()
+    bump_version()
+
+    third = await client.get("/api/standings/2024")
+    assert third.headers["x-cache"] == "MISS"
+    assert third.headers["etag"] != first.headers["etag"]
+
+
+async def test_if_none_match_returns_304(client, db_session):
+    """A matching ETag short-circuits to 304 for the same data version."""
+    await _setup(db_session)
+
+    first = await client.get("/api/standings/2024")
+    etag = first.headers["etag"]
+
+    response = await client.get("/api/standings/2024", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    bump_version()
+    response = await client.get("/api/standings/2024", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+async def test_etag_from_before_restart_does_not_match(client, db_session, monkeypatch):
+    """The data version starts over on restart, so ETags are tied to the
+    process that issued them."""
+    await _setup(db_session)
+
+    first = await client.get("/api/standings/2024")
+    etag = first.headers["etag"]
+
+    monkeypatch.setattr(response_cache, "_BOOT_ID", "restarted")
+    response = await client.get("/api/standings/2024", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+async def test_query_param_order_shares_cache_entry(client, db_session):
+    """Params are normalized so their order does not split the cache."""
+    await _setup(db_session)
+
+    await client.get("/api/playoffs/2024?score_model=normal&a=1")
+    response = await client.get("/api/playoffs/2024?a=1&score_model=normal")
+    assert response.headers["x-cache"] == "HIT"
+
+
+async def test_errors_and_uncached_routes_are_not_cached(client, db_session):
+    """Only 200s from read routes are cached."""
+    await client.get("/api/standings/1999")
+    response = await client.get("/api/standings/1999")
+    assert response.status_code == 404
+    assert "x-cache" not in response.headers
+
+    response = await client.get("/api/health")
+    assert "etag" not in response.headers
+
+
+def test_response_cache_evicts_by_size():
+    """The least recently used entries go first once over the byte budget."""
+    cache = ResponseCache(max_bytes=250)
+    for i in range(3):
+        cache.put(("k", i), CachedResponse([], b"x" * 100))
+    assert len(cache) == 2
+    assert cache.get(("k", 0)) is None
+    assert cache.total_bytes == 200
+
+    cache.put(("big", 0), CachedResponse([], b"x" * 300))
+    assert cache.get(("big", 0)) is None
@@ -1,5 +1,18 @@
+import json
 from unittest.mock import AsyncMock, patch
 
+from app.models import LineupDecision
+
+from tests.conftest import (
+    create_league,
+    create_season,
+    create_user,
+    create_roster,
+    create_player,
+    create_matchup,
+    create_matchup_player_point,
+)
+
 
 def _make_mock_sleeper_client():
     """Create a mock SleeperClient with valid return data for all methods."""
@@ -60,3 +73,172 @@ async def test_sync_league_idempotent(client):
         response2 = await client.post("/api/sync/league")
     assert response1.status_code == 200
     assert response2.status_code == 200
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+async def test_recompute_max_potential(client, db_session):
+    """Stored max potential points are recomputed from player points, and
+    only matchups whose values change are written."""
+    league = await create_league(db_session, roster_positions=["QB", "FLEX", "BN"])
+    season = await create_season(db_session, league, year=2024)
+    u1 = await create_user(db_session, id="u1", username="owner1")
+    u2 = await create_user(db_session, id="u2", username="owner2")
+    r1 = await create_roster(db_session, season, u1, roster_id=1)
+    r2 = await create_roster(db_session, season, u2, roster_id=2)
+    qb = await create_player(db_session, id="qb", position="QB")
+    rb = await create_player(db_session, id="rb", position="RB")
+    wr = await create_player(db_session, id="wr", position="WR")
+    unknown = await create_player(db_session, id="nopos", position=None)
+
+    stale = await create_matchup(
+        db_session, season, r1, r2, week=1, matchup_id=1,
+        home_max_potential_points=1.0, away_max_potential_points=1.0,
+    )
+    for player, pts in [(qb, 20.0), (rb, 8.0), (wr, 12.0), (unknown, 30.0)]:
+        await create_matchup_player_point(db_session, stale, r1, player, points=pts)
+    await create_matchup_player_point(db_session, stale, r2, rb, points=5.0)
+    current = await create_matchup(
+        db_session, season, r1, r2, week=2, matchup_id=1,
+        home_max_potential_points=0.0, away_max_potential_points=0.0,
+    )
+    await db_session.commit()
+
+    response = await client.post("/api/sync/max-potential?season=2024")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert _ndjson(response) == [
+        {"year": 2024, "matchups": 2, "rosters": 2, "updated": 1, "lineups": 0},
+        {"status": "success", "updated": 1, "seasons": 1},
+    ]
+
+    await db_session.refresh(stale)
+    await db_session.refresh(current)
+    assert stale.home_max_potential_points == 32.0
+    assert stale.away_max_potential_points == 5.0
+    assert current.home_max_potential_points == 0.0
+
+    response = await client.post("/api/sync/max-potential?season=1999")
+    assert response.status_code == 404
+
+
+async def test_recompute_max_potential_refreshes_lineups(client, db_session):
+    """Stored start/sit analyses are redone with the new optimal lineup,
+    and matchups without player points are left NULL."""
+    league = await create_league(db_session, roster_positions=["QB", "FLEX", "BN"])
+    season = await create_season(db_session, league, year=2024)
+    u1 = await create_user(db_session, id="u1", username="owner1")
+    u2 = await create_user(db_session, id="u2", username="owner2")
+    r1 = await create_roster(db_session, season, u1, roster_id=1)
+    r2 = await create_roster(db_session, season, u2, roster_id=2)
+    qb = await create_player(db_session, id="qb", position="QB")
+    rb = await create_player(db_session, id="rb", position="RB")
+    wr = await create_player(db_session, id="wr", position="WR")
+
+    played = await create_matchup(
+        db_session, season, r1, r2, week=1, matchup_id=1,
+        home_points=28.0, away_points=30.0, winner_roster_id=r2.id,
+    )
+    for player, pts in [(qb, 20.0), (rb, 8.0), (wr, 12.0)]:
+        await create_matchup_player_point(
+            db_session, played, r1, player, points=pts, is_starter=player is not wr,
+        )
+    # Analysed before WR positions were known: no better lineup found
+    decision = LineupDecision(
+        matchup_id=played.id, roster_id=r1.id, season_id=season.id, week=1,
+        actual_points=28.0, optimal_points=28.0, opponent_points=30.0,
+        result="L", lost_to_lineup=False,
+        actual_lineup=["qb", "rb"], optimal_lineup=["qb", "rb"],
+        swaps=[], player_points={"qb": 20.0, "rb": 8.0},
+    )
+    db_session.add(decision)
+    unsynced = await create_matchup(db_session, season, r1, r2, week=2, matchup_id=1)
+    await db_session.commit()
+
+    response = await client.post("/api/sync/max-potential")
+    summary = _ndjson(response)[0]
+    assert summary["lineups"] == 1
+
+    await db_session.refresh(decision)
+    await db_session.refresh(unsynced)
+    assert decision.optimal_points == 32.0
+    assert decision.optimal_lineup == ["qb", "wr"]
+    assert decision.lost_to_lineup is True
+    assert decision.swaps == [[1, "wr", "rb", 4.0]]
+    assert unsynced.home_max_potential_points is None
+    assert unsynced.away_max_potential_points is None
+
+
+async def test_sync_read_during_refresh_not_cached_past_sync(client):
+    """A GET served while sync rewrites the snapshots is cached under the
+    old data version, so it is not replayed once the sync finishes."""
+    from app.services.power_rankings import refresh_power_rankings
+
+    mid_sync = []
+
+    async def refresh_with_read(db, year, **kwargs):
+        mid_sync.append(await client.get(f"/api/power-rankings/{year}/history"))
+        await refresh_power_rankings(db, year, **kwargs)
+
+    mock = _make_mock_sleeper_client()
+    with patch("app.services.sync_service.sleeper_client", mock), \
+            patch("app.services.sync_service.refresh_power_rankings", refresh_with_read):
+        response = await client.post("/api/sync/league")
+    assert response.status_code == 200
+    assert mid_sync[0].status_code == 200
+
+    after = await client.get("/api/power-rankings/2024/history")
+    assert after.headers["x-cache"] == "MISS"
+    assert after.headers["etag"] != mid_sync[0].headers["etag"]
+
+
+async def test_recompute_lineups_use_fantasy_positions(client, db_session):
+    """Players can fill a slot through any of their fantasy_positions, and
+    a tied game never counts as lost to the lineup."""
+    league = await create_league(db_session, roster_positions=["WR", "BN"])
+    season = await create_season(db_session, league, year=2024)
+    u1 = await create_user(db_session, id="u1", username="owner1")
+    u2 = await create_user(db_session, id="u2", username="owner2")
+    r1 = await create_roster(db_session, season, u1, roster_id=1)
+    r2 = await create_roster(db_session, season, u2, roster_id=2)
+    wr = await create_player(db_session, id="wr", position="WR")
+    hybrid = await create_player(
+        db_session, id="hybrid", position="RB", fantasy_positions=["RB", "WR"],
+    )
+
+    decisions = []
+    for week, opponent_points, result in [(1, 20.0, "L"), (2, 10.0, "T")]:
+        matchup = await create_matchup(
+            db_session, season, r1, r2, week=week, matchup_id=1,
+            home_points=10.0, away_points=opponent_points,
+            winner_roster_id=r2.id if result == "L" else None,
+        )
+        await create_matchup_player_point(db_session, matchup, r1, wr, points=10.0)
+        await create_matchup_player_point(
+            db_session, matchup, r1, hybrid, points=30.0, is_starter=False,
+        )
+        decision = LineupDecision(
+            matchup_id=matchup.id, roster_id=r1.id, season_id=season.id, week=week,
+            actual_points=10.0, optimal_points=10.0, opponent_points=opponent_points,
+            result=result, lost_to_lineup=False,
+            actual_lineup=["wr"], optimal_lineup=["wr"],
+            swaps=[], player_points={"wr": 10.0},
+        )
+        db_session.add(decision)
+        decisions.append(decision)
+    await db_session.commit()
+
+    response = await client.post("/api/sync/max-potential")
+    assert _ndjson(response)[0]["lineups"] == 2
+
+    lost, tied = decisions
+    for decision in decisions:
+        await db_session.refresh(decision)
+        assert decision.optimal_lineup == ["hybrid"]
+        assert decision.optimal_points == 30.0
+        assert decision.swaps == [[0, "hybrid", "wr", 20.0]]
+    assert lost.lost_to_lineup is True
+    assert tied.result == "T"
+    assert tied.lost_to_lineup is False
@@ -1,3 +1,11 @@
+from app.services.data_version import bump_version
+from app.services.pick_values import load_pick_value_curve
+from app.services.player_weeks import (
+    PlayerWeekStore,
+    load_player_week_store,
+    load_scoped_player_week_store,
+)
+from app.services.trade_grading import TradeGradingService
 from tests.conftest import (
     create_league, create_season, create_user, create_roster,
     create_player, create_transaction, create_matchup,
@@ -241,6 +249,9 @@ async def test_trade_grades_with_draft_picks(client, db_session):
     assert pick["season"] == 2025
     assert pick["round"] == 1
 
+    single = (await client.get("/api/trade-grades/trade_picks")).json()
+    assert single == trade
+
 
 async def test_trade_grades_pick_resolved(client, db_session):
     """Traded pick that was used in a draft should show the actual player."""
@@ -310,6 +321,10 @@ async def test_trade_grades_pick_resolved(client, db_session):
     assert pick_detail["status"] == "actual"
     assert pick_detail["drafted_player"] == "Drafted Rookie"
 
+    # The scoped single-trade path grades it the same way
+    single = (await client.get("/api/trade-grades/trade_res")).json()
+    assert single == trade
+
 
 async def test_trade_grades_season_filter(client, db_session):
     """Season filter should only return trades from that year."""
@@ -422,6 +437,29 @@ async def test_trade_grades_single_trade(client, db_session):
     assert len(data["sides"]) == 2
 
 
+async def test_scoped_player_week_store_loads_only_trade_players(db_session):
+    """On a cold cache the single-trade store holds only the trade's players
+    on its owners' rosters, but still reports the league's latest week."""
+    season, r1, r2, pa, pb, txn = await _setup_basic_trade(db_session)
+    other_user = await create_user(db_session, id="user3")
+    r3 = await create_roster(db_session, season, other_user, roster_id=3)
+    other = await create_player(db_session, id="px", full_name="Player X")
+    await _add_player_points(db_session, season, r2, pa, 6, 15.0)
+    await _add_player_points(db_session, season, r1, other, 7, 12.0)
+    await _add_player_points(db_session, season, r3, pb, 8, 9.0)
+    await db_session.flush()
+    bump_version()
+
+    store = await load_scoped_player_week_store(db_session, {"pa", "pb"}, {r1.id, r2.id})
+    assert len(store) == 1
+    assert store.value_after("pa", "user2", 2024, 5) == (15.0 * 1.5, 1, 0)
+    assert store.latest == (2024, 8)
+
+    full = await load_player_week_store(db_session)
+    assert len(full) == 3
+    assert await load_scoped_player_week_store(db_session, {"pa"}, {r1.id}) is full
+
+
 async def test_trade_grades_single_trade_not_found(client):
     """GET /trade-grades/{trade_id} should 404 for missing trade."""
     response = await client.get("/api/trade-grades/nonexistent")
@@ -527,6 +565,9 @@ async def test_trade_grades_replacement_factor(client, db_session):
     # adjusted_points should be half of weighted_points
     assert pa_detail["adjusted_points"] == pa_detail["weighted_points"] * 0.5
 
+    single = (await client.get("/api/trade-grades/trade_repl")).json()
+    assert single == trade
+
 
 async def test_trade_grades_owner_filter(client, db_session):
     """Owner filter should only return trades involving that owner."""
@@ -585,3 +626,257 @@ async def test_trade_grades_excludes_non_trades(client, db_session):
     response = await client.get("/api/trade-grades")
     assert response.status_code == 200
     assert response.json()["trades"] == []
+
+
+def test_player_week_store_value_after():
+    """Prefix sums return only weeks after the cutoff on the owner's rosters."""
+    store = PlayerWeekStore([
+        ("p1", 1, "u1", 2023, 16, 10.0, True),   # before the trade
+        ("p1", 1, "u1", 2024, 2, 20.0, True),
+        ("p1", 1, "u1", 2024, 3, 5.0, False),    # bench
+        ("p1", 2, "u2", 2024, 4, 30.0, True),
+        ("p1", 3, None, 2025, 1, 8.0, True),     # roster with no owner
+    ])
+
+    assert store.value_after("p1", "u1", 2024, 1) == (20.0 * 1.5 + 5.0 * 0.1, 1, 1)
+    assert store.value_after("p1", "u1", 2023, 15) == (10.0 * 1.5 + 20.0 * 1.5 + 5.0 * 0.1, 2, 1)
+    assert store.value_since("p1", "u1", 2024) == (20.0 * 1.5 + 5.0 * 0.1, 1, 1)
+    assert store.value_after("p1", "u2", 2024, 4) == (0.0, 0, 0)
+    assert store.value_after("p2", "u1", 2020, 1) == (0.0, 0, 0)
+    assert store.owner_summary("p1", "u2") == (1, 1, 45.0, 202404)
+    assert store.latest == (2025, 1)
+    assert len(store) == 5
+
+
+async def test_position_starter_points_aggregated_by_position(db_session):
+    """Starter points are summed per roster, week and position; bench is ignored."""
+    season, roster1, _, player_a, player_b, _ = await _setup_basic_trade(db_session)
+    wr2 = await create_player(db_session, id="pc", full_name="Player C", position="WR")
+    matchup = await _add_player_points(db_session, season, roster1, player_a, 1, 10.0)
+    await create_matchup_player_point(db_session, matchup, roster1, wr2, points=7.0)
+    await create_matchup_player_point(
+        db_session, matchup, roster1, player_b, points=12.0, is_starter=False
+    )
+    await db_session.flush()
+
+    index = await TradeGradingService(db_session)._fetch_position_starter_points()
+
+    assert index == {(roster1.id, 2024, 1, "WR"): 17.0}
+
+
+async def test_trade_grades_refresh_regrades_only_changed_trades(client, db_session):
+    """Stored grades are regraded only when a traded player's points change
+    for an owner in the trade; other new weeks only move weeks_of_data."""
+    season, roster1, roster2, player_a, player_b, _ = await _setup_basic_trade(db_session)
+    await _add_player_points(db_session, season, roster2, player_a, 6, 20.0)
+    await _add_player_points(db_session, season, roster1, player_b, 6, 10.0)
+    service = TradeGradingService(db_session)
+
+    assert (await service.refresh_grades())["graded"] == ["trade_001"]
+    result = await service.refresh_grades()
+    assert result["graded"] == []
+    assert result["unchanged"] == 1
+
+    await _add_player_points(db_session, season, roster2, player_a, 7, 20.0)
+    bump_version()
+    assert (await service.refresh_grades())["graded"] == ["trade_001"]
+
+    # Points on a roster outside the trade don't change the grade
+    user3 = await create_user(db_session, id="user3", username="owner3")
+    roster3 = await create_roster(db_session, season, user3, roster_id=3)
+    await _add_player_points(db_session, season, roster3, player_a, 8, 30.0)
+    bump_version()
+    assert (await service.refresh_grades())["graded"] == []
+
+    listed = (await client.get("/api/trade-grades")).json()["trades"]
+    assert len(listed) == 1
+    assert listed[0]["weeks_of_data"] == 3
+    single = (await client.get("/api/trade-grades/trade_001")).json()
+    assert listed[0] == single
+
+
+async def _setup_proposal(db):
+    """Current rosters: roster 1 has WR pa (30 weighted/wk) and WR backup
+    (15/wk); roster 2 has RB pb (15/wk)."""
+    league = await create_league(db)
+    season = await create_season(db, league, year=2024)
+    user1 = await create_user(db, id="user1", username="owner1", display_name="Owner One")
+    user2 = await create_user(db, id="user2", username="owner2", display_name="Owner Two")
+    r1 = await create_roster(db, season, user1, roster_id=1, players=["pa", "wr2"])
+    r2 = await create_roster(db, season, user2, roster_id=2, players=["pb"])
+    pa = await create_player(db, id="pa", full_name="Player A", position="WR")
+    wr2 = await create_player(db, id="wr2", full_name="Backup WR", position="WR")
+    pb = await create_player(db, id="pb", full_name="Player B", position="RB")
+    for wk in range(1, 5):
+        await _add_player_points(db, season, r1, pa, wk, 20.0)
+        await _add_player_points(db, season, r1, wr2, wk + 4, 10.0)
+        await _add_player_points(db, season, r2, pb, wk, 10.0)
+    await db.flush()
+
+
+async def test_trade_evaluate(client, db_session):
+    """Proposed trades are projected from recent production and replacement."""
+    await _setup_proposal(db_session)
+
+    response = await client.post("/api/trade-grades/evaluate", json={"sides": [
+        {"roster_id": 1, "players": ["pb"], "picks": [{"season": 2025, "round": 1}]},
+        {"roster_id": 2, "players": ["pa"]},
+    ]})
+    assert response.status_code == 200
+    data = response.json()
+    side_r2, side_r1 = data["sides"]
+
+    pa_detail = side_r2["assets_received"]["players"][0]
+    assert pa_detail["weekly_value"] == 30.0
+    # Roster 1's best remaining WR makes 15 of pa's 30 -> 1 - 0.5 * 0.5
+    assert pa_detail["replacement_factor"] == 0.75
+    assert side_r2["total_value"] == 30.0 * 17 * 0.75
+    # No other RB on roster 2, and no draft history for a pick baseline
+    assert side_r1["total_value"] == 15.0 * 17
+    assert side_r1["assets_received"]["draft_picks"][0]["value"] == 0.0
+
+    assert side_r2["value_share"] == 0.6
+    assert side_r2["grade"] == "A-"
+    assert side_r1["grade"] == "C"
+
+
+async def test_trade_evaluate_without_window_functions(client, db_session, monkeypatch):
+    """The ordered fallback projects the same weekly values."""
+    from app.services import trade_grading
+
+    monkeypatch.setattr(trade_grading, "supports_window_functions", lambda db: False)
+    await _setup_proposal(db_session)
+
+    response = await client.post("/api/trade-grades/evaluate", json={"sides": [
+        {"roster_id": 1, "players": ["pb"]},
+        {"roster_id": 2, "players": ["pa"]},
+    ]})
+    assert response.json()["sides"][0]["value_share"] == 0.6
+
+
+async def test_trade_evaluate_invalid(client, db_session):
+    """Unknown rosters are rejected; a trade needs two sides."""
+    await _setup_proposal(db_session)
+
+    response = await client.post("/api/trade-grades/evaluate", json={"sides": [
+        {"roster_id": 1, "players": ["pb"]},
+        {"roster_id": 9, "players": ["pa"]},
+    ]})
+    assert response.status_code == 400
+
+    response = await client.post("/api/trade-grades/evaluate", json={"sides": [
+        {"roster_id": 1, "players": ["pb"]},
+    ]})
+    assert response.status_code == 422
+
+
+async def _setup_projected_pick_trade(db_session):
+    """A 2024 trade of player A for roster 2's unused 2025 first, with a
+    completed 2023 rookie draft to fit the pick value curve from."""
+    league = await create_league(db_session)
+    past = await create_season(db_session, league, year=2023)
+    season = await create_season(db_session, league, year=2024)
+    upcoming = await create_season(db_session, league, year=2025)
+    user1 = await create_user(db_session, id="user1", username="owner1", display_name="Owner One")
+    user2 = await create_user(db_session, id="user2", username="owner2", display_name="Owner Two")
+    past_r1 = await create_roster(db_session, past, user1, roster_id=1)
+    past_r2 = await create_roster(db_session, past, user2, roster_id=2)
+    await create_roster(db_session, season, user1, roster_id=1)
+    r2 = await create_roster(db_session, season, user2, roster_id=2)
+
+    # 2023 rookie draft: the first pick produced far more than the second
+    rookie_draft = await create_draft(
+        db_session, past, id="draft_2023", rounds=1, draft_order={"1": 1, "2": 2},
+    )
+    for slot, (roster, pts) in enumerate([(past_r1, 20.0), (past_r2, 4.0)], start=1):
+        rookie = await create_player(db_session, id=f"rk{slot}", full_name=f"Rookie {slot}")
+        await create_draft_pick(
+            db_session, rookie_draft, pick_no=slot, round=1, pick_in_round=slot,
+            roster_id=roster.roster_id, player_id=rookie.id,
+        )
+        await _add_player_points(db_session, past, roster, rookie, 1, pts)
+
+    # 2025 draft order is set: roster 2 picks first
+    await create_draft(
+        db_session, upcoming, id="draft_2025", status="pre_draft", rounds=1,
+        draft_order={"1": 2, "2": 1},
+    )
+
+    player_a = await create_player(db_session, id="pa", full_name="Player A", position="WR")
+    await create_transaction(
+        db_session, season,
+        id="trade_curve",
+        type="trade",
+        status="complete",
+        week=5,
+        roster_ids=[1, 2],
+        adds={"pa": 2},
+        drops={"pa": 1},
+        picks=[{
+            "season": 2025, "round": 1, "roster_id": 2,
+            "previous_owner_id": 2, "owner_id": 1,
+        }],
+        status_updated=1700000020000,
+    )
+    for wk in [6, 7, 8]:
+        await _add_player_points(db_session, season, r2, player_a, wk, 15.0)
+    await db_session.flush()
+
+
+async def test_trade_grades_projected_pick_uses_value_curve(client, db_session):
+    """An unused pick with a known draft slot is valued at that slot on the
+    rookie pick value curve."""
+    await _setup_projected_pick_trade(db_session)
+
+    trade = (await client.get("/api/trade-grades")).json()["trades"][0]
+    side_r1 = next(s for s in trade["sides"] if s["roster_id"] == 1)
+    pick = side_r1["assets_received"]["draft_picks"][0]
+    assert pick["status"] == "projected"
+
+    curve = await load_pick_value_curve(db_session)
+    slot_ppw = curve.pick_value("rookie", 1)
+    assert slot_ppw > curve.value("rookie", 1)
+    weeks = max(trade["weeks_of_data"], 1)
+    assert pick["value"] == round(slot_ppw * weeks * 0.7, 2)
+
+    single = (await client.get("/api/trade-grades/trade_curve")).json()
+    assert single == trade
+
+
+async def test_single_trade_with_unused_pick_skips_full_store(client, db_session):
+    """Valuing an unused pick fits the pick curve without loading the
+    league-wide player-week store."""
+    from unittest.mock import patch
+
+    from app.services import player_weeks
+
+    await _setup_projected_pick_trade(db_session)
+
+    with patch.object(
+        player_weeks._store_cache, "set_many",
+        side_effect=AssertionError("full player-week store loaded"),
+    ):
+        response = await client.get("/api/trade-grades/trade_curve")
+    assert response.status_code == 200
+    side_r1 = next(s for s in response.json()["sides"] if s["roster_id"] == 1)
+    pick = side_r1["assets_received"]["draft_picks"][0]
+    assert pick["status"] == "projected"
+    assert pick["value"] > 0
+
+    bump_version()
+    assert (await client.get("/api/trade-grades")).json()["trades"][0] == response.json()
+
+
+async def test_refresh_grades_waits_for_a_read_refresh(client, db_session):
+    """A direct refresh takes the lock reads refresh under, so the two
+    never upsert the same grades at once."""
+    import asyncio
+
+    from app.services import trade_grading
+
+    service = TradeGradingService(db_session)
+    async with trade_grading._refresh_lock:
+        task = asyncio.create_task(service.refresh_grades())
+        await asyncio.sleep(0.01)
+        assert not task.done()
+    await task
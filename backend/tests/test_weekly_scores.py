@@ -0,0 +1,73 @@
+from app.services.data_version import bump_version
+from app.services.weekly_scores import load_weekly_scores
+from tests.conftest import (
+    create_league, create_season, create_user, create_roster, create_matchup,
+)
+
+
+async def _season_with_four_teams(db_session):
+    league = await create_league(db_session)
+    season = await create_season(db_session, league)
+    rosters = []
+    for i in range(1, 5):
+        user = await create_user(db_session, id=f"u{i}")
+        rosters.append(await create_roster(db_session, season, user, roster_id=i))
+    return season, rosters
+
+
+async def test_median_records(db_session):
+    season, (r1, r2, r3, r4) = await _season_with_four_teams(db_session)
+    # Week 1: 130, 110, 90, 90 -> median 100
+    await create_matchup(db_session, season, r1, r2, week=1, matchup_id=1,
+                         home_points=130, away_points=110, winner_roster_id=r1.id)
+    await create_matchup(db_session, season, r3, r4, week=1, matchup_id=2,
+                         home_points=90, away_points=90, winner_roster_id=None)
+    # Week 2 is still being played: only one game has a result
+    await create_matchup(db_session, season, r1, r2, week=2, matchup_id=1,
+                         home_points=80, away_points=120, winner_roster_id=r2.id)
+    await create_matchup(db_session, season, r3, r4, week=2, matchup_id=2,
+                         home_points=100, away_points=60, winner_roster_id=None)
+    # Playoff games are indexed but not part of regular-season records
+    await create_matchup(db_session, season, r1, r3, week=15, matchup_id=1,
+                         match_type="playoff", home_points=50, away_points=150,
+                         winner_roster_id=r3.id)
+
+    scores = (await load_weekly_scores(db_session, [season.id]))[season.id]
+    assert scores.weeks == [1, 2, 15]
+    assert scores.week_slice(1).median == 100
+
+    median = scores.median_records()
+    assert median[r1.id] == {"wins": 1, "losses": 1, "ties": 0}
+    assert median[r3.id] == {"wins": 1, "losses": 1, "ties": 0}
+    assert median[r4.id] == {"wins": 0, "losses": 2, "ties": 0}
+
+    # Only decided games: the week 1 tie counts, the open week 2 game does not
+    played = scores.median_records(played_only=True)
+    assert scores.week_slice(1, played_only=True).median == 100
+    assert scores.week_slice(2, played_only=True).roster_ids == (r1.id, r2.id)
+    assert played[r1.id] == {"wins": 1, "losses": 1, "ties": 0}
+    assert played[r2.id] == {"wins": 2, "losses": 0, "ties": 0}
+    assert played[r4.id] == {"wins": 0, "losses": 1, "ties": 0}
+
+    assert scores.median_records("playoff") == {
+        r1.id: {"wins": 0, "losses": 1, "ties": 0},
+        r3.id: {"wins": 1, "losses": 0, "ties": 0},
+    }
+    assert scores.median_records(None)[r3.id]["wins"] == 2
+
+
+async def test_weekly_scores_are_cached_per_version(db_session):
+    season, (r1, r2, r3, r4) = await _season_with_four_teams(db_session)
+    await create_matchup(db_session, season, r1, r2, week=1, matchup_id=1,
+                         home_points=130, away_points=110, winner_roster_id=r1.id)
+
+    first = await load_weekly_scores(db_session, [season.id])
+    assert (await load_weekly_scores(db_session, [season.id]))[season.id] is first[season.id]
+    assert (await load_weekly_scores(db_session))[season.id] is first[season.id]
+
+    await create_matchup(db_session, season, r3, r4, week=1, matchup_id=2,
+                         home_points=90, away_points=70, winner_roster_id=r3.id)
+    bump_version()
+    scores = (await load_weekly_scores(db_session))[season.id]
+    assert scores is not first[season.id]
+    assert scores.week_slice(1).median == 100